@@ -11,6 +11,7 @@ import numpy as np
 import math
 
 import logging
+from tespy.tools import logger
 
 import CoolProp.CoolProp as CP
 
@@ -19,9 +20,10 @@ from tespy.tools.helpers import (
     v_mix_ph, h_mix_pT, h_mix_ps, s_mix_pT, s_mix_ph, T_mix_ph, visc_mix_ph,
     dT_mix_dph, dT_mix_pdh, dT_mix_ph_dfluid, h_mix_pQ, dh_mix_dpQ,
     h_ps, h_pT ,s_ph, s_pT,
-    molar_mass_flow, lamb,
+    molar_mass_flow, darcy_dp, ddarcy_dp_dm, hw_dp, td_log,
     molar_masses, err,
-    dc_cp, dc_cc, dc_cm, dc_gcp, memorise, single_fluid
+    dc_cp, dc_cc, dc_cm, dc_gcp, memorise, single_fluid, schema,
+    fluid_registry, register_fluids
 )
 from tespy.components import characteristics as cmp_char
 
@@ -93,10 +95,8 @@ class component:
         self.interface = False
 
         # add container for components attributes
-        var = self.attr()
-
-        for key in var.keys():
-            self.__dict__.update({key: var[key]})
+        for key, dc in self.attr().items():
+            self.__dict__.update({key: dc.copy()})
 
         self.set_attr(**kwargs)
 
@@ -246,6 +246,20 @@ class component:
             logging.error(msg)
             raise KeyError(msg)
 
+    def __getstate__(self):
+        r"""
+        Returns the component's state for pickling, see
+        :func:`tespy.networks.network.__getstate__`.
+        """
+        state = self.__dict__.copy()
+        state['custom_fluids'] = fluid_registry(self.__dict__.get('fluids', []))
+        return state
+
+    def __setstate__(self, state):
+        custom = state.pop('custom_fluids', None)
+        self.__dict__.update(state)
+        register_fluids(self.__dict__.get('fluids', []), custom)
+
     def comp_init(self, nw):
         r"""
         Performs component initialization in network preprocessing.
@@ -257,15 +271,14 @@ class component:
         """
         self.vars = {}
         self.num_vars = 0
-        for var in self.attr().keys():
-            if isinstance(self.attr()[var], dc_cp):
+        for var, dc in self.attr().items():
+            if isinstance(dc, dc_cp):
                 if self.get_attr(var).is_var:
                     self.get_attr(var).var_pos = self.num_vars
                     self.num_vars += 1
                     self.vars[self.get_attr(var)] = var
 
-        msg = 'Component ' + self.label + ' has ' + str(self.num_vars) + ' custom variables.'
-        logging.debug(msg)
+        logger.debug('Component %s has %s custom variables.', self.label, self.num_vars)
 
 
         # characteristics creation
@@ -285,13 +298,13 @@ class component:
                     self.get_attr(key).x = self.get_attr(key).func.x
                     self.get_attr(key).y = self.get_attr(key).func.y
 
-                    msg = 'Generated characteristic line for attribute ' + key + ' at component ' + self.label + '.'
-                    logging.debug(msg)
+                    logger.debug('Generated characteristic line for attribute %s at component %s.', key, self.label)
 
 
         self.num_fl = len(nw.fluids)
         self.fluids = nw.fluids
 
+    @schema
     def attr(self):
         return {}
 
@@ -301,6 +314,44 @@ class component:
     def outlets(self):
         return []
 
+    def num_eq(self):
+        r"""
+        Returns the number of equations of the component.
+
+        Returns
+        -------
+        num_eq : int
+            Number of equations.
+
+        Note
+        ----
+        The components count their equations from their specification without
+        evaluating the residual values. This method is the fallback for
+        components without structural equation count.
+        """
+        return len(self.equations())
+
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Note
+        ----
+        The network places the partial derivatives of these rows in the
+        jacobian matrix template on solver initialisation and only refreshes
+        the remaining rows in every iteration, see
+        :func:`tespy.networks.network.init_jacobian`. The components list the
+        rows of their partial derivatives precalculated on component
+        initialisation, e. g. fluid and mass flow balance.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        return []
+
     def equations(self):
         return []
 
@@ -403,18 +454,36 @@ class component:
         """
         if mode == 'pre':
             # set component attributes to design-value if specified as offdesign parameter
-            switched = False
-            msg = 'Set component attributes '
+            switched = []
             for key, dc in self.attr().items():
                 if isinstance(dc, dc_cp) and key in self.offdesign:
-                    switched = True
+                    switched += [key]
                     self.get_attr(key).val = self.get_attr(key).design
 
-                    msg += key + ', '
-
-            msg = msg[:-2] + ' to design value at component ' + self.label + '.'
             if switched:
-                logging.debug(msg)
+                logger.debug('Set component attributes %s to design value at component %s.', ', '.join(switched), self.label)
+
+    def fluid_passthrough(self):
+        r"""
+        Returns the fluid passthrough map of the component.
+
+        Returns
+        -------
+        passthrough : dict
+            Map of the ports the fluid vector is passed on to in fluid
+            initialisation. The key 'target' maps inlets to a list of outlets,
+            the key 'source' maps outlets to a list of inlets.
+
+        Note
+        ----
+        By default, components with one inlet and one outlet pass the fluid
+        vector on in both directions, all other components do not pass it on.
+        """
+        if len(self.inlets()) == 1 and len(self.outlets()) == 1:
+            return {'target': {self.inlets()[0]: self.outlets()},
+                    'source': {self.outlets()[0]: self.inlets()}}
+        else:
+            return {'target': {}, 'source': {}}
 
     def initialise_fluids(self, nw):
         return
@@ -422,6 +491,19 @@ class component:
     def convergence_check(self, nw):
         return
 
+    def apply_increment(self):
+        r"""
+        Updates internal variables of the component after the network's
+        newton step.
+
+        Note
+        ----
+        The network calls this method after adding the increment to its
+        variables. Components without internal variables do not need to do
+        anything.
+        """
+        return
+
 # %%
 
     def fluid_func(self):
@@ -670,6 +752,41 @@ class component:
             return (self.zeta2.val - (i[1] - o[1]) * math.pi ** 2 /
                     (8 * abs(i[0]) * i[0] * (v_mix_ph(i) + v_mix_ph(o)) / 2))
 
+    def pressure_ratio_deriv(self, pr, inconn=0, outconn=0):
+        r"""
+        Calculates partial derivatives for a specified pressure ratio.
+
+        Parameters
+        ----------
+        pr : tespy.tools.helpers.dc_cp
+            Pressure ratio of the component.
+
+        inconn : int
+            Index of the inlet connection, default: 0.
+
+        outconn : int
+            Index of the outlet connection, default: 0.
+
+        Returns
+        -------
+        deriv : list
+            Matrix of partial derivatives.
+
+        Note
+        ----
+        The partial derivatives are constant as long as the pressure ratio is not a
+        variable of the system. Components calculate them in the component
+        initialisation therefore.
+
+        .. math::
+
+            0 = pr \cdot p_{in} - p_{out}
+        """
+        deriv = np.zeros((1, self.num_i + self.num_o + self.num_vars, self.num_fl + 3))
+        deriv[0, inconn, 1] = pr.val
+        deriv[0, self.num_i + outconn, 1] = -1
+        return deriv.tolist()
+
 # %%
 
 
@@ -801,6 +918,7 @@ class turbomachine(component):
     def component(self):
         return 'turbomachine'
 
+    @schema
     def attr(self):
         return {'P': dc_cp(), 'eta_s': dc_cp(), 'pr': dc_cp(),
                 'eta_s_char': dc_cc(), 'Sirr': dc_cp()}
@@ -817,6 +935,12 @@ class turbomachine(component):
 
         self.fl_deriv = self.fluid_deriv()
         self.m_deriv = self.mass_flow_deriv()
+        self.pr_deriv = self.pressure_ratio_deriv(self.pr)
+
+    def num_eq(self):
+        # the isentropic efficiency is counted by the child classes, as the
+        # generic turbomachine does not provide an equation for it
+        return self.num_fl + 1 + [self.P.is_set, self.pr.is_set].count(True)
 
     def equations(self):
         r"""
@@ -871,6 +995,21 @@ class turbomachine(component):
         """
         return []
 
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        rows = list(range(len(self.fl_deriv) + len(self.m_deriv)))
+        if self.pr.is_set and not self.pr.is_var:
+            rows += [len(rows) + self.P.is_set]
+        return rows
+
     def derivatives(self):
         r"""
         Calculates matrix of partial derivatives for given equations.
@@ -902,10 +1041,7 @@ class turbomachine(component):
         ######################################################################
         # derivatives for specified pressure ratio
         if self.pr.is_set:
-            pr_deriv = np.zeros((1, 2 + self.num_vars, self.num_fl + 3))
-            pr_deriv[0, 0, 1] = self.pr.val
-            pr_deriv[0, 1, 1] = -1
-            mat_deriv += pr_deriv.tolist()
+            mat_deriv += self.pr_deriv
 
         ######################################################################
         # derivatives for specified isentropic efficiency
@@ -1162,11 +1298,15 @@ class pump(turbomachine):
     def component(self):
         return 'pump'
 
+    @schema
     def attr(self):
         return {'P': dc_cp(), 'eta_s': dc_cp(), 'pr': dc_cp(), 'Sirr': dc_cp(),
                 'eta_s_char': dc_cc(method='GENERIC'),
                 'flow_char': dc_cc()}
 
+    def num_eq(self):
+        return turbomachine.num_eq(self) + [self.eta_s.is_set, self.eta_s_char.is_set, self.flow_char.is_set].count(True)
+
     def additional_equations(self):
         r"""
         Calculates vector vec_res with results of additional equations for pump.
@@ -1569,6 +1709,7 @@ class compressor(turbomachine):
     def component(self):
         return 'compressor'
 
+    @schema
     def attr(self):
         return {'P': dc_cp(), 'eta_s': dc_cp(), 'pr': dc_cp(),
                 'igva': dc_cp(min_val=-45, max_val=45, d=1e-2, val=0),
@@ -1582,6 +1723,7 @@ class compressor(turbomachine):
 
         self.fl_deriv = self.fluid_deriv()
         self.m_deriv = self.mass_flow_deriv()
+        self.pr_deriv = self.pressure_ratio_deriv(self.pr)
 
         generate_char = False
         if self.char_map.func is None:
@@ -1601,6 +1743,10 @@ class compressor(turbomachine):
             self.char_map.z1 = self.char_map.func.z1
             self.char_map.z2 = self.char_map.func.z2
 
+    def num_eq(self):
+        # the characteristic map applies two equations
+        return turbomachine.num_eq(self) + 2 * int(self.char_map.is_set) + [self.eta_s.is_set, self.eta_s_char.is_set].count(True)
+
     def additional_equations(self):
         r"""
         Calculates vector vec_res with results of additional equations for compressor.
@@ -2055,12 +2201,16 @@ class turbine(turbomachine):
     def component(self):
         return 'turbine'
 
+    @schema
     def attr(self):
         return {'P': dc_cp(), 'eta_s': dc_cp(), 'pr': dc_cp(),
                 'Sirr': dc_cp(),
                 'eta_s_char': dc_cc(method='GENERIC', param='m'),
                 'cone': dc_cc(method='default')}
 
+    def num_eq(self):
+        return turbomachine.num_eq(self) + [self.eta_s.is_set, self.eta_s_char.is_set, self.cone.is_set].count(True)
+
     def additional_equations(self):
         r"""
         Calculates vector vec_res with results of additional equations for compressor.
@@ -2467,6 +2617,7 @@ class node(component):
     def component(self):
         return 'node'
 
+    @schema
     def attr(self):
         return {'num_in': dc_cp(printout=False),
                 'num_out': dc_cp(printout=False)}
@@ -2489,9 +2640,18 @@ class node(component):
 
         component.comp_init(self, nw)
 
-        self.m_deriv = self.mass_flow_deriv()
+        # direction of the inlets and outlets
+        self.sign = np.append(np.ones(self.num_i), -np.ones(self.num_o))
+
+        self.m_deriv = np.asarray(self.mass_flow_deriv())
         self.p_deriv = self.pressure_deriv()
 
+    def num_eq(self):
+        # number of outgoing mass flows
+        m = np.array([c.m.val_SI for c in self.inl + self.outl])
+        num_o = np.count_nonzero(np.where(self.sign > 0, m < 0, m >= 0))
+        return self.num_i + self.num_o + (self.num_fl + 1) * num_o
+
     def equations(self):
         r"""
         Calculates vector vec_res with results of equations for this component.
@@ -2509,11 +2669,8 @@ class node(component):
 
         ######################################################################
         # equations for pressure
-        inl = []
-        if self.num_i > 1:
-            inl = self.inl[1:]
-        for c in inl + self.outl:
-            vec_res += [self.inl[0].p.val_SI - c.p.val_SI]
+        p = np.array([c.p.val_SI for c in self.inl + self.outl])
+        vec_res += (p[0] - p[1:]).tolist()
 
         ######################################################################
         # additional eqations
@@ -2521,6 +2678,18 @@ class node(component):
 
         return vec_res
 
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        return list(range(len(self.m_deriv) + len(self.p_deriv)))
+
     def derivatives(self):
         r"""
         Calculates matrix of partial derivatives for given equations.
@@ -2530,21 +2699,27 @@ class node(component):
         mat_deriv : ndarray
             Matrix of partial derivatives.
         """
-        mat_deriv = []
-
-        ######################################################################
-        # derivative for mass flow balance equation
-        mat_deriv += self.m_deriv
-
         ######################################################################
-        # derivatives for pressure equations
-        mat_deriv += self.p_deriv
+        # derivatives for mass flow balance equation and pressure equations
+        # are constant, additional derivatives
+        return np.concatenate([self.m_deriv, self.p_deriv, self.additional_derivatives()])
 
-        ######################################################################
-        # additional derivatives
-        mat_deriv += self.additional_derivatives()
+    def conn_state(self):
+        r"""
+        Returns mass flow, enthalpy and fluid composition of the inlets and outlets.
 
-        return np.asarray(mat_deriv)
+        Returns
+        -------
+        m, h, x : ndarray
+            Mass flow and enthalpy of the inlets and outlets (shape: number of
+            connections) and fluid composition (shape: number of connections,
+            number of fluids).
+        """
+        conns = self.inl + self.outl
+        m = np.array([c.m.val_SI for c in conns])
+        h = np.array([c.h.val_SI for c in conns])
+        x = np.array([[c.fluid.val[f] for f in self.fluids] for c in conns])
+        return m, h, x
 
     def additional_equations(self):
         r"""
@@ -2566,41 +2741,26 @@ class node(component):
         -------
         vec_res : list
             Vector of residual values.
+
+        Note
+        ----
+        The mass flow entering the node is positive for incoming and negative for
+        outgoing connections: :math:`\dot{m}_{node} = \sigma \cdot \dot{m}`, with
+        :math:`\sigma = 1` for inlets and :math:`\sigma = -1` for outlets.
         """
         vec_res = []
 
         ######################################################################
         # check for incoming/outgoing mass flows in inlets and outlets
+        m, h, x = self.conn_state()
 
-        loc = 0
-        # total incoming enthalpy
-        h = 0
+        # mass flow entering the node
+        self.m_node = self.sign * m
+        inc = np.where(self.sign > 0, m >= 0, m < 0)
+        self.inc = np.flatnonzero(inc)
+        self.outg = np.flatnonzero(~inc)
         # total incoming mass flow (constant within every iteration)
-        self.m_inc = 0
-
-        self.inc = []
-        self.outg = []
-        for c in self.inl:
-            # incoming
-            if c.m.val_SI >= 0:
-                self.inc += [[c, loc]]
-                self.m_inc += c.m.val_SI
-                h += c.m.val_SI * c.h.val_SI
-            # outgoing
-            else:
-                self.outg += [[c, loc]]
-            loc += 1
-
-        for c in self.outl:
-            # inconming
-            if c.m.val_SI < 0:
-                self.inc += [[c, loc]]
-                self.m_inc -= c.m.val_SI
-                h -= c.m.val_SI * c.h.val_SI
-            # outgoing
-            else:
-                self.outg += [[c, loc]]
-            loc += 1
+        self.m_inc = self.m_node[self.inc].sum()
 
         ######################################################################
         # equations for fluid composition
@@ -2608,8 +2768,8 @@ class node(component):
 
         ######################################################################
         # equations for energy balance
-        for o in self.outg:
-            vec_res += [h - o[0].h.val_SI * self.m_inc]
+        h_inc = self.m_node[self.inc].dot(h[self.inc])
+        vec_res += (h_inc - h[self.outg] * self.m_inc).tolist()
 
         return vec_res
 
@@ -2619,28 +2779,22 @@ class node(component):
 
         Returns
         -------
-        mat_deriv : list
+        mat_deriv : ndarray
             Matrix of partial derivatives.
         """
-        mat_deriv = []
-
-        ######################################################################
-        # derivatives for fluid balance equations
-        mat_deriv += self.fluid_deriv()
+        m, h, x = self.conn_state()
 
         ######################################################################
         # derivatives for energy balance equations
-        deriv = np.zeros((len(self.outg), self.num_i + self.num_o, self.num_fl + 3))
-        k = 0
-        for o in self.outg:
-            deriv[k, o[1], 2] = -self.m_inc
-            for i in self.inc:
-                deriv[k, i[1], 0] = i[0].h.val_SI - o[0].h.val_SI
-                deriv[k, i[1], 2] = abs(i[0].m.val_SI)
-            k += 1
-        mat_deriv += deriv.tolist()
+        num_o = len(self.outg)
+        deriv = np.zeros((num_o, self.num_i + self.num_o, self.num_fl + 3))
+        deriv[:, self.inc, 0] = self.sign[self.inc] * (h[self.inc] - h[self.outg][:, np.newaxis])
+        deriv[:, self.inc, 2] = self.m_node[self.inc]
+        deriv[np.arange(num_o), self.outg, 2] = -self.m_inc
 
-        return mat_deriv
+        ######################################################################
+        # derivatives for fluid balance equations
+        return np.concatenate([self.fluid_deriv(), deriv])
 
     def fluid_func(self):
         r"""
@@ -2658,15 +2812,9 @@ class node(component):
                 \forall o \in \text{outgoing mass flows}\\
                 \text{i: incoming mass flows}
         """
-        vec_res = []
-
-        for fluid in self.fluids:
-            m = 0
-            for i in self.inc:
-                m += abs(i[0].m.val_SI) * i[0].fluid.val[fluid]
-            for o in self.outg:
-                vec_res += [m - o[0].fluid.val[fluid] * self.m_inc]
-        return vec_res
+        x = np.array([[c.fluid.val[f] for f in self.fluids] for c in self.inl + self.outl])
+        x_inc = self.m_node[self.inc].dot(x[self.inc])
+        return (x_inc[:, np.newaxis] - x[self.outg].transpose() * self.m_inc).flatten().tolist()
 
     def fluid_deriv(self):
         r"""
@@ -2674,23 +2822,25 @@ class node(component):
 
         Returns
         -------
-        deriv : list
+        deriv : ndarray
             Matrix with partial derivatives for the fluid equations.
         """
+        x = np.array([[c.fluid.val[f] for f in self.fluids] for c in self.inl + self.outl])
         num_o = len(self.outg)
-        deriv = np.zeros((self.num_fl * num_o, self.num_i + self.num_o, 3 + self.num_fl))
-        j = 0
-        k = 0
-        for fluid in self.fluids:
-            for o in self.outg:
-                deriv[k, o[1], j + 3] = -self.m_inc
-                for i in self.inc:
-                    deriv[k, i[1], 0] = -i[0].fluid.val[fluid]
-                    deriv[k, i[1], j + 3] = -abs(i[0].m.val_SI)
-                k += 1
-            j += 1
+        deriv = np.zeros((self.num_fl, num_o, self.num_i + self.num_o, 3 + self.num_fl))
 
-        return deriv.tolist()
+        j = np.arange(self.num_fl)[:, np.newaxis, np.newaxis]
+        k = np.arange(num_o)[np.newaxis, :, np.newaxis]
+        # mass flow of incoming connections
+        deriv[:, :, self.inc, 0] = self.sign[self.inc] * (
+                x[self.inc].transpose()[:, np.newaxis, :] -
+                x[self.outg].transpose()[:, :, np.newaxis])
+        # fluid composition of incoming connections
+        deriv[j, k, self.inc[np.newaxis, np.newaxis, :], j + 3] = self.m_node[self.inc]
+        # fluid composition of outgoing connections
+        deriv[j[:, :, 0], k[:, :, 0], self.outg[np.newaxis, :], j[:, :, 0] + 3] = -self.m_inc
+
+        return deriv.reshape(self.num_fl * num_o, self.num_i + self.num_o, 3 + self.num_fl)
 
     def pressure_deriv(self):
         r"""
@@ -2698,18 +2848,14 @@ class node(component):
 
         Returns
         -------
-        deriv : list
+        deriv : ndarray
             Matrix with partial derivatives for the fluid equations.
         """
-        deriv = np.zeros((self.num_i + self.num_o - 1, self.num_i + self.num_o, self.num_fl + 3))
-
-        inl = []
-        if self.num_i > 1:
-            inl = self.inl[1:]
-        for k in range(len(inl + self.outl)):
-            deriv[k, 0, 1] = 1
-            deriv[k, k + 1, 1] = -1
-        return deriv.tolist()
+        num = self.num_i + self.num_o
+        deriv = np.zeros((num - 1, num, self.num_fl + 3))
+        deriv[:, 0, 1] = 1
+        deriv[np.arange(num - 1), np.arange(1, num), 1] = -1
+        return deriv
 
     def initialise_fluids(self, nw):
         r"""
@@ -2880,6 +3026,7 @@ class splitter(node):
     def component(self):
         return 'splitter'
 
+    @schema
     def attr(self):
         return {'num_out': dc_cp(printout=False)}
 
@@ -2893,6 +3040,10 @@ class splitter(node):
             self.set_attr(num_out=2)
             return self.outlets()
 
+    def fluid_passthrough(self):
+        return {'target': {'in1': self.outlets()},
+                'source': {o: ['in1'] for o in self.outlets()}}
+
     def comp_init(self, nw):
 
         node.comp_init(self, nw)
@@ -2900,6 +3051,9 @@ class splitter(node):
         self.fl_deriv = self.fluid_deriv()
         self.h_deriv = self.enthalpy_deriv()
 
+    def num_eq(self):
+        return 1 + (self.num_fl + 2) * self.num_o
+
     def additional_equations(self):
         r"""
         Calculates vector vec_res with results of additional equations for this component.
@@ -2920,33 +3074,43 @@ class splitter(node):
         vec_res : list
             Vector of residual values.
         """
-        vec_res = []
+        m, h, x = self.conn_state()
 
         ######################################################################
         # equations for fluid balance
-        for o in self.outl:
-            for fluid, x in self.inl[0].fluid.val.items():
-                vec_res += [x - o.fluid.val[fluid]]
+        vec_res = (x[0] - x[1:]).flatten().tolist()
 
         ######################################################################
         # equations for energy balance
-        for o in self.outl:
-            vec_res += [self.inl[0].h.val_SI - o.h.val_SI]
+        vec_res += (h[0] - h[1:]).tolist()
 
         return vec_res
 
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        return list(range(len(self.m_deriv) + len(self.p_deriv) +
+                          len(self.fl_deriv) + len(self.h_deriv)))
+
     def additional_derivatives(self):
         r"""
         Calculates matrix of partial derivatives for given additional equations.
 
         Returns
         -------
-        mat_deriv : list
+        mat_deriv : ndarray
             Matrix of partial derivatives.
         """
         ######################################################################
         # derivatives for fluid and energy balance equations are constant
-        return self.fl_deriv + self.h_deriv
+        return np.concatenate([self.fl_deriv, self.h_deriv])
 
     def fluid_deriv(self):
         r"""
@@ -2954,19 +3118,15 @@ class splitter(node):
 
         Returns
         -------
-        deriv : list
+        deriv : ndarray
             Matrix with partial derivatives for the fluid equations.
         """
-        deriv = np.zeros((self.num_fl * self.num_o, 1 + self.num_o, 3 + self.num_fl))
-        k = 0
-        for o in self.outl:
-            i = 0
-            for fluid in self.fluids:
-                deriv[i + k * self.num_fl, 0, i + 3] = 1
-                deriv[i + k * self.num_fl, k + 1, i + 3] = -1
-                i += 1
-            k += 1
-        return deriv.tolist()
+        deriv = np.zeros((self.num_o, self.num_fl, 1 + self.num_o, 3 + self.num_fl))
+        k = np.arange(self.num_o)[:, np.newaxis]
+        j = np.arange(self.num_fl)[np.newaxis, :]
+        deriv[k, j, 0, j + 3] = 1
+        deriv[k, j, k + 1, j + 3] = -1
+        return deriv.reshape(self.num_o * self.num_fl, 1 + self.num_o, 3 + self.num_fl)
 
     def enthalpy_deriv(self):
         r"""
@@ -2974,17 +3134,13 @@ class splitter(node):
 
         Returns
         -------
-        deriv : list
+        deriv : ndarray
             Matrix of partial derivatives.
         """
         deriv = np.zeros((self.num_o, 1 + self.num_o, self.num_fl + 3))
-        k = 0
-        for o in self.outl:
-            deriv[k, 0, 2] = 1
-            deriv[k, k + 1, 2] = -1
-            k += 1
-
-        return deriv.tolist()
+        deriv[:, 0, 2] = 1
+        deriv[np.arange(self.num_o), np.arange(1, self.num_o + 1), 2] = -1
+        return deriv
 
     def initialise_fluids(self, nw):
         r"""
@@ -3080,6 +3236,7 @@ class separator(node):
     def component(self):
         return 'separator'
 
+    @schema
     def attr(self):
         return {'num_out': dc_cp(printout=False)}
 
@@ -3093,6 +3250,9 @@ class separator(node):
             self.set_attr(num_out=2)
             return self.outlets()
 
+    def num_eq(self):
+        return 1 + self.num_fl + 2 * self.num_o
+
     def additional_equations(self):
         r"""
         Calculates vector vec_res with results of additional equations for this component.
@@ -3114,21 +3274,16 @@ class separator(node):
         vec_res : list
             Vector of residual values.
         """
-        vec_res = []
+        m, h, x = self.conn_state()
 
         ######################################################################
         # equations for fluid balance
-        for fluid, x in self.inl[0].fluid.val.items():
-            res = x * self.inl[0].m.val_SI
-            for o in self.outl:
-                res -= o.fluid.val[fluid] * o.m.val_SI
-            vec_res += [res]
+        vec_res = (x[0] * m[0] - m[1:].dot(x[1:])).tolist()
 
         ######################################################################
         # equations for energy balance
-        for o in self.outl:
-            vec_res += [T_mix_ph(self.inl[0].to_flow()) -
-                        T_mix_ph(o.to_flow())]
+        T_in = T_mix_ph(self.inl[0].to_flow())
+        vec_res += [T_in - T_mix_ph(o.to_flow()) for o in self.outl]
 
         return vec_res
 
@@ -3138,32 +3293,27 @@ class separator(node):
 
         Returns
         -------
-        mat_deriv : list
+        mat_deriv : ndarray
             Matrix of partial derivatives.
         """
-        mat_deriv = []
-
-        ######################################################################
-        # derivatives for fluid balance equations
-        mat_deriv += self.fluid_deriv()
-
         ######################################################################
         # derivatives for energy balance equations
         deriv = np.zeros((self.num_o, 1 + self.num_o, self.num_fl + 3))
         i = self.inl[0].to_flow()
+        deriv[:, 0, 1] = dT_mix_dph(i)
+        deriv[:, 0, 2] = dT_mix_pdh(i)
+        deriv[:, 0, 3:] = dT_mix_ph_dfluid(i)
         k = 0
         for o in self.outl:
             o = o.to_flow()
-            deriv[k, 0, 1] = dT_mix_dph(i)
-            deriv[k, 0, 2] = dT_mix_pdh(i)
-            deriv[k, 0, 3:] = dT_mix_ph_dfluid(i)
             deriv[k, k + 1, 1] = -dT_mix_dph(o)
             deriv[k, k + 1, 2] = -dT_mix_pdh(o)
             deriv[k, k + 1, 3:] = -1 * dT_mix_ph_dfluid(o)
             k += 1
-        mat_deriv += deriv.tolist()
 
-        return mat_deriv
+        ######################################################################
+        # derivatives for fluid balance equations
+        return np.concatenate([self.fluid_deriv(), deriv])
 
     def fluid_deriv(self):
         r"""
@@ -3171,21 +3321,18 @@ class separator(node):
 
         Returns
         -------
-        deriv : list
+        deriv : ndarray
             Matrix with partial derivatives for the fluid equations.
         """
+        m, h, x = self.conn_state()
+        m[1:] *= -1
+        x[1:] *= -1
+
         deriv = np.zeros((self.num_fl, 1 + self.num_o, 3 + self.num_fl))
-        j = 0
-        for fluid in self.fluids:
-            k = 0
-            for o in self.outl:
-                deriv[j, k + 1, 0] = -o.fluid.val[fluid]
-                deriv[j, k + 1, j + 3] = -o.m.val_SI
-                k += 1
-            deriv[j, 0, 0] = self.inl[0].fluid.val[fluid]
-            deriv[j, 0, j + 3] = self.inl[0].m.val_SI
-            j += 1
-        return deriv.tolist()
+        j = np.arange(self.num_fl)[:, np.newaxis]
+        deriv[:, :, 0] = x.transpose()
+        deriv[j, np.arange(1 + self.num_o)[np.newaxis, :], j + 3] = m
+        return deriv
 
     def initialise_fluids(self, nw):
         r"""
@@ -3280,6 +3427,7 @@ class merge(node):
     def component(self):
         return 'merge'
 
+    @schema
     def attr(self):
         return {'num_in': dc_cp(printout=False),
                 'zero_flag': dc_cp(printout=False)}
@@ -3294,6 +3442,12 @@ class merge(node):
     def outlets(self):
         return ['out1']
 
+    def fluid_passthrough(self):
+        return {'target': {}, 'source': {'out1': self.inlets()}}
+
+    def num_eq(self):
+        return 2 + self.num_fl + self.num_i
+
     def additional_equations(self):
         r"""
         Calculates vector vec_res with results of additional equations for this component.
@@ -3318,22 +3472,16 @@ class merge(node):
         vec_res : list
             Vector of residual values.
         """
-        vec_res = []
+        m, h, x = self.conn_state()
+        m[-1] *= -1
 
         ######################################################################
         # equations for fluid balance
-        for fluid, x in self.outl[0].fluid.val.items():
-            res = -x * self.outl[0].m.val_SI
-            for i in self.inl:
-                res += i.fluid.val[fluid] * i.m.val_SI
-            vec_res += [res]
+        vec_res = m.dot(x).tolist()
 
         ######################################################################
         # equation for energy balance
-        h_res = -self.outl[0].m.val_SI * self.outl[0].h.val_SI
-        for i in self.inl:
-            h_res += i.m.val_SI * i.h.val_SI
-        vec_res += [h_res]
+        vec_res += [m.dot(h)]
 
         return vec_res
 
@@ -3343,28 +3491,22 @@ class merge(node):
 
         Returns
         -------
-        mat_deriv : list
+        mat_deriv : ndarray
             Matrix of partial derivatives.
         """
-        mat_deriv = []
-
-        ######################################################################
-        # derivatives for fluid balance equations
-        mat_deriv += self.fluid_deriv()
+        m, h, x = self.conn_state()
+        m[-1] *= -1
+        h[-1] *= -1
 
         ######################################################################
         # derivatives for energy balance equations
         deriv = np.zeros((1, self.num_i + 1, self.num_fl + 3))
-        deriv[0, self.num_i, 0] = -self.outl[0].h.val_SI
-        deriv[0, self.num_i, 2] = -self.outl[0].m.val_SI
-        k = 0
-        for i in self.inl:
-            deriv[0, k, 0] = i.h.val_SI
-            deriv[0, k, 2] = i.m.val_SI
-            k += 1
-        mat_deriv += deriv.tolist()
+        deriv[0, :, 0] = h
+        deriv[0, :, 2] = m
 
-        return mat_deriv
+        ######################################################################
+        # derivatives for fluid balance equations
+        return np.concatenate([self.fluid_deriv(), deriv])
 
     def fluid_deriv(self):
         r"""
@@ -3372,21 +3514,18 @@ class merge(node):
 
         Returns
         -------
-        deriv : list
+        deriv : ndarray
             Matrix with partial derivatives for the fluid equations.
         """
+        m, h, x = self.conn_state()
+        m[-1] *= -1
+        x[-1] *= -1
+
         deriv = np.zeros((self.num_fl, self.num_i + 1, 3 + self.num_fl))
-        j = 0
-        for fluid, x in self.outl[0].fluid.val.items():
-            k = 0
-            for i in self.inl:
-                deriv[j, k, 0] = i.fluid.val[fluid]
-                deriv[j, k, j + 3] = i.m.val_SI
-                k += 1
-            deriv[j, k, 0] = -x
-            deriv[j, k, j + 3] = -self.outl[0].m.val_SI
-            j += 1
-        return deriv.tolist()
+        j = np.arange(self.num_fl)[:, np.newaxis]
+        deriv[:, :, 0] = x.transpose()
+        deriv[j, np.arange(self.num_i + 1)[np.newaxis, :], j + 3] = m
+        return deriv
 
 # %%
 
@@ -3496,6 +3635,7 @@ class combustion_chamber(component):
     def component(self):
         return 'combustion chamber'
 
+    @schema
     def attr(self):
         return {'fuel': dc_cp(printout=False), 'lamb': dc_cp(), 'ti': dc_cp(),
                 'S': dc_cp()}
@@ -3593,6 +3733,9 @@ class combustion_chamber(component):
 
         return val
 
+    def num_eq(self):
+        return self.num_fl + self.num_i + 2 + [self.lamb.is_set, self.ti.is_set].count(True)
+
     def equations(self):
         r"""
         Calculates vector vec_res with results of equations for this component.
@@ -3634,6 +3777,18 @@ class combustion_chamber(component):
 
         return vec_res
 
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        return list(range(self.num_fl, self.num_fl + len(self.m_deriv) + len(self.p_deriv)))
+
     def derivatives(self):
         r"""
         Calculates matrix of partial derivatives for given equations.
@@ -4218,7 +4373,7 @@ class combustion_chamber(component):
         for o in outl:
             if o.m.val_SI < 0 and not o.m.val_set:
                 o.m.val_SI = 10
-            nw.init_target(o, o.t)
+            nw.init_target(o)
 
             if o.h.val_SI < 7.5e5 and not o.h.val_set:
                 o.h.val_SI = 1e6
@@ -4487,6 +4642,7 @@ class combustion_chamber_stoich(combustion_chamber):
     def component(self):
         return 'combustion chamber stoichiometric flue gas'
 
+    @schema
     def attr(self):
         return {'fuel': dc_cp(printout=False),
                 'fuel_alias': dc_cp(printout=False),
@@ -5065,7 +5221,7 @@ class combustion_chamber_stoich(combustion_chamber):
                 if c.fluid.val[fuel] > 0:
                     c.fluid.val[fuel] = 0
 
-            nw.init_target(c, c.t)
+            nw.init_target(c)
 
         for i in nw.comps.loc[self].i:
             if i.m.val_SI < 0 and not i.m.val_set:
@@ -5074,7 +5230,7 @@ class combustion_chamber_stoich(combustion_chamber):
         for c in nw.comps.loc[self].o:
             if c.m.val_SI < 0 and not c.m.val_set:
                 c.m.val_SI = 10
-            nw.init_target(c, c.t)
+            nw.init_target(c)
 
         if self.lamb.val < 1 and not self.lamb.is_set:
             self.lamb.val = 2
@@ -5312,6 +5468,7 @@ class cogeneration_unit(combustion_chamber):
     def component(self):
         return 'cogeneration unit'
 
+    @schema
     def attr(self):
         return {'fuel': dc_cp(printout=False), 'lamb': dc_cp(), 'ti': dc_cp(),
                 'P': dc_cp(val=1e6, d=1, val_min=1),
@@ -5331,6 +5488,10 @@ class cogeneration_unit(combustion_chamber):
     def outlets(self):
         return ['out1', 'out2', 'out3']
 
+    def fluid_passthrough(self):
+        return {'target': {'in1': ['out1'], 'in2': ['out2']},
+                'source': {'out1': ['in1'], 'out2': ['in2']}}
+
     def comp_init(self, nw):
 
         if not self.P.is_set:
@@ -5352,6 +5513,13 @@ class cogeneration_unit(combustion_chamber):
         self.fl_deriv = self.fluid_deriv()
         self.m_deriv = self.mass_flow_deriv()
         self.p_deriv = self.pressure_deriv()
+        self.pr1_deriv = self.pressure_ratio_deriv(self.pr1, 0, 0)
+        self.pr2_deriv = self.pressure_ratio_deriv(self.pr2, 1, 1)
+
+    def num_eq(self):
+        return 3 * self.num_fl + 10 + [
+                self.lamb.is_set, self.ti.is_set, self.Q1.is_set, self.Q2.is_set,
+                self.pr1.is_set, self.pr2.is_set, self.zeta1.is_set, self.zeta2.is_set].count(True)
 
     def equations(self):
         r"""
@@ -5435,6 +5603,27 @@ class cogeneration_unit(combustion_chamber):
 
         return vec_res
 
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        n = self.num_fl + len(self.fl_deriv) + len(self.m_deriv) + len(self.p_deriv)
+        rows = list(range(self.num_fl, n))
+        # energy balance, power, heat and heat loss equations
+        n += 5 + [self.lamb.is_set, self.ti.is_set, self.Q1.is_set, self.Q2.is_set].count(True)
+        for pr in [self.pr1, self.pr2]:
+            if pr.is_set:
+                if not pr.is_var:
+                    rows += [n]
+                n += 1
+        return rows
+
     def derivatives(self):
         r"""
         Calculates matrix of partial derivatives for given equations.
@@ -5604,16 +5793,10 @@ class cogeneration_unit(combustion_chamber):
         ######################################################################
         # derivatives for specified pressure ratio at cooling loops
         if self.pr1.is_set:
-            pr1_deriv = np.zeros((1, 7 + self.num_vars, self.num_fl + 3))
-            pr1_deriv[0, 0, 1] = self.pr1.val
-            pr1_deriv[0, 4, 1] = -1
-            mat_deriv += pr1_deriv.tolist()
+            mat_deriv += self.pr1_deriv
 
         if self.pr2.is_set:
-            pr2_deriv = np.zeros((1, 7 + self.num_vars, self.num_fl + 3))
-            pr2_deriv[0, 1, 1] = self.pr2.val
-            pr2_deriv[0, 5, 1] = -1
-            mat_deriv += pr2_deriv.tolist()
+            mat_deriv += self.pr2_deriv
 
         ######################################################################
         # derivatives for specified zeta values at cooling loops
@@ -6422,6 +6605,7 @@ class valve(component):
     def component(self):
         return 'valve'
 
+    @schema
     def attr(self):
         return {'pr': dc_cp(min_val=1e-4),
                 'zeta': dc_cp(min_val=1e-4),
@@ -6440,6 +6624,10 @@ class valve(component):
         self.fl_deriv = self.fluid_deriv()
         self.m_deriv = self.mass_flow_deriv()
         self.h_deriv = self.enthalpy_deriv()
+        self.pr_deriv = self.pressure_ratio_deriv(self.pr)
+
+    def num_eq(self):
+        return self.num_fl + 2 + [self.pr.is_set, self.zeta.is_set].count(True)
 
     def equations(self):
         r"""
@@ -6477,6 +6665,21 @@ class valve(component):
 
         return vec_res
 
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        rows = list(range(len(self.fl_deriv) + len(self.m_deriv) + len(self.h_deriv)))
+        if self.pr.is_set and not self.pr.is_var:
+            rows += [len(rows)]
+        return rows
+
     def derivatives(self):
         r"""
         Calculates matrix of partial derivatives for given equations.
@@ -6503,12 +6706,12 @@ class valve(component):
         ######################################################################
         # derivatives for specified pressure ratio
         if self.pr.is_set:
-            deriv = np.zeros((1, 2 + self.num_vars, self.num_fl + 3))
-            deriv[0, 0, 1] = self.pr.val
-            deriv[0, 1, 1] = -1
             if self.pr.is_var:
+                deriv = np.asarray(self.pressure_ratio_deriv(self.pr))
                 deriv[0, 2 + self.pr.var_pos, 0] = self.inl[0].p.val_SI
-            mat_deriv += deriv.tolist()
+                mat_deriv += deriv.tolist()
+            else:
+                mat_deriv += self.pr_deriv
 
         ######################################################################
         # derivatives for specified zeta
@@ -6765,6 +6968,7 @@ class heat_exchanger_simple(component):
     def component(self):
         return 'heat exchanger simple'
 
+    @schema
     def attr(self):
         return {'Q': dc_cp(),
                 'pr': dc_cp(min_val=1e-4),
@@ -6790,6 +6994,7 @@ class heat_exchanger_simple(component):
 
         self.fl_deriv = self.fluid_deriv()
         self.m_deriv = self.mass_flow_deriv()
+        self.pr_deriv = self.pressure_ratio_deriv(self.pr)
 
         self.Tamb.val_SI = ((self.Tamb.val + nw.T[nw.T_unit][0]) * nw.T[nw.T_unit][1])
         self.Tamb.design = ((self.Tamb.design + nw.T[nw.T_unit][0]) * nw.T[nw.T_unit][1])
@@ -6841,6 +7046,11 @@ class heat_exchanger_simple(component):
         else:
             self.kA_group.set_attr(is_set=False)
 
+    def num_eq(self):
+        return self.num_fl + 1 + [
+                self.Q.is_set, self.pr.is_set, self.zeta.is_set,
+                self.hydro_group.is_set, self.kA_group.is_set].count(True)
+
     def equations(self):
         r"""
         Calculates vector vec_res with results of equations for this component.
@@ -6916,6 +7126,21 @@ class heat_exchanger_simple(component):
 
         return vec_res
 
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        rows = list(range(len(self.fl_deriv) + len(self.m_deriv)))
+        if self.pr.is_set and not self.pr.is_var:
+            rows += [len(rows) + self.Q.is_set]
+        return rows
+
     def derivatives(self):
         r"""
         Calculates matrix of partial derivatives for given equations.
@@ -6943,13 +7168,13 @@ class heat_exchanger_simple(component):
         ######################################################################
         # derivatives for specified pressure ratio
         if self.pr.is_set:
-            pr_deriv = np.zeros((1, 2 + self.num_vars, self.num_fl + 3))
-            pr_deriv[0, 0, 1] = self.pr.val
-            pr_deriv[0, 1, 1] = -1
             # custom variable pr
             if self.pr.is_var:
+                pr_deriv = np.asarray(self.pressure_ratio_deriv(self.pr))
                 pr_deriv[0, 2 + self.pr.var_pos, 0] = self.inl[0].p.val_SI
-            mat_deriv += pr_deriv.tolist()
+                mat_deriv += pr_deriv.tolist()
+            else:
+                mat_deriv += self.pr_deriv
 
         ######################################################################
         # derivatives for specified zeta
@@ -6975,7 +7200,10 @@ class heat_exchanger_simple(component):
                 func = self.darcy_func
 
             deriv = np.zeros((1, 2 + self.num_vars, self.num_fl + 3))
-            deriv[0, 0, 0] = self.numeric_deriv(func, 'm', 0)
+            if self.hydro_group.method == 'HW':
+                deriv[0, 0, 0] = self.numeric_deriv(func, 'm', 0)
+            else:
+                deriv[0, 0, 0] = self.darcy_deriv_m()
             for i in range(2):
                 deriv[0, i, 1] = self.numeric_deriv(func, 'p', i)
                 deriv[0, i, 2] = self.numeric_deriv(func, 'h', i)
@@ -7079,29 +7307,56 @@ class heat_exchanger_simple(component):
         if abs(i[0]) < 1e-4:
             return i[1] - o[1]
 
-        visc_i, visc_o = visc_mix_ph(i), visc_mix_ph(o)
-        v_i, v_o = v_mix_ph(i), v_mix_ph(o)
+        visc = (visc_mix_ph(i) + visc_mix_ph(o)) / 2
+        v = (v_mix_ph(i) + v_mix_ph(o)) / 2
 
-        re = 4 * abs(i[0]) / (math.pi * self.D.val * (visc_i + visc_o) / 2)
+        return (i[1] - o[1]) - darcy_dp(i[0], v, visc, self.D.val, self.L.val, self.ks.val)
 
-        return ((i[1] - o[1]) - 8 * abs(i[0]) * i[0] * (v_i + v_o) / 2 *
-                self.L.val * lamb(re, self.ks.val, self.D.val) /
-                (math.pi ** 2 * self.D.val ** 5))
-
-    def hw_func(self):
+    def darcy_deriv_m(self):
         r"""
-        Equation for pressure drop calculation from Hazen-Williams equation.
+        Calculates the partial derivative of the darcy equation to the mass flow.
 
         Returns
         -------
-        res : float
-            Residual value of equation.
+        deriv : float
+            Partial derivative of the darcy equation to the inlet mass flow.
 
             .. math::
 
-                res = \left(p_{in} - p_{out} \right) \cdot \left(-1\right)^i -
-                \frac{10.67 \cdot |\dot{m}_{in}| ^ {1.852}
-                \cdot L}{ks^{1.852} \cdot D^{4.871}} \cdot g \cdot
+                \frac{\partial f}{\partial \dot{m}_{in}} = - \frac{8 \cdot
+                |\dot{m}_{in}| \cdot \frac{v_{in}+v_{out}}{2} \cdot L}{\pi^2 \cdot D^5}
+                \cdot \left(2 \cdot \lambda + Re \cdot
+                \frac{\partial \lambda}{\partial Re}\right)
+
+        Note
+        ----
+        The derivative of the friction factor is calculated analytically, see
+        :func:`tespy.tools.helpers.ddarcy_dp_dm`.
+        """
+        i, o = self.inl[0].to_flow(), self.outl[0].to_flow()
+
+        if abs(i[0]) < 1e-4:
+            return 0
+
+        visc = (visc_mix_ph(i) + visc_mix_ph(o)) / 2
+        v = (v_mix_ph(i) + v_mix_ph(o)) / 2
+
+        return -ddarcy_dp_dm(i[0], v, visc, self.D.val, self.L.val, self.ks.val)
+
+    def hw_func(self):
+        r"""
+        Equation for pressure drop calculation from Hazen-Williams equation.
+
+        Returns
+        -------
+        res : float
+            Residual value of equation.
+
+            .. math::
+
+                res = \left(p_{in} - p_{out} \right) \cdot \left(-1\right)^i -
+                \frac{10.67 \cdot |\dot{m}_{in}| ^ {1.852}
+                \cdot L}{ks^{1.852} \cdot D^{4.871}} \cdot g \cdot
                 \left(\frac{v_{in} + v_{out}}{2}\right)^{0.852}
 
                 i = \begin{cases}
@@ -7118,13 +7373,9 @@ class heat_exchanger_simple(component):
         if abs(i[0]) < 1e-4:
             return i[1] - o[1]
 
-        v_i, v_o = v_mix_ph(i), v_mix_ph(o)
-        flow_dir = np.sign(i[0])
+        v = (v_mix_ph(i) + v_mix_ph(o)) / 2
 
-        return ((i[1] - o[1]) * flow_dir -
-                (10.67 * abs(i[0]) ** 1.852 * self.L.val /
-                 (self.ks.val ** 1.852 * self.D.val ** 4.871)) *
-                (9.81 * ((v_i + v_o) / 2) ** 0.852))
+        return (i[1] - o[1]) * np.sign(i[0]) - hw_dp(i[0], v, self.D.val, self.L.val, self.ks.val)
 
     def kA_func(self):
         r"""
@@ -7163,19 +7414,12 @@ class heat_exchanger_simple(component):
         ttd_1 = T_mix_ph(i) - self.Tamb.val_SI
         ttd_2 = T_mix_ph(o) - self.Tamb.val_SI
 
-        if ttd_1 > ttd_2:
-            td_log = (ttd_1 - ttd_2) / math.log(ttd_1 / ttd_2)
-        elif ttd_1 < ttd_2:
-            td_log = (ttd_2 - ttd_1) / math.log(ttd_2 / ttd_1)
-        else:
-            td_log = 0
-
         fkA = 1
         if not np.isnan(self.inl[0].m.design):
             if self.kA_char.param == 'm':
                 fkA = self.kA_char.func.f_x(i[0] / self.inl[0].m.design)
 
-        return i[0] * (o[2] - i[2]) + self.kA.val * fkA * td_log
+        return i[0] * (o[2] - i[2]) + self.kA.val * fkA * td_log(ttd_1, ttd_2)
 
     def bus_func(self, bus):
         r"""
@@ -7336,14 +7580,7 @@ class heat_exchanger_simple(component):
                 ttd_1 = T_mix_ph(i) - self.Tamb.val_SI
                 ttd_2 = T_mix_ph(o) - self.Tamb.val_SI
 
-                if ttd_1 > ttd_2:
-                    td_log = (ttd_1 - ttd_2) / math.log(ttd_1 / ttd_2)
-                elif ttd_1 < ttd_2:
-                    td_log = (ttd_2 - ttd_1) / math.log(ttd_2 / ttd_1)
-                else:
-                    td_log = 0
-
-                self.kA.val = abs(i[0] * (o[2] - i[2]) / td_log)
+                self.kA.val = abs(i[0] * (o[2] - i[2]) / td_log(ttd_1, ttd_2))
 
             if self.kA.is_set:
                 # get bound errors for kA characteristic line
@@ -7610,153 +7847,1033 @@ class solar_collector(heat_exchanger_simple):
     >>> shutil.rmtree('./tmp', ignore_errors=True)
     """
 
-    def component(self):
-        return 'solar collector'
+    def component(self):
+        return 'solar collector'
+
+    @schema
+    def attr(self):
+        return {'Q': dc_cp(),
+                'pr': dc_cp(min_val=1e-4),
+                'zeta': dc_cp(min_val=1e-4),
+                'D': dc_cp(min_val=1e-2, max_val=2, d=1e-3),
+                'L': dc_cp(min_val=1e-1, d=1e-3),
+                'ks': dc_cp(min_val=1e-7, max_val=1e-4, d=1e-8),
+                'E': dc_cp(min_val=0), 'lkf_lin': dc_cp(), 'lkf_quad': dc_cp(),
+                'A': dc_cp(min_val=0), 'Tamb': dc_cp(),
+                'SQ': dc_cp(),
+                'hydro_group': dc_gcp(), 'energy_group': dc_gcp()}
+
+    def inlets(self):
+        return ['in1']
+
+    def outlets(self):
+        return ['out1']
+
+    def comp_init(self, nw):
+
+        component.comp_init(self, nw)
+
+        self.fl_deriv = self.fluid_deriv()
+        self.m_deriv = self.mass_flow_deriv()
+        self.pr_deriv = self.pressure_ratio_deriv(self.pr)
+
+        self.Tamb.val_SI = ((self.Tamb.val + nw.T[nw.T_unit][0]) * nw.T[nw.T_unit][1])
+
+        # parameters for hydro group
+        self.hydro_group.set_attr(elements=[self.L, self.ks, self.D])
+
+        is_set = True
+        for e in self.hydro_group.elements:
+            if not e.is_set:
+                is_set = False
+
+        if is_set:
+            self.hydro_group.set_attr(is_set=True)
+        elif self.hydro_group.is_set:
+            msg = ('All parameters of the component group have to be '
+                   'specified! This component group uses the following '
+                   'parameters: L, ks, D at ' + self.label + '. '
+                   'Group will be set to False.')
+            logging.info(msg)
+            self.hydro_group.set_attr(is_set=False)
+        else:
+            self.hydro_group.set_attr(is_set=False)
+
+        # parameters for kA group
+        self.energy_group.set_attr(elements=[self.E, self.lkf_lin, self.lkf_quad, self.A, self.Tamb])
+
+        is_set = True
+        for e in self.energy_group.elements:
+            if not e.is_set:
+                is_set = False
+
+        if is_set:
+            self.energy_group.set_attr(is_set=True)
+        elif self.energy_group.is_set:
+            msg = ('All parameters of the component group have to be '
+                   'specified! This component group uses the following '
+                   'parameters: E, lkf_lin, lkf_quad, A, Tamb at ' + self.label
+                   + '. Group will be set to False.')
+            logging.info(msg)
+            self.energy_group.set_attr(is_set=False)
+        else:
+            self.energy_group.set_attr(is_set=False)
+
+    def num_eq(self):
+        return self.num_fl + 1 + [
+                self.Q.is_set, self.pr.is_set, self.zeta.is_set,
+                self.hydro_group.is_set, self.energy_group.is_set].count(True)
+
+    def additional_equations(self):
+        r"""
+        Calculates vector vec_res with results of additional equations for this component.
+
+        Equations
+
+            **optional equations**
+
+            - :func:`tespy.components.components.solar_collector.energy_func`
+
+        Returns
+        -------
+        vec_res : list
+            Vector of residual values.
+        """
+        vec_res = []
+
+        ######################################################################
+        # equation for specified energy-group paremeters
+        if self.energy_group.is_set:
+            vec_res += [self.energy_func()]
+
+        return vec_res
+
+    def additional_derivatives(self):
+        r"""
+        Calculates matrix of partial derivatives for given additional equations.
+
+        Returns
+        -------
+        mat_deriv : ndarray
+            Matrix of partial derivatives.
+        """
+        mat_deriv = []
+
+        ######################################################################
+        # derivatives for specified energy-group paremeters
+        if self.energy_group.is_set:
+            deriv = np.zeros((1, 2 + self.num_vars, self.num_fl + 3))
+            deriv[0, 0, 0] = self.outl[0].h.val_SI - self.inl[0].h.val_SI
+            for i in range(2):
+                deriv[0, i, 1] = self.numeric_deriv(self.energy_func, 'p', i)
+                deriv[0, i, 2] = self.numeric_deriv(self.energy_func, 'h', i)
+            # custom variables for the energy-group
+            for var in self.energy_group.elements:
+                if var.is_var:
+                    deriv[0, 2 + var.var_pos, 0] = self.numeric_deriv(self.energy_func, self.vars[var], i)
+            mat_deriv += deriv.tolist()
+
+        return mat_deriv
+
+    def energy_func(self):
+        r"""
+        Equation for solar collector energy balance.
+
+        Returns
+        -------
+        res : float
+            Residual value of equation.
+
+            .. math::
+
+                T_m = \frac{T_{out} + T_{in}}{2}\\
+
+                0 = \dot{m} \cdot \left( h_{out} - h_{in} \right) -
+                A \cdot \left\{E - \left(T_m - T_{amb} \right) \cdot
+                \left[ \alpha_1 + \alpha_2 \cdot A \cdot \left(\
+                T_m - T_{amb}\right) \right] \right\}
+        """
+
+        i = self.inl[0].to_flow()
+        o = self.outl[0].to_flow()
+
+        T_m = (T_mix_ph(i) + T_mix_ph(o)) / 2
+
+        return (i[0] * (o[2] - i[2]) - self.A.val * (self.E.val - (T_m - self.Tamb.val_SI) *
+                (self.lkf_lin.val + self.lkf_quad.val * self.A.val * (T_m - self.Tamb.val_SI))))
+
+    def calc_parameters(self, mode):
+        r"""
+        Post and preprocessing parameter calculation/specification.
+
+        Parameters
+        ----------
+
+        mode : str
+            Pre- or postprocessing calculation.
+
+        Note
+        ----
+        Generic preprocessing is handled by the base class. This method handles class specific pre- and postprocessing.
+        """
+        component.calc_parameters(self, mode)
+
+        if mode == 'post':
+            i = self.inl[0].to_flow()
+            o = self.outl[0].to_flow()
+
+            self.SQ.val = i[0] * (s_mix_ph(o) - s_mix_ph(i))
+            self.Q.val = i[0] * (o[2] - i[2])
+            self.pr.val = o[1] / i[1]
+            self.zeta.val = ((i[1] - o[1]) * math.pi ** 2 / (8 * i[0] ** 2 * (v_mix_ph(i) + v_mix_ph(o)) / 2))
+
+# %%
+
+
+class pipe_array(component):
+    r"""
+    The component pipe_array represents a bundle of independent pipe segments, e. g. the pipes of a district heating grid.
+
+    Equations
+
+        **mandatory equations**
+
+        - :func:`tespy.components.components.pipe_array.fluid_func`
+        - :func:`tespy.components.components.pipe_array.mass_flow_func`
+
+        **optional equations**
+
+        - :func:`tespy.components.components.pipe_array.Q_func`
+
+        .. math::
+
+            0 = p_{in,i} \cdot pr_i - p_{out,i} \; \forall i \in \mathrm{segments}
+
+        - :func:`tespy.components.components.pipe_array.zeta_func`
+
+        - :func:`tespy.components.components.pipe_array.darcy_func` or
+          :func:`tespy.components.components.pipe_array.hw_func`
+
+        - :func:`tespy.components.components.pipe_array.kA_func`
+
+    Inlets/Outlets
+
+        - specify number of segments with :code:`num_seg` (default value: 1)
+        - segment i connects inlet in{i} with outlet out{i}
+
+    Image
+
+        .. image:: _images/pipe.svg
+           :scale: 100 %
+           :alt: alternative text
+           :align: center
+
+    Parameters
+    ----------
+    label : str
+        The label of the component.
+
+    mode : str
+        'auto' for automatic design to offdesign switch, 'man' for manual switch.
+
+    design : list
+        List containing design parameters (stated as String).
+
+    offdesign : list
+        List containing offdesign parameters (stated as String).
+
+    num_seg : int
+        Number of pipe segments.
+
+    Q : list/ndarray/float/tespy.helpers.dc_cp
+        Heat transfer of the segments, :math:`Q/\text{W}`.
+
+    pr : list/ndarray/float/tespy.helpers.dc_cp
+        Outlet to inlet pressure ratio of the segments, :math:`pr/1`.
+
+    zeta : list/ndarray/float/tespy.helpers.dc_cp
+        Geometry independent friction coefficient of the segments,
+        :math:`\zeta/\frac{\text{Pa}}{\text{m}^4}`.
+
+    D : list/ndarray/float/tespy.helpers.dc_cp
+        Diameter of the pipe segments, :math:`D/\text{m}`.
+
+    L : list/ndarray/float/tespy.helpers.dc_cp
+        Length of the pipe segments, :math:`L/\text{m}`.
+
+    ks : list/ndarray/float/tespy.helpers.dc_cp
+        Pipe segments' roughness, :math:`ks/\text{m}` for darcy friction,
+        :math:`ks/\text{1}` for hazen-williams equation.
+
+    hydro_group : Sring/tespy.helpers.dc_gcp
+        Parametergroup for pressure drop calculation based on pipes dimensions.
+        Choose 'HW' for hazen-williams equation, else darcy friction factor is used.
+
+    kA : list/ndarray/float/tespy.helpers.dc_cp
+        Area independent heat transition coefficient of the segments,
+        :math:`kA/\frac{\text{W}}{\text{K}}`.
+
+    Tamb : list/ndarray/float/tespy.helpers.dc_cp
+        Ambient temperature, provide parameter in network's temperature
+        unit.
+
+    kA_group : tespy.helpers.dc_gcp
+        Parametergroup for heat transfer calculation from ambient temperature and area
+        independent heat transfer coefficient kA.
+
+    Note
+    ----
+    The segments' parameters are specified as lists or arrays with a value for every
+    segment, a scalar value is applied to all segments. The equations of all segments
+    are evaluated in vectorised form, the parameters must therefore be specified for
+    all segments or none. The results of the segments are available as arrays in the
+    component's parameters, e. g. :code:`pa.Q.val[i]` for the heat transfer of
+    segment i, and at the connections of the segments.
+
+    Custom variables and characteristic lines for the heat transfer coefficient are
+    not available for pipe arrays.
+
+    Example
+    -------
+    Three parallel pipes of different dimensions are supplied from a splitter and
+    feed into a merge. The mass flow distributes according to the pipes' pressure
+    losses.
+
+    >>> from tespy import cmp, con, nwk
+    >>> import numpy as np
+    >>> fluids = ['H2O']
+    >>> nw = nwk.network(fluids=fluids)
+    >>> nw.set_attr(p_unit='bar', T_unit='C', h_unit='kJ / kg')
+    >>> nw.set_printoptions(print_level='none')
+    >>> so = cmp.source('source')
+    >>> si = cmp.sink('sink')
+    >>> sp = cmp.splitter('splitter', num_out=3)
+    >>> me = cmp.merge('merge', num_in=3)
+    >>> pa = cmp.pipe_array('grid', num_seg=3)
+    >>> pa.set_attr(D=[0.05, 0.08, 0.1], L=[100, 200, 150], ks=5e-5,
+    ...     kA=[10, 15, 20], Tamb=10)
+    >>> inc = con.connection(so, 'out1', sp, 'in1')
+    >>> outg = con.connection(me, 'out1', si, 'in1')
+    >>> nw.add_conns(inc, outg)
+    >>> for i in range(3):
+    ...     nw.add_conns(
+    ...         con.connection(sp, 'out' + str(i + 1), pa, 'in' + str(i + 1)),
+    ...         con.connection(pa, 'out' + str(i + 1), me, 'in' + str(i + 1)))
+    >>> inc.set_attr(fluid={'H2O': 1}, m=20, T=90, p=10)
+    >>> nw.solve('design')
+    >>> [round(c.m.val, 2) for c in pa.inl]
+    [2.36, 5.71, 11.92]
+    >>> round(outg.p.val, 3)
+    9.684
+    >>> np.round(pa.Q.val, 0).tolist()
+    [-800.0, -1200.0, -1600.0]
+    >>> round(outg.T.val, 2)
+    89.96
+    """
+
+    def component(self):
+        return 'pipe array'
+
+    @schema
+    def attr(self):
+        return {'num_seg': dc_cp(printout=False),
+                'Q': dc_cp(), 'pr': dc_cp(), 'zeta': dc_cp(),
+                'D': dc_cp(), 'L': dc_cp(), 'ks': dc_cp(),
+                'kA': dc_cp(), 'Tamb': dc_cp(),
+                'SQ1': dc_cp(), 'SQ2': dc_cp(), 'Sirr': dc_cp(),
+                'hydro_group': dc_gcp(), 'kA_group': dc_gcp()}
+
+    def segment_attr(self):
+        return ['Q', 'pr', 'zeta', 'D', 'L', 'ks', 'kA', 'Tamb']
+
+    def inlets(self):
+        if self.num_seg.is_set:
+            return ['in' + str(i + 1) for i in range(self.num_seg.val)]
+        else:
+            self.set_attr(num_seg=1)
+            return self.inlets()
+
+    def outlets(self):
+        if self.num_seg.is_set:
+            return ['out' + str(i + 1) for i in range(self.num_seg.val)]
+        else:
+            self.set_attr(num_seg=1)
+            return self.outlets()
+
+    def fluid_passthrough(self):
+        return {'target': {i: [o] for i, o in zip(self.inlets(), self.outlets())},
+                'source': {o: [i] for i, o in zip(self.inlets(), self.outlets())}}
+
+    def set_attr(self, **kwargs):
+        r"""
+        Sets, resets or unsets attributes of a pipe array.
+
+        Parameters
+        ----------
+        **kwargs :
+            See the class documentation of the pipe array for available keywords.
+
+        Note
+        ----
+        The segments' parameters may be passed as lists or arrays, all other keywords
+        are handled by :func:`tespy.components.components.component.set_attr`.
+        A list of nan values unsets the parameter for all segments, it is not
+        possible to unset the parameter for single segments.
+        """
+        if 'num_seg' in kwargs:
+            component.set_attr(self, num_seg=kwargs.pop('num_seg'))
+
+        for key in self.segment_attr():
+            if key in kwargs and isinstance(kwargs[key], (list, np.ndarray)):
+                val = np.asarray(kwargs.pop(key), dtype=float)
+                if self.num_seg.is_set:
+                    self.segment_array(val, key)
+
+                if np.isnan(val).all():
+                    self.get_attr(key).set_attr(is_set=False)
+                elif np.isnan(val).any():
+                    msg = ('The values of the parameter ' + key + ' at ' + self.label + ' must not contain nan. '
+                           'Pass nan for every segment to unset the parameter.')
+                    logging.error(msg)
+                    raise TESPyComponentError(msg)
+                else:
+                    self.get_attr(key).set_attr(val=val, is_set=True)
+                self.get_attr(key).set_attr(is_var=False)
+
+        component.set_attr(self, **kwargs)
+
+    def segment_array(self, val, key):
+        r"""
+        Returns the value of a parameter as array with a value for every segment.
+
+        Parameters
+        ----------
+        val : float/list/ndarray/str
+            Parameter value, strings represent lists of values (saved network).
+
+        key : str
+            Name of the parameter.
+
+        Returns
+        -------
+        val : ndarray
+            Array of values for the segments.
+        """
+        if isinstance(val, str):
+            val = [float(x) for x in val.strip('[]').split(',')]
+
+        n = self.num_seg.val
+        if np.size(val) not in (1, n):
+            msg = ('The parameter ' + key + ' at ' + self.label + ' must have one value or ' + str(n) + ' values, '
+                   'one for each segment.')
+            logging.error(msg)
+            raise TESPyComponentError(msg)
+
+        return np.ones(n) * np.asarray(val, dtype=float)
+
+    def comp_init(self, nw):
+
+        component.comp_init(self, nw)
+
+        n = self.num_seg.val
+        for key in self.segment_attr():
+            dc = self.get_attr(key)
+            if dc.is_var:
+                msg = ('Custom variables are not available for pipe arrays (parameter ' + key + ' at ' + self.label + ').')
+                logging.error(msg)
+                raise TESPyComponentError(msg)
+
+            dc.val = self.segment_array(dc.val, key)
+            dc.design = self.segment_array(dc.design, key)
+
+        self.Tamb.val_SI = ((self.Tamb.val + nw.T[nw.T_unit][0]) * nw.T[nw.T_unit][1])
+        self.Tamb.design = ((self.Tamb.design + nw.T[nw.T_unit][0]) * nw.T[nw.T_unit][1])
+
+        # parameters for hydro group
+        self.hydro_group.set_attr(elements=[self.L, self.ks, self.D])
+        if all([e.is_set for e in self.hydro_group.elements]):
+            self.hydro_group.set_attr(is_set=True)
+        elif self.hydro_group.is_set:
+            msg = ('All parameters of the component group have to be '
+                   'specified! This component group uses the following '
+                   'parameters: L, ks, D at ' + self.label + '. '
+                   'Group will be set to False.')
+            logging.info(msg)
+            self.hydro_group.set_attr(is_set=False)
+        else:
+            self.hydro_group.set_attr(is_set=False)
+
+        # parameters for kA group
+        self.kA_group.set_attr(elements=[self.kA, self.Tamb])
+        if all([e.is_set for e in self.kA_group.elements]):
+            self.kA_group.set_attr(is_set=True)
+        elif self.kA_group.is_set:
+            msg = ('All parameters of the component group have to be '
+                   'specified! This component group uses the following '
+                   'parameters: kA, Tamb at ' + self.label + '. '
+                   'Group will be set to False.')
+            logging.info(msg)
+            self.kA_group.set_attr(is_set=False)
+        else:
+            self.kA_group.set_attr(is_set=False)
+
+        # constant derivatives
+        self.seg = np.arange(n)
+        self.fl_deriv = self.fluid_deriv()
+        self.m_deriv = self.mass_flow_deriv()
+        self.pr_deriv = np.zeros((n, 2 * n, self.num_fl + 3))
+        self.pr_deriv[self.seg, self.seg, 1] = self.pr.val
+        self.pr_deriv[self.seg, self.seg + n, 1] = -1
+
+    def num_eq(self):
+        return self.num_i * (self.num_fl + 1 + [
+                self.Q.is_set, self.pr.is_set, self.zeta.is_set,
+                self.hydro_group.is_set, self.kA_group.is_set].count(True))
+
+    def equations(self):
+        r"""
+        Calculates vector vec_res with results of equations for this component.
+
+        Returns
+        -------
+        vec_res : list
+            Vector of residual values.
+        """
+        vec_res = []
+
+        ######################################################################
+        # equations for fluid balance
+        vec_res += self.fluid_func().tolist()
+
+        ######################################################################
+        # equations for mass flow balance
+        vec_res += self.mass_flow_func().tolist()
+
+        ######################################################################
+        # equations for specified heat transfer
+        if self.Q.is_set:
+            vec_res += self.Q_func().tolist()
+
+        ######################################################################
+        # equations for specified pressure ratio
+        if self.pr.is_set:
+            i, o = self.segment_states()
+            vec_res += (i[:, 1] * self.pr.val - o[:, 1]).tolist()
+
+        ######################################################################
+        # equations for specified zeta
+        if self.zeta.is_set:
+            vec_res += self.zeta_func().tolist()
+
+        ######################################################################
+        # equations for specified hydro-group paremeters
+        if self.hydro_group.is_set:
+            # hazen williams equation
+            if self.hydro_group.method == 'HW':
+                vec_res += self.hw_func().tolist()
+            # darcy friction factor
+            else:
+                vec_res += self.darcy_func().tolist()
+
+        ######################################################################
+        # equations for specified kA-group paremeters
+        if self.kA_group.is_set:
+            vec_res += self.kA_func().tolist()
+
+        return vec_res
+
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        n = len(self.fl_deriv) + len(self.m_deriv)
+        rows = list(range(n))
+        if self.pr.is_set:
+            n += self.num_i * self.Q.is_set
+            rows += list(range(n, n + self.num_i))
+        return rows
+
+    def derivatives(self):
+        r"""
+        Calculates matrix of partial derivatives for given equations.
+
+        Returns
+        -------
+        mat_deriv : ndarray
+            Matrix of partial derivatives.
+        """
+        mat_deriv = [self.fl_deriv, self.m_deriv]
+
+        ######################################################################
+        # derivatives for specified heat transfer
+        if self.Q.is_set:
+            i, o = self.segment_states()
+            deriv = np.zeros(self.pr_deriv.shape)
+            deriv[self.seg, self.seg, 0] = o[:, 2] - i[:, 2]
+            deriv[self.seg, self.seg, 2] = -i[:, 0]
+            deriv[self.seg, self.seg + self.num_seg.val, 2] = i[:, 0]
+            mat_deriv += [deriv]
+
+        ######################################################################
+        # derivatives for specified pressure ratio
+        if self.pr.is_set:
+            mat_deriv += [self.pr_deriv]
+
+        ######################################################################
+        # derivatives for specified zeta
+        if self.zeta.is_set:
+            mat_deriv += [self.segment_deriv(self.zeta_func)]
+
+        ######################################################################
+        # derivatives for specified hydro-group parameters
+        if self.hydro_group.is_set:
+            # hazen williams equation
+            if self.hydro_group.method == 'HW':
+                mat_deriv += [self.segment_deriv(self.hw_func)]
+            # darcy friction factor
+            else:
+                deriv = self.segment_deriv(self.darcy_func, m=False)
+                deriv[self.seg, self.seg, 0] = self.darcy_deriv_m()
+                mat_deriv += [deriv]
+
+        ######################################################################
+        # derivatives for specified kA-group parameters
+        if self.kA_group.is_set:
+            mat_deriv += [self.segment_deriv(self.kA_func)]
+
+        return np.concatenate(mat_deriv)
+
+    def segment_states(self):
+        r"""
+        Returns mass flow, pressure and enthalpy at the segments' inlets and outlets.
+
+        Returns
+        -------
+        i, o : ndarray
+            Arrays of shape (num_seg, 3) holding mass flow, pressure and enthalpy
+            at the inlets (i) and the outlets (o) of the segments.
+        """
+        i = np.array([[c.m.val_SI, c.p.val_SI, c.h.val_SI] for c in self.inl])
+        o = np.array([[c.m.val_SI, c.p.val_SI, c.h.val_SI] for c in self.outl])
+        return i, o
+
+    def segment_props(self, func, conns):
+        r"""
+        Returns a fluid property for all connections provided.
+
+        Parameters
+        ----------
+        func : function
+            Fluid property function, e. g. :func:`tespy.tools.helpers.v_mix_ph`.
+
+        conns : list
+            List of connections.
+
+        Returns
+        -------
+        val : ndarray
+            Fluid property values.
+        """
+        return np.array([func(c.to_flow()) for c in conns])
+
+    def segment_deriv(self, func, m=True):
+        r"""
+        Calculates the partial derivatives of a vectorised segment equation.
+
+        Parameters
+        ----------
+        func : function
+            Function returning the residual values of all segments.
+
+        m : boolean
+            Calculate the partial derivatives to the inlets' mass flow, default: True.
+
+        Returns
+        -------
+        deriv : ndarray
+            Matrix of partial derivatives.
+
+        Note
+        ----
+        The equation of a segment only depends on the segment's inlet and outlet.
+        Thus, a variable is shifted at all segments simultaneously and a single
+        evaluation of the vectorised function yields the partial derivatives
+        of all segments.
+        """
+        n = self.num_seg.val
+        deriv = np.zeros(self.pr_deriv.shape)
+
+        shifts = [('p', 1, 1, self.inl, self.seg), ('h', 2, 1, self.inl, self.seg),
+                  ('p', 1, 1, self.outl, self.seg + n), ('h', 2, 1, self.outl, self.seg + n)]
+        if m:
+            shifts = [('m', 0, 1e-4, self.inl, self.seg)] + shifts
+
+        for var, col, d, conns, pos in shifts:
+            for c in conns:
+                c.get_attr(var).val_SI += d
+            exp = func()
+
+            for c in conns:
+                c.get_attr(var).val_SI -= 2 * d
+            exp -= func()
+            deriv[self.seg, pos, col] = exp / (2 * d)
+
+            for c in conns:
+                c.get_attr(var).val_SI += d
+
+        return deriv
+
+    def fluid_func(self):
+        r"""
+        Calculates the vector of residual values for the segments' fluid balance equations.
+
+        Returns
+        -------
+        vec_res : ndarray
+            Vector of residual values for the segments' fluid balance.
+
+            .. math::
+                0 = fluid_{j,in,i} - fluid_{j,out,i} \; \forall j \in \mathrm{fluid},
+                \; \forall i \in \mathrm{segments}
+        """
+        x_i = np.array([list(c.fluid.val.values()) for c in self.inl])
+        x_o = np.array([list(c.fluid.val.values()) for c in self.outl])
+        return (x_i - x_o).flatten()
+
+    def fluid_deriv(self):
+        r"""
+        Calculates the partial derivatives for all fluid balance equations.
+
+        Returns
+        -------
+        deriv : ndarray
+            Matrix with partial derivatives for the fluid equations.
+        """
+        n = self.num_seg.val
+        deriv = np.zeros((n * self.num_fl, 2 * n, 3 + self.num_fl))
+        for j in range(self.num_fl):
+            rows = self.seg * self.num_fl + j
+            deriv[rows, self.seg, 3 + j] = 1
+            deriv[rows, self.seg + n, 3 + j] = -1
+        return deriv
+
+    def mass_flow_func(self):
+        r"""
+        Calculates the residual values for the segments' mass flow balance equations.
+
+        Returns
+        -------
+        vec_res : ndarray
+            Vector with residual values for the segments' mass flow balance.
+
+            .. math::
+                0 = \dot{m}_{in,i} - \dot{m}_{out,i} \; \forall i \in \mathrm{segments}
+        """
+        i, o = self.segment_states()
+        return i[:, 0] - o[:, 0]
+
+    def mass_flow_deriv(self):
+        r"""
+        Calculates the partial derivatives for all mass flow balance equations.
+
+        Returns
+        -------
+        deriv : ndarray
+            Matrix with partial derivatives for the mass flow balance equations.
+        """
+        n = self.num_seg.val
+        deriv = np.zeros((n, 2 * n, 3 + self.num_fl))
+        deriv[self.seg, self.seg, 0] = 1
+        deriv[self.seg, self.seg + n, 0] = -1
+        return deriv
+
+    def Q_func(self):
+        r"""
+        Equations for heat transfer of the segments.
+
+        Returns
+        -------
+        res : ndarray
+            Residual values of equations.
+
+            .. math::
+
+                0 = \dot{m}_{in,i} \cdot \left(h_{out,i} - h_{in,i}\right) - \dot{Q}_i
+        """
+        i, o = self.segment_states()
+        return i[:, 0] * (o[:, 2] - i[:, 2]) - self.Q.val
+
+    def zeta_func(self):
+        r"""
+        Equations for the geometry independent friction coefficients of the segments.
+
+        Returns
+        -------
+        res : ndarray
+            Residual values of equations.
+
+            .. math::
+
+                0 = \begin{cases}
+                p_{in,i} - p_{out,i} & |\dot{m}_i| < \epsilon \\
+                \zeta_i - \frac{(p_{in,i} - p_{out,i}) \cdot \pi^2}{8 \cdot
+                \dot{m}_{in,i} \cdot |\dot{m}_{in,i}| \cdot
+                \frac{v_{in,i} + v_{out,i}}{2}} & |\dot{m}_i| \geq \epsilon
+                \end{cases}
+        """
+        i, o = self.segment_states()
+        res = i[:, 1] - o[:, 1]
+
+        flow = abs(i[:, 0]) >= 1e-4
+        if flow.any():
+            v = (self.segment_props(v_mix_ph, self.inl) + self.segment_props(v_mix_ph, self.outl)) / 2
+            res[flow] = (self.zeta.val[flow] - res[flow] * math.pi ** 2 /
+                         (8 * abs(i[flow, 0]) * i[flow, 0] * v[flow]))
+        return res
+
+    def darcy_func(self):
+        r"""
+        Equations for pressure drop calculation from darcy friction factor.
+
+        Returns
+        -------
+        res : ndarray
+            Residual values of equations.
+
+            .. math::
 
-    def attr(self):
-        return {'Q': dc_cp(),
-                'pr': dc_cp(min_val=1e-4),
-                'zeta': dc_cp(min_val=1e-4),
-                'D': dc_cp(min_val=1e-2, max_val=2, d=1e-3),
-                'L': dc_cp(min_val=1e-1, d=1e-3),
-                'ks': dc_cp(min_val=1e-7, max_val=1e-4, d=1e-8),
-                'E': dc_cp(min_val=0), 'lkf_lin': dc_cp(), 'lkf_quad': dc_cp(),
-                'A': dc_cp(min_val=0), 'Tamb': dc_cp(),
-                'SQ': dc_cp(),
-                'hydro_group': dc_gcp(), 'energy_group': dc_gcp()}
+                Re_i = \frac{4 \cdot |\dot{m}_{in,i}|}{\pi \cdot D_i \cdot
+                \frac{\eta_{in,i}+\eta_{out,i}}{2}}\\
 
-    def inlets(self):
-        return ['in1']
+                0 = p_{in,i} - p_{out,i} - \frac{8 \cdot |\dot{m}_{in,i}| \cdot
+                \dot{m}_{in,i} \cdot \frac{v_{in,i}+v_{out,i}}{2} \cdot L_i \cdot
+                \lambda\left(Re_i, ks_i, D_i\right)}{\pi^2 \cdot D_i^5}\\
 
-    def outlets(self):
-        return ['out1']
+                \eta: \text{dynamic viscosity}\\
+                v: \text{specific volume}\\
+                \lambda: \text{darcy friction factor}
+        """
+        i, o = self.segment_states()
+        res = i[:, 1] - o[:, 1]
 
-    def comp_init(self, nw):
+        flow = abs(i[:, 0]) >= 1e-4
+        if flow.any():
+            visc = (self.segment_props(visc_mix_ph, self.inl) + self.segment_props(visc_mix_ph, self.outl))[flow] / 2
+            v = (self.segment_props(v_mix_ph, self.inl) + self.segment_props(v_mix_ph, self.outl))[flow] / 2
+            res[flow] -= darcy_dp(i[flow, 0], v, visc, self.D.val[flow], self.L.val[flow], self.ks.val[flow])
+        return res
 
-        component.comp_init(self, nw)
+    def darcy_deriv_m(self):
+        r"""
+        Calculates the partial derivatives of the darcy equations to the mass flow.
 
-        self.fl_deriv = self.fluid_deriv()
-        self.m_deriv = self.mass_flow_deriv()
+        Returns
+        -------
+        deriv : ndarray
+            Partial derivatives of the darcy equations to the inlets' mass flow,
+            see :func:`tespy.components.components.heat_exchanger_simple.darcy_deriv_m`.
+        """
+        i, o = self.segment_states()
+        deriv = np.zeros(self.num_seg.val)
 
-        self.Tamb.val_SI = ((self.Tamb.val + nw.T[nw.T_unit][0]) * nw.T[nw.T_unit][1])
+        flow = abs(i[:, 0]) >= 1e-4
+        if flow.any():
+            visc = (self.segment_props(visc_mix_ph, self.inl) + self.segment_props(visc_mix_ph, self.outl))[flow] / 2
+            v = (self.segment_props(v_mix_ph, self.inl) + self.segment_props(v_mix_ph, self.outl))[flow] / 2
+            deriv[flow] = -ddarcy_dp_dm(i[flow, 0], v, visc, self.D.val[flow], self.L.val[flow], self.ks.val[flow])
+        return deriv
 
-        # parameters for hydro group
-        self.hydro_group.set_attr(elements=[self.L, self.ks, self.D])
+    def hw_func(self):
+        r"""
+        Equations for pressure drop calculation from Hazen-Williams equation.
 
-        is_set = True
-        for e in self.hydro_group.elements:
-            if not e.is_set:
-                is_set = False
+        Returns
+        -------
+        res : ndarray
+            Residual values of equations.
 
-        if is_set:
-            self.hydro_group.set_attr(is_set=True)
-        elif self.hydro_group.is_set:
-            msg = ('All parameters of the component group have to be '
-                   'specified! This component group uses the following '
-                   'parameters: L, ks, D at ' + self.label + '. '
-                   'Group will be set to False.')
-            logging.info(msg)
-            self.hydro_group.set_attr(is_set=False)
-        else:
-            self.hydro_group.set_attr(is_set=False)
+            .. math::
 
-        # parameters for kA group
-        self.energy_group.set_attr(elements=[self.E, self.lkf_lin, self.lkf_quad, self.A, self.Tamb])
+                0 = \left(p_{in,i} - p_{out,i} \right) \cdot \left(-1\right)^k -
+                \frac{10.67 \cdot |\dot{m}_{in,i}| ^ {1.852}
+                \cdot L_i}{ks_i^{1.852} \cdot D_i^{4.871}} \cdot g \cdot
+                \left(\frac{v_{in,i} + v_{out,i}}{2}\right)^{0.852}
 
-        is_set = True
-        for e in self.energy_group.elements:
-            if not e.is_set:
-                is_set = False
+                k = \begin{cases}
+                0 & \dot{m}_{in,i} \geq 0\\
+                1 & \dot{m}_{in,i} < 0
+                \end{cases}
 
-        if is_set:
-            self.energy_group.set_attr(is_set=True)
-        elif self.energy_group.is_set:
-            msg = ('All parameters of the component group have to be '
-                   'specified! This component group uses the following '
-                   'parameters: E, lkf_lin, lkf_quad, A, Tamb at ' + self.label
-                   + '. Group will be set to False.')
-            logging.info(msg)
-            self.energy_group.set_attr(is_set=False)
-        else:
-            self.energy_group.set_attr(is_set=False)
+        Note
+        ----
+        Gravity g is set to :math:`9.81 \frac{m}{s^2}`
+        """
+        i, o = self.segment_states()
+        res = i[:, 1] - o[:, 1]
 
-    def additional_equations(self):
+        flow = abs(i[:, 0]) >= 1e-4
+        if flow.any():
+            v = (self.segment_props(v_mix_ph, self.inl) + self.segment_props(v_mix_ph, self.outl))[flow] / 2
+            res[flow] = (res[flow] * np.sign(i[flow, 0]) -
+                         hw_dp(i[flow, 0], v, self.D.val[flow], self.L.val[flow], self.ks.val[flow]))
+        return res
+
+    def kA_func(self):
         r"""
-        Calculates vector vec_res with results of additional equations for this component.
+        Equations for heat transfer calculation from ambient conditions and heat transfer coefficient.
 
-        Equations
+        Returns
+        -------
+        res : ndarray
+            Residual values of equations.
 
-            **optional equations**
+            .. math::
 
-            - :func:`tespy.components.components.solar_collector.energy_func`
+                0 = \dot{m}_{in,i} \cdot \left( h_{out,i} - h_{in,i}\right) +
+                kA_i \cdot \frac{ttd_{1,i} - ttd_{2,i}}{\ln{\frac{ttd_{1,i}}{ttd_{2,i}}}}
+
+                ttd_{1,i} = T_{in,i} - T_{amb,i}\\
+                ttd_{2,i} = T_{out,i} - T_{amb,i}
+        """
+        i, o = self.segment_states()
+
+        ttd_1 = self.segment_props(T_mix_ph, self.inl) - self.Tamb.val_SI
+        ttd_2 = self.segment_props(T_mix_ph, self.outl) - self.Tamb.val_SI
+
+        return i[:, 0] * (o[:, 2] - i[:, 2]) + self.kA.val * td_log(ttd_1, ttd_2)
+
+    def bus_func(self, bus):
+        r"""
+        Calculates the residual value of the bus function.
+
+        Parameters
+        ----------
+        bus : tespy.connections.bus
+            TESPy bus object.
 
         Returns
         -------
-        vec_res : list
-            Vector of residual values.
-        """
-        vec_res = []
+        val : float
+            Residual value of equation.
 
-        ######################################################################
-        # equation for specified energy-group paremeters
-        if self.energy_group.is_set:
-            vec_res += [self.energy_func()]
+            .. math::
 
-        return vec_res
+                val = P \cdot f\left( \frac{P}{P_{ref}}\right)
 
-    def additional_derivatives(self):
+                P = \sum_i \dot{m}_{in,i} \cdot \left( h_{out,i} - h_{in,i} \right)
+        """
+        i, o = self.segment_states()
+
+        val = np.sum(i[:, 0] * (o[:, 2] - i[:, 2]))
+        if np.isnan(bus.P_ref):
+            expr = 1
+        else:
+            expr = abs(val / bus.P_ref)
+        return val * bus.char.f_x(expr)
+
+    def bus_deriv(self, bus):
         r"""
-        Calculates matrix of partial derivatives for given additional equations.
+        Calculates the matrix of partial derivatives of the bus function.
+
+        Parameters
+        ----------
+        bus : tespy.connections.bus
+            TESPy bus object.
 
         Returns
         -------
         mat_deriv : ndarray
             Matrix of partial derivatives.
         """
-        mat_deriv = []
+        n = self.num_seg.val
+        deriv = np.zeros((1, 2 * n, self.num_fl + 3))
+        for k in range(n):
+            deriv[0, k, 0] = self.numeric_deriv(self.bus_func, 'm', k, bus=bus)
+            deriv[0, k, 2] = self.numeric_deriv(self.bus_func, 'h', k, bus=bus)
+            deriv[0, k + n, 2] = self.numeric_deriv(self.bus_func, 'h', k + n, bus=bus)
+        return deriv
 
-        ######################################################################
-        # derivatives for specified energy-group paremeters
-        if self.energy_group.is_set:
-            deriv = np.zeros((1, 2 + self.num_vars, self.num_fl + 3))
-            deriv[0, 0, 0] = self.outl[0].h.val_SI - self.inl[0].h.val_SI
-            for i in range(2):
-                deriv[0, i, 1] = self.numeric_deriv(self.energy_func, 'p', i)
-                deriv[0, i, 2] = self.numeric_deriv(self.energy_func, 'h', i)
-            # custom variables for the energy-group
-            for var in self.energy_group.elements:
-                if var.is_var:
-                    deriv[0, 2 + var.var_pos, 0] = self.numeric_deriv(self.energy_func, self.vars[var], i)
-            mat_deriv += deriv.tolist()
+    def initialise_source(self, c, key):
+        r"""
+        Returns a starting value for pressure and enthalpy at component's outlet.
 
-        return mat_deriv
+        Parameters
+        ----------
+        c : tespy.connections.connection
+            Connection to perform initialisation on.
 
-    def energy_func(self):
-        r"""
-        Equation for solar collector energy balance.
+        key : str
+            Fluid property to retrieve.
 
         Returns
         -------
-        res : float
-            Residual value of equation.
+        val : float
+            Starting value for pressure/enthalpy in SI units, see
+            :func:`tespy.components.components.heat_exchanger_simple.initialise_source`.
+        """
+        if key == 'p':
+            return 1e5
+        elif key == 'h':
+            Q = self.segment_array(self.Q.val, 'Q')[int(c.s_id[3:]) - 1]
+            if Q < 0 and self.Q.is_set:
+                return 1e5
+            elif Q > 0 and self.Q.is_set:
+                return 5e5
+            else:
+                return 3e5
 
-            .. math::
+    def initialise_target(self, c, key):
+        r"""
+        Returns a starting value for pressure and enthalpy at component's inlet.
 
-                T_m = \frac{T_{out} + T_{in}}{2}\\
+        Parameters
+        ----------
+        c : tespy.connections.connection
+            Connection to perform initialisation on.
 
-                0 = \dot{m} \cdot \left( h_{out} - h_{in} \right) -
-                A \cdot \left\{E - \left(T_m - T_{amb} \right) \cdot
-                \left[ \alpha_1 + \alpha_2 \cdot A \cdot \left(\
-                T_m - T_{amb}\right) \right] \right\}
+        key : str
+            Fluid property to retrieve.
+
+        Returns
+        -------
+        val : float
+            Starting value for pressure/enthalpy in SI units, see
+            :func:`tespy.components.components.heat_exchanger_simple.initialise_target`.
         """
+        if key == 'p':
+            return 1e5
+        elif key == 'h':
+            Q = self.segment_array(self.Q.val, 'Q')[int(c.t_id[2:]) - 1]
+            if Q < 0 and self.Q.is_set:
+                return 5e5
+            elif Q > 0 and self.Q.is_set:
+                return 1e5
+            else:
+                return 3e5
 
-        i = self.inl[0].to_flow()
-        o = self.outl[0].to_flow()
+    def set_parameters(self, mode, data):
+        r"""
+        Set or unset design values of component parameters.
 
-        T_m = (T_mix_ph(i) + T_mix_ph(o)) / 2
+        Parameters
+        ----------
+        mode : str
+            Setting component design values for :code:`mode='offdesign'` and unsetting them for :code:`mode='design'`.
 
-        return (i[0] * (o[2] - i[2]) - self.A.val * (self.E.val - (T_m - self.Tamb.val_SI) *
-                (self.lkf_lin.val + self.lkf_quad.val * self.A.val * (T_m - self.Tamb.val_SI))))
+        df : pandas.core.series.Series
+            Series containing the component parameters.
+        """
+        component.set_parameters(self, mode, data)
+
+        if mode == 'offdesign':
+            for key in self.segment_attr():
+                self.get_attr(key).design = self.segment_array(self.get_attr(key).design, key)
 
     def calc_parameters(self, mode):
         r"""
@@ -7775,13 +8892,21 @@ class solar_collector(heat_exchanger_simple):
         component.calc_parameters(self, mode)
 
         if mode == 'post':
-            i = self.inl[0].to_flow()
-            o = self.outl[0].to_flow()
+            i, o = self.segment_states()
+            v = (self.segment_props(v_mix_ph, self.inl) + self.segment_props(v_mix_ph, self.outl)) / 2
 
-            self.SQ.val = i[0] * (s_mix_ph(o) - s_mix_ph(i))
-            self.Q.val = i[0] * (o[2] - i[2])
-            self.pr.val = o[1] / i[1]
-            self.zeta.val = ((i[1] - o[1]) * math.pi ** 2 / (8 * i[0] ** 2 * (v_mix_ph(i) + v_mix_ph(o)) / 2))
+            self.SQ1.val = i[:, 0] * (self.segment_props(s_mix_ph, self.outl) - self.segment_props(s_mix_ph, self.inl))
+            self.Q.val = i[:, 0] * (o[:, 2] - i[:, 2])
+            self.pr.val = o[:, 1] / i[:, 1]
+            self.zeta.val = (i[:, 1] - o[:, 1]) * math.pi ** 2 / (8 * i[:, 0] ** 2 * v)
+
+            if self.Tamb.is_set:
+                self.SQ2.val = -self.Q.val / self.Tamb.val_SI
+                self.Sirr.val = self.SQ1.val + self.SQ2.val
+
+                ttd_1 = self.segment_props(T_mix_ph, self.inl) - self.Tamb.val_SI
+                ttd_2 = self.segment_props(T_mix_ph, self.outl) - self.Tamb.val_SI
+                self.kA.val = abs(self.Q.val / td_log(ttd_1, ttd_2))
 
 # %%
 
@@ -7923,6 +9048,7 @@ class heat_exchanger(component):
     def component(self):
         return 'heat exchanger'
 
+    @schema
     def attr(self):
         # derivatives for logarithmic temperature difference not implemented
         return {'Q': dc_cp(), 'kA': dc_cp(), 'td_log': dc_cp(),
@@ -7940,12 +9066,23 @@ class heat_exchanger(component):
     def outlets(self):
         return ['out1', 'out2']
 
+    def fluid_passthrough(self):
+        return {'target': {i: [o] for i, o in zip(self.inlets(), self.outlets())},
+                'source': {o: [i] for i, o in zip(self.inlets(), self.outlets())}}
+
     def comp_init(self, nw):
 
         component.comp_init(self, nw)
 
         self.fl_deriv = self.fluid_deriv()
         self.m_deriv = self.mass_flow_deriv()
+        self.pr1_deriv = self.pressure_ratio_deriv(self.pr1, 0, 0)
+        self.pr2_deriv = self.pressure_ratio_deriv(self.pr2, 1, 1)
+
+    def num_eq(self):
+        return 2 * self.num_fl + 3 + [
+                self.Q.is_set, self.kA.is_set, self.ttd_u.is_set, self.ttd_l.is_set,
+                self.pr1.is_set, self.pr2.is_set, self.zeta1.is_set, self.zeta2.is_set].count(True)
 
     def equations(self):
         r"""
@@ -8027,6 +9164,27 @@ class heat_exchanger(component):
         """
         return []
 
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        n = len(self.fl_deriv) + len(self.m_deriv)
+        rows = list(range(n))
+        # energy balance and heat transfer equations
+        n += 1 + [self.Q.is_set, self.kA.is_set, self.ttd_u.is_set, self.ttd_l.is_set].count(True)
+        for pr in [self.pr1, self.pr2]:
+            if pr.is_set:
+                if not pr.is_var:
+                    rows += [n]
+                n += 1
+        return rows
+
     def derivatives(self):
         r"""
         Calculates matrix of partial derivatives for given equations.
@@ -8082,18 +9240,12 @@ class heat_exchanger(component):
         ######################################################################
         # derivatives for specified pressure ratio at hot side
         if self.pr1.is_set:
-            pr1_deriv = np.zeros((1, 4, self.num_fl + 3))
-            pr1_deriv[0, 0, 1] = self.pr1.val
-            pr1_deriv[0, 2, 1] = -1
-            mat_deriv += pr1_deriv.tolist()
+            mat_deriv += self.pr1_deriv
 
         ######################################################################
         # derivatives for specified pressure ratio at cold side
         if self.pr2.is_set:
-            pr2_deriv = np.zeros((1, 4, self.num_fl + 3))
-            pr2_deriv[0, 1, 1] = self.pr2.val
-            pr2_deriv[0, 3, 1] = -1
-            mat_deriv += pr2_deriv.tolist()
+            mat_deriv += self.pr2_deriv
 
         ######################################################################
         # derivatives for specified zeta at hot side
@@ -8838,6 +9990,7 @@ class condenser(heat_exchanger):
     def component(self):
         return 'condenser'
 
+    @schema
     def attr(self):
         return {'Q': dc_cp(), 'kA': dc_cp(), 'td_log': dc_cp(),
                 'kA_char1': dc_cc(method='COND_HOT', param='m'),
@@ -8848,6 +10001,9 @@ class condenser(heat_exchanger):
                 'SQ1': dc_cp(), 'SQ2': dc_cp(), 'Sirr': dc_cp(),
                 'zero_flag': dc_cp()}
 
+    def num_eq(self):
+        return heat_exchanger.num_eq(self) + 1
+
     def additional_equations(self):
         r"""
         Calculates vector vec_res with results of additional equations for this component.
@@ -9159,6 +10315,9 @@ class desuperheater(heat_exchanger):
     def component(self):
         return 'desuperheater'
 
+    def num_eq(self):
+        return heat_exchanger.num_eq(self) + 1
+
     def additional_equations(self):
         r"""
         Calculates vector vec_res with results of additional equations for this component.
@@ -9331,6 +10490,10 @@ class drum(component):
     def outlets(self):
         return ['out1', 'out2']
 
+    def fluid_passthrough(self):
+        return {'target': {i: self.outlets() for i in self.inlets()},
+                'source': {o: self.inlets() for o in self.outlets()}}
+
     def comp_init(self, nw):
 
         component.comp_init(self, nw)
@@ -9339,6 +10502,9 @@ class drum(component):
         self.m_deriv = self.mass_flow_deriv()
         self.p_deriv = self.pressure_deriv()
 
+    def num_eq(self):
+        return 2 * self.num_fl + 7
+
     def equations(self):
         r"""
         Calculates vector vec_res with results of equations for this component.
@@ -9380,6 +10546,18 @@ class drum(component):
 
         return vec_res
 
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        return list(range(len(self.fl_deriv) + len(self.m_deriv) + len(self.p_deriv)))
+
     def derivatives(self):
         r"""
         Calculates matrix of partial derivatives for given equations.
@@ -9627,6 +10805,7 @@ class subsys_interface(component):
     def component(self):
         return 'subsystem interface'
 
+    @schema
     def attr(self):
         return {'num_inter': dc_cp(printout=False)}
 
@@ -9642,6 +10821,10 @@ class subsys_interface(component):
         else:
             return ['out1']
 
+    def fluid_passthrough(self):
+        return {'target': {i: [o] for i, o in zip(self.inlets(), self.outlets())},
+                'source': {o: [i] for i, o in zip(self.inlets(), self.outlets())}}
+
     def comp_init(self, nw):
 
         component.comp_init(self, nw)
@@ -9652,6 +10835,9 @@ class subsys_interface(component):
         self.p_deriv = self.inout_deriv(1)
         self.h_deriv = self.inout_deriv(2)
 
+    def num_eq(self):
+        return self.num_i * (self.num_fl + 3)
+
     def equations(self):
         r"""
         Calculates vector vec_res with results of equations for this component.
@@ -9688,6 +10874,19 @@ class subsys_interface(component):
 
         return vec_res
 
+    def constant_rows(self):
+        r"""
+        Returns the rows of the component's equations with constant partial
+        derivatives.
+
+        Returns
+        -------
+        rows : list
+            Indices of the rows in the matrix of partial derivatives.
+        """
+        return list(range(len(self.fl_deriv) + len(self.m_deriv) +
+                          len(self.p_deriv) + len(self.h_deriv)))
+
     def derivatives(self):
         r"""
         Calculates matrix of partial derivatives for given equations.
@@ -8,9 +8,12 @@
 """
 
 import numpy as np
+from numpy.linalg import norm
+from scipy.linalg import qr
 import logging
 
 from tespy import networks as nwk
+from tespy.tools import helpers as hlp
 from tespy.connections import connection, ref
 from tespy.components import components as cmp
 
@@ -168,6 +171,489 @@ class subsystem:
     def get_network(self):
         return self.nw
 
+    def compile(self):
+        r"""
+        Compiles the subsystem into a macro component.
+
+        Returns
+        -------
+        macro : tespy.components.subsystems.subsys_macro
+            Macro component with the subsystem's interfaces as inlets and
+            outlets. Add the connections of the macro to your network instead of
+            the subsystem.
+        """
+        return subsys_macro(self.label, self)
+
+# %%
+
+
+class subsys_macro(cmp.component):
+    r"""
+    The subsystem macro is a component representing a condensed subsystem.
+
+    Equations
+
+        The equations of the subsystem's components and connections are
+        condensed to equations of the macro's inlets and outlets, see
+        :func:`tespy.components.subsystems.subsys_macro.equations`.
+
+    Inlets/Outlets
+
+        - in1, in2, ..., in{num_i} of the subsystem's inlet interface
+        - out1, out2, ..., out{num_o} of the subsystem's outlet interface
+
+    Parameters
+    ----------
+    label : str
+        The label of the component.
+
+    subsys : tespy.components.subsystems.subsystem
+        The subsystem represented by the macro.
+
+    Note
+    ----
+    The variables of the subsystem's internal connections (and custom variables
+    of its components) do not appear in the network's system of equations. In every
+    iteration the jacobian of the subsystem's equations
+
+    .. math::
+
+        J = \begin{pmatrix} A_I & B_I \\ A_R & B_R \end{pmatrix}
+
+    is partitioned into the partial derivatives to the internal variables
+    (:math:`A`) and to the variables of the macro's inlets and outlets
+    (:math:`B`). The rows :math:`I` are chosen in a way, that :math:`A_I` is
+    regular. The internal variables are eliminated (static condensation) and
+    the remaining equations are passed to the network:
+
+    .. math::
+
+        0 = r_R - A_R \cdot A_I^{-1} \cdot r_I\\
+
+        \frac{\partial r}{\partial x} = B_R - A_R \cdot A_I^{-1} \cdot B_I
+
+    After the network's newton step the increment of the internal variables is
+    calculated by back substitution. The row partition is stored and only
+    recalculated, if the pattern of nonzero partial derivatives changes.
+
+    Subsystem macros are available for design calculations only. It is not
+    possible to connect the macro's ports to a bus.
+
+    Example
+    -------
+    A preheater with desuperheater and condensate valve is compiled into a
+    macro component. The results are identical to the results of the expanded
+    subsystem.
+
+    >>> from tespy import cmp, con, nwk, subsys
+    >>> fluids = ['water']
+    >>> nw = nwk.network(fluids=fluids, T_unit='C', p_unit='bar',
+    ...     h_unit='kJ / kg')
+    >>> nw.set_printoptions(print_level='none')
+    >>> steam = cmp.source('steam')
+    >>> cond = cmp.sink('condensate')
+    >>> fw_in = cmp.source('feed water inlet')
+    >>> fw_out = cmp.sink('feed water outlet')
+    >>> ph = subsys.ph_desup_cond('preheater', ttd=5, pr1_desup=0.99,
+    ...     pr2_desup=0.99, pr1_cond=0.99, pr2_cond=0.99)
+    >>> macro = ph.compile()
+    >>> macro.component()
+    'subsystem macro'
+    >>> st_ph = con.connection(steam, 'out1', macro, 'in1')
+    >>> ph_cd = con.connection(macro, 'out1', cond, 'in1')
+    >>> fw_ph = con.connection(fw_in, 'out1', macro, 'in2')
+    >>> ph_fw = con.connection(macro, 'out2', fw_out, 'in1')
+    >>> nw.add_conns(st_ph, ph_cd, fw_ph, ph_fw)
+    >>> st_ph.set_attr(fluid={'water': 1}, p=10, T=250)
+    >>> ph_cd.set_attr(p=1)
+    >>> fw_ph.set_attr(fluid={'water': 1}, m=10, p=60, T=80)
+    >>> nw.solve('design')
+    >>> round(st_ph.m.val, 3)
+    1.99
+    >>> round(ph.condenser.Q.val / 1e3, 1)
+    -4015.1
+    >>> round(ph.desup.Q.val / 1e3, 1)
+    -331.1
+    >>> round(ph_fw.T.val, 1)
+    182.0
+    """
+
+    def __init__(self, label, subsys, **kwargs):
+
+        self.subsys = subsys
+        self.sub = None
+        cmp.component.__init__(self, label, **kwargs)
+
+    def component(self):
+        return 'subsystem macro'
+
+    def inlets(self):
+        return self.subsys.inlet.inlets()
+
+    def outlets(self):
+        return self.subsys.outlet.outlets()
+
+    def fluid_passthrough(self):
+        # fluids are propagated through the subsystem in initialise_fluids
+        return {'target': {}, 'source': {}}
+
+    def comp_init(self, nw):
+
+        if nw.mode == 'offdesign':
+            msg = ('Subsystem macros are available for design calculations only, '
+                   'please add the subsystem ' + self.subsys.label + ' to the '
+                   'network instead of its macro (' + self.label + ').')
+            logging.error(msg)
+            raise hlp.TESPyComponentError(msg)
+
+        cmp.component.comp_init(self, nw)
+
+        if self.sub is None or self.sub.fluids != nw.fluids:
+            # network of the subsystem, the interfaces are connected to proxies
+            # of the macro's inlets and outlets
+            self.sub = nwk.network(fluids=nw.fluids, m_unit=nw.m_unit,
+                                   p_unit=nw.p_unit, h_unit=nw.h_unit,
+                                   T_unit=nw.T_unit, v_unit=nw.v_unit)
+            self.sub.set_printoptions(print_level='none')
+
+            self.proxies = []
+            for port in self.inlets():
+                self.proxies += [connection(
+                    cmp.source(self.label + '_' + port), 'out1',
+                    self.subsys.inlet, port)]
+            for port in self.outlets():
+                self.proxies += [connection(
+                    self.subsys.outlet, port,
+                    cmp.sink(self.label + '_' + port), 'in1')]
+
+            self.sub.add_conns(*(self.subsys.conns + self.proxies))
+            self.sub.check_network()
+
+        self.sub.p_range_SI = nw.p_range_SI
+        self.sub.h_range_SI = nw.h_range_SI
+        self.sub.T_range_SI = nw.T_range_SI
+        self.sub.mode = 'design'
+        self.sub.init_path = None
+        self.sub.design_path = None
+        self.sub.init = None
+        self.sub.design = None
+
+        self.sub_init = False
+        self.lin = None
+        self.partition = None
+
+    def init_subsystem(self):
+        r"""
+        Initialises the subsystem's network and the partitioning of its variables.
+
+        Note
+        ----
+        The proxies of the macro's inlets and outlets hold the macro's connection
+        values. Their fluid composition is used as starting point of the fluid
+        propagation in the subsystem.
+        """
+        for c, proxy in zip(self.inl + self.outl, self.proxies):
+            proxy.fluid.val = c.fluid.val.copy()
+            proxy.fluid.val0 = c.fluid.val.copy()
+            proxy.fluid.val_set = c.fluid.val_set.copy()
+            if c in self.inl:
+                for fluid in proxy.fluid.val_set.keys():
+                    proxy.fluid.val_set[fluid] = True
+
+        self.sub.init_design()
+
+        for proxy in self.proxies:
+            for fluid in proxy.fluid.val_set.keys():
+                proxy.fluid.val_set[fluid] = False
+
+        self.sub.iter = 0
+        self.sub.num_conn_vars = self.num_fl + 3
+        self.sub.solve_determination()
+        self.sub.init_jacobian()
+
+        # columns of the macro's inlet and outlet variables and of the internal variables
+        self.ext_cols = np.concatenate([
+                np.arange(self.sub.num_conn_vars) + self.sub.conns.index.get_loc(c) * self.sub.num_conn_vars
+                for c in self.proxies])
+        self.int_cols = np.setdiff1d(np.arange(self.sub.num_vars), self.ext_cols)
+
+        self.num_cond_eq = self.sub.mat_deriv_const.shape[0] - len(self.int_cols)
+        if self.num_cond_eq < 0:
+            msg = ('The subsystem ' + self.subsys.label + ' is overdetermined: ' +
+                   str(len(self.int_cols)) + ' internal variables, ' +
+                   str(self.sub.mat_deriv_const.shape[0]) + ' equations.')
+            logging.error(msg)
+            raise hlp.TESPyComponentError(msg)
+
+        self.sub_init = True
+
+    def ext_state(self):
+        r"""
+        Returns the variables of the macro's inlets and outlets.
+
+        Returns
+        -------
+        x : ndarray
+            Mass flow, pressure, enthalpy and fluid composition of the inlets
+            and outlets.
+        """
+        return np.concatenate([
+                [c.m.val_SI, c.p.val_SI, c.h.val_SI] + list(c.fluid.val.values())
+                for c in self.inl + self.outl])
+
+    def solve_subsystem(self):
+        r"""
+        Calculates residual values and jacobian of the subsystem's network.
+
+        Returns
+        -------
+        r : ndarray
+            Residual values of the subsystem's equations.
+
+        A : ndarray
+            Partial derivatives to the internal variables.
+
+        B : ndarray
+            Partial derivatives to the variables of the macro's inlets and outlets.
+        """
+        for c, proxy in zip(self.inl + self.outl, self.proxies):
+            proxy.m.val_SI = c.m.val_SI
+            proxy.p.val_SI = c.p.val_SI
+            proxy.h.val_SI = c.h.val_SI
+            for fluid, x in c.fluid.val.items():
+                proxy.fluid.val[fluid] = x
+
+        self.sub.vec_res = np.zeros(self.sub.mat_deriv_const.shape[0])
+        self.sub.mat_deriv = self.sub.mat_deriv_const.copy()
+        self.sub.solve_connections()
+        self.sub.solve_components()
+
+        return (self.sub.vec_res, self.sub.mat_deriv[:, self.int_cols],
+                self.sub.mat_deriv[:, self.ext_cols])
+
+    def row_partition(self, A, update=False):
+        r"""
+        Returns the rows of the subsystem's equations to eliminate the internal variables with.
+
+        Parameters
+        ----------
+        A : ndarray
+            Partial derivatives to the internal variables.
+
+        update : boolean
+            Calculate a new partition instead of looking up the stored partition.
+
+        Returns
+        -------
+        rows : list
+            Rows I (regular block :math:`A_I`) and remaining rows R.
+
+        Note
+        ----
+        The partition is calculated from a QR decomposition with column pivoting of
+        :math:`A^T`. The macro stores the partition together with the pattern of
+        nonzero partial derivatives it was calculated for.
+        """
+        pattern = A != 0
+        if (update or self.partition is None or
+                not np.array_equal(self.partition[0], pattern)):
+            piv = qr(A.T, mode='r', pivoting=True)[1]
+            n = A.shape[1]
+            self.partition = [pattern, np.sort(piv[:n]), np.sort(piv[n:])]
+
+        return self.partition[1:]
+
+    def back_substitution(self):
+        r"""
+        Calculates the increment of the internal variables from the increment of
+        the macro's inlet and outlet variables.
+
+        .. math::
+
+            \Delta x_{int} = -A_I^{-1} \cdot r_I - A_I^{-1} \cdot B_I \cdot \Delta x_{ext}
+        """
+        x, y_r, Y_B = self.lin
+        dx = self.ext_state() - x
+
+        self.sub.vec_z = np.zeros(self.sub.num_vars)
+        self.sub.vec_z[self.int_cols] = -y_r - Y_B.dot(dx)
+        self.sub.vec_z[self.ext_cols] = dx
+        self.sub.solve_increment()
+        self.sub.iter += 1
+
+        self.lin = None
+
+    def apply_increment(self):
+        r"""
+        Updates the internal variables by back substitution after the
+        network's newton step.
+        """
+        if self.lin is not None:
+            self.back_substitution()
+
+    def num_eq(self):
+        if not self.sub_init:
+            self.init_subsystem()
+        return self.num_cond_eq
+
+    def equations(self):
+        r"""
+        Calculates vector vec_res with results of equations for this component.
+
+        Returns
+        -------
+        vec_res : list
+            Vector of residual values.
+
+            .. math::
+
+                0 = r_R - A_R \cdot A_I^{-1} \cdot r_I
+
+        Note
+        ----
+        The method does not change the internal variables. The linearisation
+        of the last call is used to update the internal variables after the
+        network's newton step, see
+        :func:`tespy.components.subsystems.subsys_macro.apply_increment`.
+        """
+        if not self.sub_init:
+            self.init_subsystem()
+
+        r, A, B = self.solve_subsystem()
+        I, R = self.row_partition(A)
+        rhs = np.column_stack([r[I], B[I]])
+        try:
+            X = np.linalg.solve(A[I], rhs)
+        except np.linalg.LinAlgError:
+            I, R = self.row_partition(A, update=True)
+            rhs = np.column_stack([r[I], B[I]])
+            X = np.linalg.lstsq(A[I], rhs, rcond=None)[0]
+
+        self.lin = [self.ext_state(), X[:, 0], X[:, 1:]]
+        self.mat_cond = B[R] - A[R].dot(X[:, 1:])
+
+        return (r[R] - A[R].dot(X[:, 0])).tolist()
+
+    def derivatives(self):
+        r"""
+        Calculates matrix of partial derivatives for given equations.
+
+        Returns
+        -------
+        mat_deriv : ndarray
+            Matrix of partial derivatives.
+
+            .. math::
+
+                \frac{\partial r}{\partial x} = B_R - A_R \cdot A_I^{-1} \cdot B_I
+        """
+        return self.mat_cond.reshape(self.num_cond_eq, self.num_i + self.num_o, self.num_fl + 3)
+
+    def initialise_fluids(self, nw):
+        r"""
+        Propagates the fluid composition through the subsystem to the macro's outlets.
+
+        Parameters
+        ----------
+        nw : tespy.networks.network
+            Network using the macro.
+        """
+        if self.sub_init:
+            return
+
+        self.init_subsystem()
+        for c, proxy in zip(self.outl, self.proxies[self.num_i:]):
+            for fluid, x in proxy.fluid.val.items():
+                if not c.fluid.val_set[fluid]:
+                    c.fluid.val[fluid] = x
+            nw.init_target(c)
+
+    def initialise_source(self, c, key):
+        r"""
+        Returns a starting value for pressure and enthalpy at component's outlet.
+
+        Parameters
+        ----------
+        c : tespy.connections.connection
+            Connection to perform initialisation on.
+
+        key : str
+            Fluid property to retrieve.
+
+        Returns
+        -------
+        val : float
+            Starting value for pressure/enthalpy in SI units, value of the
+            subsystem's connection at the respective outlet interface.
+        """
+        if not self.sub_init:
+            self.init_subsystem()
+        inner = self.sub.comps.loc[self.subsys.outlet].i[self.outl.index(c)]
+        return inner.get_attr(key).val_SI
+
+    def initialise_target(self, c, key):
+        r"""
+        Returns a starting value for pressure and enthalpy at component's inlet.
+
+        Parameters
+        ----------
+        c : tespy.connections.connection
+            Connection to perform initialisation on.
+
+        key : str
+            Fluid property to retrieve.
+
+        Returns
+        -------
+        val : float
+            Starting value for pressure/enthalpy in SI units, value of the
+            subsystem's connection at the respective inlet interface.
+        """
+        if not self.sub_init:
+            self.init_subsystem()
+        inner = self.sub.comps.loc[self.subsys.inlet].o[self.inl.index(c)]
+        return inner.get_attr(key).val_SI
+
+    def calc_parameters(self, mode):
+        r"""
+        Post and preprocessing parameter calculation/specification.
+
+        Parameters
+        ----------
+
+        mode : str
+            Pre- or postprocessing calculation.
+
+        Note
+        ----
+        In postprocessing the last increment is applied to the internal variables.
+        Remaining residuals of the subsystem's equations are eliminated with the
+        macro's inlets and outlets fixed before the postprocessing of the subsystem's
+        network.
+        """
+        cmp.component.calc_parameters(self, mode)
+
+        if mode == 'post':
+            if self.lin is not None:
+                self.back_substitution()
+
+            for i in range(10):
+                r, A, B = self.solve_subsystem()
+                if norm(r) < hlp.err ** (1 / 2):
+                    break
+                self.sub.vec_z = np.zeros(self.sub.num_vars)
+                self.sub.vec_z[self.int_cols] = -np.linalg.lstsq(A, r, rcond=None)[0]
+                self.sub.solve_increment()
+            else:
+                r = self.solve_subsystem()[0]
+                if norm(r) >= hlp.err ** (1 / 2):
+                    msg = ('The equations of the subsystem ' + self.subsys.label +
+                           ' did not converge in postprocessing. Residual value is {:.2e}'.format(norm(r)) + '.')
+                    logging.warning(msg)
+
+            self.sub.post_processing()
+
+
 # %%
 
 
@@ -12,7 +12,8 @@ import pandas as pd
 
 import logging
 
-from tespy.tools.helpers import (TESPyConnectionError, data_container, dc_prop, dc_flu, dc_cp)
+from tespy.tools.helpers import (TESPyConnectionError, data_container, dc_prop, dc_flu, dc_cp, schema,
+                                 fluid_registry, register_fluids)
 from tespy.components import components as cmp
 from tespy.components import characteristics as cmp_char
 
@@ -144,10 +145,8 @@ class connection:
         self.offdesign = []
 
         # set default values for kwargs
-        var = self.attr()
-
-        for key in self.attr().keys():
-            self.__dict__.update({key: var[key]})
+        for key, dc in self.attr().items():
+            self.__dict__.update({key: dc.copy()})
 
         self.set_attr(**kwargs)
 
@@ -328,6 +327,21 @@ class connection:
             logging.error(msg)
             raise KeyError(msg)
 
+    def __getstate__(self):
+        r"""
+        Returns the connection's state for pickling, see
+        :func:`tespy.networks.network.__getstate__`.
+        """
+        state = self.__dict__.copy()
+        state['custom_fluids'] = fluid_registry(self.fluid.val.keys())
+        return state
+
+    def __setstate__(self, state):
+        custom = state.pop('custom_fluids', None)
+        self.__dict__.update(state)
+        register_fluids(list(self.fluid.val.keys()), custom)
+
+    @schema
     def attr(self):
         r"""
         Returns the list of available attributes of a connection.
@@ -7,10 +7,13 @@
 .. moduleauthor:: Francesco Witte <francesco.witte@hs-flensburg.de>
 """
 
+import numpy as np
 import pandas as pd
 from tespy import cmp, con, nwk, hlp, cmp_char
 import os
 import ast
+import collections
+import collections.abc
 import logging
 
 # %% network loading
@@ -46,6 +49,9 @@ def load_nwk(path):
     - conns.csv
     - netw.csv
 
+    Networks saved with :code:`nw.save(path, fmt='npz')` are loaded from the
+    binary file network.npz in the path instead.
+
     The imported network has the following additional features:
 
     - Connections are accessible by their target's label and id, e. g. for a connection going to 'condenser' at inlet 'in2' use :code:`myimportednetwork.imp_conns['condenser:in2']`.
@@ -121,115 +127,208 @@ def load_nwk(path):
     msg = 'Reading network data from base path ' + path + '.'
     logging.info(msg)
 
+    if os.path.isfile(path + '/network.npz'):
+        tables = hlp.load_npz(path + '/network.npz')
+        msg = 'Reading network data from ' + path + '/network.npz.'
+        logging.debug(msg)
+    else:
+        tables = load_csv(path)
+
+    # characteristic lines and maps by identifier
+    chars = construct_chars(tables['comps/char'], ['x', 'y'])
+    char_maps = construct_chars(tables['comps/char_map'],
+                                ['x', 'y', 'z1', 'z2'])
+
+    # create components
+    comps = collections.OrderedDict()
+    nw_busses = []
+    inter = {}
+    for name, df in tables.items():
+        if (name.startswith('comps/') and
+                name not in ['comps/bus', 'comps/char', 'comps/char_map']):
+            for c in df.to_dict('records'):
+                c['instance'] = construct_comps(c, chars, char_maps)
+                comps[c['label']] = c['instance']
+                if len(c['busses']) > 0:
+                    nw_busses += [c]
+                if get_interface(c):
+                    inter[c['label']] = c['instance']
+
+    msg = 'Created network components.'
+    logging.info(msg)
+
+    # create network
+    nw = construct_network(tables['netw'])
+
+    # make interfaces and components accessible by labels
+    nw.imp_comps = comps
+    nw.inter = inter
+
+    # create connections
+    conns = tables['conn'].to_dict('records')
+    if 'conn_fluid' in tables:
+        compositions = nwk.network.read_compositions(tables['conn_fluid'])
+    else:
+        compositions = None
+    instances = collections.OrderedDict()
+    for c in conns:
+        instances[c['id']] = construct_conns(c, comps, nw, compositions)
+
+    # set references by connection id
+    for c in conns:
+        conns_set_ref(c, instances)
+
+    nw.imp_conns = {}
+    # add connections to network
+    nw.add_conns(*instances.values())
+    for c in instances.values():
+        nw.imp_conns[c.t.label + ':' + c.t_id] = c
+
+    msg = 'Created connections.'
+    logging.info(msg)
+
+    # create busses
+    busses = tables['comps/bus']
+    nw.imp_busses = {}
+    if len(busses) > 0:
+        for c in busses.to_dict('records'):
+            nw.imp_busses[c['label']] = construct_busses(c)
+
+        # add components to busses, busses share characteristic lines
+        bus_chars = {}
+        for c in nw_busses:
+            busses_add_comps(c, nw.imp_busses, chars, bus_chars)
+
+        # add busses to network
+        nw.add_busses(*nw.imp_busses.values())
+
+        msg = 'Created busses.'
+        logging.info(msg)
+
+    msg = 'Created network.'
+    logging.info(msg)
+    return nw
+
+
+def load_csv(path):
+    r"""
+    Reads the .csv-files of a saved network.
+
+    Parameters
+    ----------
+    path : str
+        The path to the network data.
+
+    Returns
+    -------
+    tables : collections.OrderedDict
+        Dataframes of the network data, the keys are the file names relative
+        to the path without extension, e. g. 'conn' or 'comps/pump'.
+    """
+    tables = collections.OrderedDict()
+
+    # load network properties
+    fn = path + '/netw.csv'
+    tables['netw'] = pd.read_csv(fn, sep=';', decimal='.',
+                                 converters={'fluids': ast.literal_eval})
+    msg = 'Reading network properties from ' + fn + '.'
+    logging.debug(msg)
+
     # load characteristics
     fn = path + '/comps/char.csv'
-    chars = pd.read_csv(fn, sep=';', decimal='.',
-                        converters={'x': ast.literal_eval,
-                                    'y': ast.literal_eval})
+    tables['comps/char'] = pd.read_csv(fn, sep=';', decimal='.',
+                                       converters={'x': ast.literal_eval,
+                                                   'y': ast.literal_eval})
     msg = 'Reading characteristic lines data from ' + fn + '.'
     logging.debug(msg)
 
     # load characteristic maps
     fn = path + '/comps/char_map.csv'
-    char_maps = pd.read_csv(fn, sep=';', decimal='.',
-                            converters={'x': ast.literal_eval,
-                                        'y': ast.literal_eval,
-                                        'z1': ast.literal_eval,
-                                        'z2': ast.literal_eval})
+    tables['comps/char_map'] = pd.read_csv(fn, sep=';', decimal='.',
+                                           converters={'x': ast.literal_eval,
+                                                       'y': ast.literal_eval,
+                                                       'z1': ast.literal_eval,
+                                                       'z2': ast.literal_eval})
     msg = 'Reading characteristic maps data from ' + fn + '.'
     logging.debug(msg)
 
     # load components
-    comps = pd.DataFrame()
-    inter = pd.DataFrame()
-
     files = os.listdir(path + '/comps/')
     for f in files:
         if f != 'bus.csv' and f != 'char.csv' and f != 'char_map.csv':
             fn = path + '/comps/' + f
-            df = pd.read_csv(fn, sep=';', decimal='.',
-                             converters={'design': ast.literal_eval,
-                                         'offdesign': ast.literal_eval,
-                                         'busses': ast.literal_eval,
-                                         'bus_param': ast.literal_eval,
-                                         'bus_P_ref': ast.literal_eval,
-                                         'bus_char': ast.literal_eval})
-
-            # create components
-            df['instance'] = df.apply(construct_comps, axis=1, args=(chars, char_maps, ))
-            comps = pd.concat((comps, df[['instance', 'label', 'busses',
-                                          'bus_param', 'bus_P_ref',
-                                          'bus_char']]), axis=0)
-
-            df['inter'] = df.apply(get_interface, axis=1)
-            inter = pd.concat((inter, df[['instance', 'label', 'inter']]), axis=0)
+            tables['comps/' + f[:-4]] = pd.read_csv(fn, sep=';', decimal='.',
+                                                    converters={'design': ast.literal_eval,
+                                                                'offdesign': ast.literal_eval,
+                                                                'busses': ast.literal_eval,
+                                                                'bus_param': ast.literal_eval,
+                                                                'bus_P_ref': ast.literal_eval,
+                                                                'bus_char': ast.literal_eval})
 
             msg = 'Reading component data (' + f[:-4] + ') from ' + fn + '.'
             logging.debug(msg)
 
-    comps = comps.set_index('label')
-    msg = 'Created network components.'
-    logging.info(msg)
-
-    # create network
-    nw = construct_network(path)
-    inter = inter[inter['inter'] == True].drop('inter', axis=1)
-
-    # make interfaces and components accessible by labels
-    nw.imp_comps = comps.to_dict()['instance']
-    nw.inter = inter.set_index('label').to_dict()['instance']
-
     # load connections
     fn = path + '/conn.csv'
-    conns = pd.read_csv(fn, sep=';', decimal='.',
-                        converters={'design': ast.literal_eval,
-                                    'offdesign': ast.literal_eval})
-
+    tables['conn'] = pd.read_csv(fn, sep=';', decimal='.',
+                                 converters={'design': ast.literal_eval,
+                                             'offdesign': ast.literal_eval,
+                                             'fluid_set': ast.literal_eval})
     msg = 'Reading connection data from ' + fn + '.'
     logging.debug(msg)
 
-    # create connections
-    conns['instance'] = conns.apply(construct_conns, axis=1, args=(comps, nw,))
-    conns.apply(conns_set_ref, axis=1, args=(conns,))
-    conns = conns.set_index('id')
-
-    nw.imp_conns = {}
-    # add connections to network
-    for c in conns['instance']:
-        nw.add_conns(c)
-        nw.imp_conns[c.t.label + ':' + c.t_id] = c
-
-    msg = 'Created connections.'
-    logging.info(msg)
+    # load fluid compositions
+    fn = path + '/conn_fluid.csv'
+    if os.path.isfile(fn):
+        tables['conn_fluid'] = pd.read_csv(fn, sep=';', decimal='.')
+        msg = 'Reading fluid compositions of connections from ' + fn + '.'
+        logging.debug(msg)
 
     # load busses
     fn = path + '/comps/bus.csv'
-    busses = pd.read_csv(fn, sep=';', decimal='.')
-
+    tables['comps/bus'] = pd.read_csv(fn, sep=';', decimal='.')
     msg = 'Reading bus data from ' + fn + '.'
     logging.debug(msg)
-    # create busses
-    nw.imp_busses = {}
-    if len(busses) > 0:
-        busses['instance'] = busses.apply(construct_busses, axis=1)
 
-        # add components to busses
-        comps.apply(busses_add_comps, axis=1, args=(busses, chars,))
+    return tables
 
-        # add busses to network
-        for b in busses['instance']:
-            nw.add_busses(b)
-            nw.imp_busses[b.label] = b
 
-        msg = 'Created busses.'
-        logging.info(msg)
+# %% create components
 
-    msg = 'Created network.'
-    logging.info(msg)
-    return nw
 
+def construct_chars(df, cols):
+    r"""
+    Reads the values of the characteristic lines or maps of the network.
 
-# %% create components
+    Parameters
+    ----------
+    df : pandas.core.frame.DataFrame
+        Identifiers and values of the characteristics from .csv-file.
+
+    cols : list
+        Names of the characteristic's values.
+
+    Returns
+    -------
+    chars : dict
+        Values of the characteristics as arrays, the keys are the
+        identifiers.
+
+    Note
+    ----
+    The characteristic objects are created on the components'
+    initialisation, components referencing the same identifier share the
+    arrays of values.
+    """
+    chars = {}
+    if 'id' not in df.columns:
+        return chars
+
+    for c in df.to_dict('records'):
+        if c['id'] not in chars:
+            chars[c['id']] = {col: np.array(list(c[col])) for col in cols}
+
+    return chars
 
 
 def construct_comps(c, *args):
@@ -238,25 +337,26 @@ def construct_comps(c, *args):
 
     Parameters
     ----------
-    c : pandas.core.series.Series
+    c : dict
         Component information from .csv-file.
 
-    args[0] : pandas.core.frame.DataFrame
-        DataFrame containing the x and y data of characteristic functions.
+    args[0] : dict
+        Values of the characteristic functions with their identifiers as
+        keys.
 
-    args[1] : pandas.core.frame.DataFrame
-        DataFrame containing the x, y, z1 and z2 data of characteristic maps.
+    args[1] : dict
+        Values of the characteristic maps with their identifiers as keys.
 
     Returns
     -------
     instance : tespy.components.components.component
         TESPy component object.
     """
-    if c.interface:
-        instance = cmp.subsys_interface(c.label, num_inter=1)
+    if c['interface']:
+        instance = cmp.subsys_interface(c['label'], num_inter=1)
     else:
-        target_class = getattr(cmp, c.cp)
-        instance = target_class(c.label)
+        target_class = getattr(cmp, c['cp'])
+        instance = target_class(c['label'])
     kwargs = {}
 
     # basic properties
@@ -273,54 +373,41 @@ def construct_comps(c, *args):
                 kwargs[key] = dc
             # component characteristics
             elif isinstance(value, hlp.dc_cc):
-                # finding x and y values of the characteristic function
-                values = args[0]['id'] == c[key]
+                # values of the characteristic function by identifier,
+                # the function is created on component initialisation
+                char = args[0].get(c[key])
 
-                try:
-                    x = args[0][values].x.values[0]
-                    y = args[0][values].y.values[0]
-                except IndexError:
+                if char is None:
                     # if characteristics are missing (for compressor map atm)
-                    x = cmp_char.characteristics().x
-                    y = cmp_char.characteristics().y
+                    char = cmp_char.characteristics()
                     msg = 'Could not find x and y values for characteristic line, using defaults instead.'
                     logging.warning(msg)
-
-                char = cmp_char.characteristics(x=x, y=y, method=c[key + '_method'], comp=instance.component())
+                    char = {'x': char.x, 'y': char.y}
 
                 dc = hlp.dc_cc(is_set=c[key + '_set'],
                                method=c[key + '_method'],
                                param=c[key + '_param'],
-                               func=char,
-                               x=x, y=y)
+                               x=char['x'], y=char['y'])
                 kwargs[key] = dc
             # component characteristics
             elif isinstance(value, hlp.dc_cm):
-                # finding x and y values of the characteristic function
-                values = args[1]['id'] == c[key]
-
-                try:
-                    x = list(args[1][values].x.values[0])
-                    y = list(args[1][values].y.values[0])
-                    z1 = list(args[1][values].z1.values[0])
-                    z2 = list(args[1][values].z2.values[0])
-                except IndexError:
-                    # if characteristics are missing (for compressor map atm)
-                    x = cmp_char.char_map().x
-                    y = cmp_char.char_map().y
-                    z1 = cmp_char.char_map().z1
-                    z2 = cmp_char.char_map().z2
+                # values of the characteristic map by identifier,
+                # the map is created on component initialisation
+                char_map = args[1].get(c[key])
 
+                if char_map is None:
+                    # if characteristics are missing (for compressor map atm)
+                    char_map = cmp_char.char_map()
                     msg = 'Could not find x, y, z1 and z2 values for characteristic map, using defaults instead.'
                     logging.warning(msg)
-
-                char_map = cmp_char.char_map(x=x, y=y, z1=z1, z2=z2, method=c[key + '_method'], comp=instance.component())
+                    char_map = {'x': char_map.x, 'y': char_map.y,
+                                'z1': char_map.z1, 'z2': char_map.z2}
 
                 dc = hlp.dc_cm(is_set=c[key + '_set'],
                                method=c[key + '_method'],
                                param=c[key + '_param'],
-                               func=char_map,
-                               x=x, y=y, z1=z1, z2=z2)
+                               x=char_map['x'], y=char_map['y'],
+                               z1=char_map['z1'], z2=char_map['z2'])
                 kwargs[key] = dc
             # grouped component parameters
             elif isinstance(value, hlp.dc_gcp):
@@ -337,7 +424,7 @@ def get_interface(c):
 
     Parameters
     ----------
-    c : pandas.core.series.Series
+    c : dict
         Component information from .csv-file.
 
     Returns
@@ -345,7 +432,7 @@ def get_interface(c):
     is_interface : boolean
         Returns True, if component is marked as interface.
     """
-    if c.interface:
+    if c['interface']:
         return True
     else:
         return False
@@ -353,23 +440,20 @@ def get_interface(c):
 # %% create network object
 
 
-def construct_network(path):
+def construct_network(netw):
     r"""
     Creates TESPy network from the data provided in the netw.csv-file.
 
     Parameters
     ----------
-    path : str
-        Base-path to stored network data.
+    netw : pandas.core.frame.DataFrame
+        Network properties from netw.csv-file.
 
     Returns
     -------
     nw : tespy.networks.network
         TESPy network object.
     """
-    # read network .csv-file
-    netw = pd.read_csv(path + '/netw.csv', sep=';', decimal='.',
-                       converters={'fluids': ast.literal_eval})
     f_list = netw['fluids'][0]
 
     kwargs = {}
@@ -395,11 +479,18 @@ def construct_conns(c, *args):
 
     Parameters
     ----------
-    c : pandas.core.series.Series
+    c : dict
         Connection information from .csv-file.
 
-    args[0] : pandas.core.frame.DataFrame
-        DataFrame containing all created components.
+    args[0] : dict
+        All created components with their labels as keys.
+
+    args[1] : tespy.networks.network
+        Network of the connection.
+
+    args[2] : dict
+        Fluid compositions with their indices as keys, if None, the fluid
+        vector is read from one column per fluid.
 
     Returns
     -------
@@ -407,7 +498,7 @@ def construct_conns(c, *args):
         TESPy connection object.
     """
     # create connection
-    conn = con.connection(args[0].instance[c.s], c.s_id, args[0].instance[c.t], c.t_id)
+    conn = con.connection(args[0][c['s']], c['s_id'], args[0][c['t']], c['t_id'])
 
     kwargs = {}
     # read basic properties
@@ -427,11 +518,19 @@ def construct_conns(c, *args):
     val = {}
     val0 = {}
     val_set = {}
-    for key in args[1].fluids:
-        if key in c:
-            val[key] = c[key]
-            val0[key] = c[key + '0']
-            val_set[key] = c[key + '_set']
+    if args[2] is not None:
+        composition = args[2].get(c['fluid'], {})
+        composition0 = args[2].get(c['fluid0'], {})
+        for key in args[1].fluids:
+            val[key] = composition.get(key, 0)
+            val0[key] = composition0.get(key, 0)
+            val_set[key] = key in c['fluid_set']
+    else:
+        for key in args[1].fluids:
+            if key in c:
+                val[key] = c[key]
+                val0[key] = c[key + '0']
+                val_set[key] = c[key + '_set']
 
     kwargs['fluid'] = hlp.dc_flu(val=val, val0=val0, val_set=val_set, balance=c['balance'])
 
@@ -448,27 +547,21 @@ def conns_set_ref(c, *args):
 
     Parameters
     ----------
-    c : pandas.core.series.Series
+    c : dict
         Connection information from .csv-file.
 
-    args[0] : pandas.core.frame.DataFrame
-        DataFrame containing all created connections.
-
-    Returns
-    -------
-    instance : tespy.connections.ref
-        TESPy reference object.
+    args[0] : dict
+        All created connections with their ids as keys.
     """
     for col in ['m', 'p', 'h', 'T']:
         # search for referenced connections
         if isinstance(c[col + '_ref'], str):
             # create reference object
-            instance = args[0].instance[c[col + '_ref'] ==
-                                        args[0]['id']].values[0]
+            instance = args[0][c[col + '_ref']]
             # write to connection properties
-            c['instance'].get_attr(col).ref = con.ref(instance,
-                                                      c[col + '_ref_f'],
-                                                      c[col + '_ref_d'])
+            args[0][c['id']].get_attr(col).ref = con.ref(instance,
+                                                         c[col + '_ref_f'],
+                                                         c[col + '_ref_d'])
 
 # %% create busses
 
@@ -479,7 +572,7 @@ def construct_busses(c, *args):
 
     Parameters
     ----------
-    c : pandas.core.series.Series
+    c : dict
         Bus information from .csv-file.
 
     Returns
@@ -488,8 +581,8 @@ def construct_busses(c, *args):
         TESPy bus object.
     """
     # set up bus with label and specify value for power
-    b = con.bus(c.label, P=c.P)
-    b.P.val_set = c.P_set
+    b = con.bus(c['label'], P=c['P'])
+    b.P.val_set = c['P_set']
     return b
 
 # %% add components to busses
@@ -501,22 +594,182 @@ def busses_add_comps(c, *args):
 
     Parameters
     ----------
-    c : pandas.core.series.Series
+    c : dict
         Component information from .csv-file.
 
-    args[0] : pandas.core.frame.DataFrame
-        DataFrame containing all created busses.
+    args[0] : dict
+        All created busses with their labels as keys.
+
+    args[1] : dict
+        Values of the characteristic functions with their identifiers as
+        keys.
 
-    args[1] : pandas.core.frame.DataFrame
-        DataFrame containing all created characteristic lines.
+    args[2] : dict
+        Created characteristic functions of the busses with their
+        identifiers as keys.
     """
     i = 0
-    for b in c.busses:
-        p, P_ref, char = c.bus_param[i], c.bus_P_ref[i], c.bus_char[i]
+    for b in c['busses']:
+        p, P_ref, char = c['bus_param'][i], c['bus_P_ref'][i], c['bus_char'][i]
 
-        values = char == args[1]['id']
-        char = cmp_char.characteristics(x=args[1][values].x.values[0], y=args[1][values].y.values[0])
+        if char not in args[2]:
+            args[2][char] = cmp_char.characteristics(**args[1][char])
 
         # add component with corresponding details to bus
-        args[0].instance[b == args[0]['label']].values[0].add_comps({'c': c.instance, 'p': p, 'P_ref': P_ref, 'char': char})
+        args[0][b].add_comps({'c': c['instance'], 'p': p, 'P_ref': P_ref, 'char': args[2][char]})
         i += 1
+
+# %% result loading
+
+
+def load_results(fn):
+    r"""
+    Opens a results file of a result sink for read-only access.
+
+    Parameters
+    ----------
+    fn : str
+        Path/filename of the results file (.npy), see
+        :py:class:`tespy.networks.result_sink`.
+
+    Returns
+    -------
+    res : tespy.network_reader.result_archive
+        Results of the connections, components and busses.
+
+    Note
+    ----
+    The results file is memory-mapped, the values of a variable are read from
+    disk on access only. The results are accessible by the same labels as the imported
+    networks' objects, e. g. the temperature at inlet 'in2' of the
+    component 'condenser' with :code:`res.imp_conns['condenser:in2']['T']`
+    and the power of the component 'pump' with
+    :code:`res.imp_comps['pump']['P']`.
+
+    Example
+    -------
+    >>> from tespy import nwk, nwkr, cmp, con
+    >>> import os
+    >>> nw = nwk.network(fluids=['water'], p_unit='bar', T_unit='C')
+    >>> nw.set_printoptions(print_level='none')
+    >>> so = cmp.source('source')
+    >>> si = cmp.sink('sink')
+    >>> pu = cmp.pump('pump')
+    >>> inc = con.connection(so, 'out1', pu, 'in1')
+    >>> outg = con.connection(pu, 'out1', si, 'in1')
+    >>> nw.add_conns(inc, outg)
+    >>> pu.set_attr(eta_s=0.8)
+    >>> inc.set_attr(fluid={'water': 1}, m=10, T=20)
+    >>> outg.set_attr(p=5)
+    >>> results = nwk.result_sink('results.npy')
+    >>> nw.add_result_sinks(results)
+    >>> for p in [1, 2, 3]:
+    ...     inc.set_attr(p=p)
+    ...     nw.solve('design')
+    >>> results.close()
+    >>> res = nwkr.load_results('results.npy')
+    >>> len(res)
+    3
+    >>> res.imp_conns['pump:in1']['p'].tolist()
+    [1.0, 2.0, 3.0]
+    >>> [round(P) for P in res.imp_comps['pump']['P']]
+    [5009, 3756, 2504]
+    >>> del res
+    >>> os.remove('results.npy')
+    """
+    return result_archive(fn)
+
+
+class result_archive:
+    r"""
+    Read-only access to a results file of a result sink.
+
+    Parameters
+    ----------
+    fn : str
+        Path/filename of the results file (.npy).
+
+    Note
+    ----
+    The attributes :code:`imp_conns`, :code:`imp_comps` and
+    :code:`imp_busses` hold the results per connection, component and bus
+    with the names of the variables as keys
+    (:py:class:`tespy.network_reader.result_columns`). Accessing a variable
+    returns an array with one value per calculation, see
+    :func:`tespy.network_reader.load_results`.
+    """
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.data = np.load(fn, mmap_mode='r')
+        self.num_rows = int(self.data['rows'].sum())
+
+        self.imp_conns = {}
+        self.imp_comps = {}
+        self.imp_busses = {}
+        groups = {'conns': self.imp_conns,
+                  'comps': self.imp_comps,
+                  'busses': self.imp_busses}
+
+        for name in self.data.dtype.names[1:]:
+            group, label = name.split('/', 1)
+            label, key = label.rsplit('/', 1)
+            groups[group].setdefault(label, result_columns(self)).names[key] = name
+
+        msg = ('Opened results file ' + fn + ' with ' + str(len(self)) +
+               ' results.')
+        logging.debug(msg)
+
+    def __len__(self):
+        return self.num_rows
+
+    def column(self, name):
+        r"""
+        Returns the values of a column of the results file.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column, e. g. :code:`'comps/pump/P'`.
+
+        Returns
+        -------
+        val : ndarray
+            Values of the column, one value per calculation.
+
+        Note
+        ----
+        The values of the column are read from the column's part of every
+        block, the values of the other columns are not read.
+        """
+        return self.data[name].reshape(-1)[:self.num_rows]
+
+
+class result_columns(collections.abc.Mapping):
+    r"""
+    Results of a connection, component or bus in a results file.
+
+    Parameters
+    ----------
+    archive : tespy.network_reader.result_archive
+        Results file holding the columns.
+
+    Note
+    ----
+    The names of the variables are the keys, the values of a variable are read
+    from the results file on access, see
+    :func:`tespy.network_reader.result_archive.column`.
+    """
+
+    def __init__(self, archive):
+        self.archive = archive
+        self.names = collections.OrderedDict()
+
+    def __getitem__(self, key):
+        return self.archive.column(self.names[key])
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
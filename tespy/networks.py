@@ -20,11 +20,17 @@ from numpy.linalg import norm
 from tespy.components import components as cmp
 from tespy import connections as con
 from tespy.tools import helpers as hlp
+from tespy.tools import logger
 
+import atexit
 import collections
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import time
 import os
+import struct
 from CoolProp.CoolProp import PropsSI as CPPSI
 
 import logging
@@ -103,10 +109,20 @@ class network:
 
         # initialisation of basic properties
         self.checked = False
-        # connection dataframe
-        self.conns = pd.DataFrame(columns=['s', 's_id', 't', 't_id'])
+        # connections of the network with source, outlet, target and inlet,
+        # the dataframe of the connections is created on demand
+        self.conn_dict = collections.OrderedDict()
+        self.conn_df = None
+        # connections attached to an already used port
+        self.conn_dub = []
+        # connections indexed by source (component, outlet) and
+        # target (component, inlet)
+        self.conn_source = {}
+        self.conn_target = {}
         # list for busses
         self.busses = collections.OrderedDict()
+        # result sinks for the results of every calculation
+        self.result_sinks = []
 
         # fluid list and constants
         if isinstance(fluids, list):
@@ -353,6 +369,28 @@ class network:
         return ['m_unit', 'p_unit', 'h_unit', 'T_unit', 'v_unit',
                 'p_range', 'h_range', 'T_range']
 
+    def __getstate__(self):
+        r"""
+        Returns the network's state for pickling.
+
+        Note
+        ----
+        The custom fluids of the network are pickled with the network, all
+        other global fluid property data are registered on unpickling, see
+        :func:`tespy.tools.helpers.register_fluids`. The dataframe of the
+        connections is recreated on demand, result sinks are not pickled.
+        """
+        state = self.__dict__.copy()
+        state['conn_df'] = None
+        state['result_sinks'] = []
+        state['custom_fluids'] = hlp.fluid_registry(self.fluids)
+        return state
+
+    def __setstate__(self, state):
+        custom = state.pop('custom_fluids', None)
+        self.__dict__.update(state)
+        hlp.register_fluids(self.fluids, custom)
+
     def set_printoptions(self, **kwargs):
         r"""
         Specification of printouts for tespy.networks.network object.
@@ -392,8 +430,7 @@ class network:
             The subsystem to be added to the network, subsystem objects si :code:`network.add_subsys(s1, s2, s3, ...)`.
         """
         for subsys in args:
-            for c in subsys.conns:
-                self.add_conns(c)
+            self.add_conns(*subsys.conns)
 
     def add_nwks(self, *args):
         """
@@ -404,8 +441,7 @@ class network:
         :returns: no return value
         """
         for nw in args:
-            for c in nw.conns.index:
-                self.add_conns(c)
+            self.add_conns(*nw.conn_dict.keys())
 
     def add_conns(self, *args):
         r"""
@@ -422,12 +458,19 @@ class network:
                 logging.error(msg)
                 raise TypeError(msg)
 
-            self.conns.loc[c] = [c.s, c.s_id, c.t, c.t_id]
+            self.conn_dict[c] = [c.s, c.s_id, c.t, c.t_id]
+            for index, key in [(self.conn_source, (c.s, c.s_id)),
+                               (self.conn_target, (c.t, c.t_id))]:
+                if key in index and index[key] is not c:
+                    self.conn_dub += [index[key]]
+                index[key] = c
             msg = 'Added connection ' + c.s.label + ' (' + c.s_id + ') -> ' + c.t.label + ' (' + c.t_id + ') to network.'
             logging.debug(msg)
             # set status "checked" to false, if conneciton is added to network.
             self.checked = False
 
+        self.conn_df = None
+
     def del_conns(self, *args):
         """
         Removes one or more connections from the network.
@@ -438,29 +481,73 @@ class network:
             The connection to be removed from the network, connections objects ci :code:`del_conns(c1, c2, c3, ...)`.
         """
         for c in args:
-            self.conns = self.conns.drop(c)
+            del self.conn_dict[c]
+            self.del_conn_index(c)
             msg = 'Deleted connection ' + c.s.label + ' (' + c.s_id + ') -> ' + c.t.label + ' (' + c.t_id + ') from network.'
             logging.debug(msg)
         # set status "checked" to false, if conneciton is deleted from network.
         self.checked = False
+        self.conn_df = None
+
+    @property
+    def conns(self):
+        r"""
+        Returns the dataframe of the network's connections.
+
+        Returns
+        -------
+        conns : pandas.core.frame.DataFrame
+            Dataframe with the connections as index and their source, outlet,
+            target and inlet as columns.
+
+        Note
+        ----
+        The connections are stored in an ordered dictionary, the dataframe is
+        created on first access after adding or removing connections.
+        """
+        if self.conn_df is None:
+            self.conn_df = pd.DataFrame(
+                list(self.conn_dict.values()), index=list(self.conn_dict.keys()),
+                columns=['s', 's_id', 't', 't_id'])
+        return self.conn_df
+
+    def del_conn_index(self, c):
+        r"""
+        Removes a connection from the network's source and target index.
+
+        Parameters
+        ----------
+        c : tespy.connections.connection
+            The connection to be removed from the index.
+        """
+        self.conn_dub = [d for d in self.conn_dub if d is not c]
+        for index, key, port in [(self.conn_source, (c.s, c.s_id), 0),
+                                 (self.conn_target, (c.t, c.t_id), 2)]:
+            if index.get(key) is c:
+                del index[key]
+                # restore duplicate connections at the same port
+                for d in self.conn_dub:
+                    if d in self.conn_dict and self.conn_dict[d][port:port + 2] == list(key):
+                        index[key] = d
+                        break
 
     def check_conns(self):
         r"""
         Checks the networks connections for multiple usage of inlets or outlets of components.
         """
-        dub = self.conns.loc[self.conns.duplicated(['s', 's_id']) == True].index
-        for c in dub:
-            msg = ('The source ' + str(c.s.label) + ' (' + str(c.s_id) + ') is '
-                   'attached to more than one connection. Please check your network.')
-            logging.error(msg)
-            raise hlp.TESPyNetworkError(msg)
+        for c in self.conn_dict:
+            if self.conn_source.get((c.s, c.s_id)) is not c:
+                msg = ('The source ' + str(c.s.label) + ' (' + str(c.s_id) + ') is '
+                       'attached to more than one connection. Please check your network.')
+                logging.error(msg)
+                raise hlp.TESPyNetworkError(msg)
 
-        dub = self.conns.loc[self.conns.duplicated(['t', 't_id']) == True].index
-        for c in dub:
-            msg = ('The target ' + str(c.t.label) + ' (' + str(c.t_id) + ') is '
-                   'attached to more than one connection. Please check your network.')
-            logging.error(msg)
-            raise hlp.TESPyNetworkError(msg)
+        for c in self.conn_dict:
+            if self.conn_target.get((c.t, c.t_id)) is not c:
+                msg = ('The target ' + str(c.t.label) + ' (' + str(c.t_id) + ') is '
+                       'attached to more than one connection. Please check your network.')
+                logging.error(msg)
+                raise hlp.TESPyNetworkError(msg)
 
     def add_busses(self, *args):
         r"""
@@ -491,6 +578,44 @@ class network:
             msg = 'Deleted bus ' + b.label + ' from network.'
             logging.debug(msg)
 
+    def add_result_sinks(self, *args):
+        r"""
+        Adds one or more result sinks to the network. The results of every
+        calculation are appended to the result sinks.
+
+        Parameters
+        ----------
+        sink : tespy.networks.result_sink
+            The result sink to be added to the network, result sink objects
+            si :code:`add_result_sinks(s1, s2, s3, ...)`.
+        """
+        for sink in args:
+            if not isinstance(sink, result_sink):
+                msg = 'Only objects of type result_sink can be added as result sinks.'
+                logging.error(msg)
+                raise TypeError(msg)
+
+            if sink not in self.result_sinks:
+                self.result_sinks += [sink]
+                msg = 'Added result sink ' + sink.fn + ' to network.'
+                logging.debug(msg)
+
+    def del_result_sinks(self, *args):
+        r"""
+        Removes one or more result sinks from the network.
+
+        Parameters
+        ----------
+        sink : tespy.networks.result_sink
+            The result sink to be removed from the network, result sink
+            objects si :code:`del_result_sinks(s1, s2, s3, ...)`.
+        """
+        for sink in args:
+            if sink in self.result_sinks:
+                self.result_sinks.remove(sink)
+                msg = 'Deleted result sink ' + sink.fn + ' from network.'
+                logging.debug(msg)
+
     def check_busses(self, b):
         r"""
         Checks the busses to be added for type, duplicates and identical labels.
@@ -529,8 +654,8 @@ class network:
         self.init_components(comps)  # build the dataframe for components
         # count number of incoming and outgoing connections and compare to expected values
         for comp in self.comps.index:
-            num_o = (self.conns[['s', 't']] == comp).sum().s
-            num_i = (self.conns[['s', 't']] == comp).sum().t
+            num_o = len(self.comps.loc[comp].o)
+            num_i = len(self.comps.loc[comp].i)
             if num_o != comp.num_o:
                 msg = (comp.label + ' is missing ' + str(comp.num_o - num_o) +
                        ' outgoing connections. Make sure all outlets are '
@@ -573,19 +698,30 @@ class network:
         """
         self.comps = pd.DataFrame(index=comps, columns=['i', 'o'])
 
+        # group the connections by their source and target components
+        inlets = {comp: [] for comp in comps}
+        outlets = {comp: [] for comp in comps}
+        for (comp, s_id), c in self.conn_source.items():
+            outlets[comp] += [(s_id, c)]
+        for (comp, t_id), c in self.conn_target.items():
+            inlets[comp] += [(t_id, c)]
+
+        # fluid passthrough maps of the components
+        self.passthrough = {}
+
         labels = []
         for comp in self.comps.index:
             # get for incoming and outgoing connections of a component
-            s = self.conns[self.conns.s == comp]
-            s = s.s_id.sort_values().index
-            t = self.conns[self.conns.t == comp]
-            t = t.t_id.sort_values().index
+            # sorted by the component's port ids
+            s = pd.Index([c for s_id, c in sorted(outlets[comp], key=lambda x: x[0])])
+            t = pd.Index([c for t_id, c in sorted(inlets[comp], key=lambda x: x[0])])
             self.comps.loc[comp] = [t, s]
             # save the incoming and outgoing as well as the number of connections as component attribute
             comp.inl = t.tolist()
             comp.outl = s.tolist()
             comp.num_i = len(comp.inlets())
             comp.num_o = len(comp.outlets())
+            self.passthrough[comp] = comp.fluid_passthrough()
             labels += [comp.label]
 
         # check for duplicates in the component labels
@@ -616,9 +752,9 @@ class network:
             raise hlp.TESPyNetworkError(msg)
 
         if self.mode == 'offdesign':
-            if self.design_path is None:
+            if self.design_path is None and self.design is None:
                 # must provide design_path
-                msg = ('Please provide \'design_path\' for every offdesign calculation.')
+                msg = ('Please provide \'design_path\' or a \'design\' snapshot for every offdesign calculation.')
                 logging.error(msg)
                 raise hlp.TESPyNetworkError(msg)
             else:
@@ -663,12 +799,13 @@ class network:
         # generic fluid property initialisation
         self.init_properties()
 
-        if self.init_path is not None:
+        if self.init_path is not None or self.init is not None:
             self.init_csv()
 
     def init_offdesign(self):
         r"""
-        Offdesign initialisation from results files in :code:`design_path`.
+        Offdesign initialisation from results files in :code:`design_path` or
+        from the snapshot :code:`design`.
 
             - Set component attributes design values.
             - Set connection design values.
@@ -693,50 +830,73 @@ class network:
         :code:`cp.offdesign` will be set instead.
         """
         not_required = ['source', 'sink', 'node', 'merge', 'splitter', 'separator', 'drum', 'subsys_interface']
-        cp_sort = self.comps.copy()
-        # component type
-        cp_sort['cp'] = cp_sort.apply(network.get_class_base, axis=1)
-        cp_sort['label'] = cp_sort.apply(network.get_props, axis=1, args=('label',))
-        cp_sort['comp'] = cp_sort.index
-        cp_sort.set_index('label', inplace=True)
-        for c in cp_sort.cp.unique():
-            if c not in not_required:
-                if self.path_abs:
-                    path = self.design_path + '/comps/' + c + '.csv'
-                else:
-                    path = './' + self.design_path + '/comps/' + c + '.csv'
-
-                msg = 'Reading design point information for components of type ' +  c + ' from path ' + path + '.'
-                logging.debug(msg)
-                comps = pd.read_csv(path, sep=';', decimal='.', converters={'busses': ast.literal_eval, 'bus_P_ref': ast.literal_eval})
-                comps.set_index('label', inplace=True)
-                for c in comps.index:
-                    cp_sort.loc[c].comp.set_parameters(self.mode, comps.loc[c])
-                    i = 0
-                    for b in comps.loc[c].busses:
-                        self.busses[b].P_ref = comps.loc[c].bus_P_ref
-                        i += 1
+        if self.design is not None:
+            # design values from snapshot
+            for cp in self.comps.index:
+                if cp.__class__.__name__ not in not_required and cp.label in self.design.comps:
+                    cp.set_parameters(self.mode, self.design.comps[cp.label])
+
+            for label, P_ref in self.design.busses.items():
+                if label in self.busses:
+                    b = self.busses[label]
+                    for cp in b.comps.index:
+                        if cp.label in P_ref:
+                            b.comps.loc[cp, 'P_ref'] = P_ref[cp.label]
+
+            data = self.design.conn_data(self.fluids)
+            msg = 'Reading design point information from snapshot.'
+            logging.debug(msg)
 
-        # connections
-        if self.path_abs:
-            path = self.design_path + '/conn.csv'
         else:
-            path = './' + self.design_path + '/conn.csv'
-        df = pd.read_csv(path, index_col=0, delimiter=';', decimal='.')
-        msg = 'Reading design point information for connections from path ' + path + '.'
-        logging.debug(msg)
+            if self.path_abs:
+                base = self.design_path
+            else:
+                base = './' + self.design_path
+
+            # binary network file
+            tables = None
+            if os.path.isfile(base + '/network.npz'):
+                tables = hlp.load_npz(base + '/network.npz')
+
+            # components by type and label
+            cp_sort = collections.OrderedDict()
+            for cp in self.comps.index:
+                cp_sort.setdefault(cp.__class__.__name__, {})[cp.label] = cp
+            for c, labels in cp_sort.items():
+                if c not in not_required:
+                    if tables is not None:
+                        path = base + '/network.npz'
+                        comps = tables['comps/' + c]
+                    else:
+                        path = base + '/comps/' + c + '.csv'
+                        comps = pd.read_csv(path, sep=';', decimal='.', converters={'busses': ast.literal_eval, 'bus_P_ref': ast.literal_eval})
+
+                    msg = 'Reading design point information for components of type ' +  c + ' from path ' + path + '.'
+                    logging.debug(msg)
+                    comps.set_index('label', inplace=True)
+                    for label, data in comps.iterrows():
+                        labels[label].set_parameters(self.mode, data)
+                        for b in data.busses:
+                            self.busses[b].P_ref = data.bus_P_ref
+
+            # connections
+            if tables is not None:
+                path = base + '/network.npz'
+                data = self.read_conn_data(tables['conn'], tables.get('conn_fluid', None))
+            else:
+                path = base + '/conn.csv'
+                data = self.read_conn_csv(path)
+            msg = 'Reading design point information for connections from path ' + path + '.'
+            logging.debug(msg)
+
         for c in self.conns.index:
             # match connection (source, source_id, target, target_id) on
             # connection objects of design file
-            conn = (df.loc[df['s'].isin([c.s.label]) & df['t'].isin([c.t.label]) &
-                           df['s_id'].isin([c.s_id]) & df['t_id'].isin([c.t_id])])
-            if len(conn.index) > 0:
-                conn_id = conn.index[0]
-                c.m.design = df.loc[conn_id].m * self.m[df.loc[conn_id].m_unit]
-                c.p.design = df.loc[conn_id].p * self.p[df.loc[conn_id].p_unit]
-                c.h.design = df.loc[conn_id].h * self.h[df.loc[conn_id].h_unit]
-                for fluid in self.fluids:
-                    c.fluid.design[fluid] = df.loc[conn_id][fluid]
+            key = (c.s.label, c.s_id, c.t.label, c.t_id)
+            if key in data:
+                c.m.design, c.p.design, c.h.design, fluid = data[key]
+                for fl, x in zip(self.fluids, fluid):
+                    c.fluid.design[fl] = x
 
             else:
                 msg = ('Could not find all connections in design case. '
@@ -782,9 +942,10 @@ class network:
         # generic fluid property initialisation
         self.init_properties()
 
-        # starting values from design file if not init path is specified
-        if self.init_path is None:
+        # starting values from design case if no init path or snapshot is specified
+        if self.init_path is None and self.init is None:
             self.init_path = self.design_path
+            self.init = self.design
         self.init_csv()
 
     def init_fluids(self):
@@ -860,13 +1021,13 @@ class network:
             if isinstance(cp, cmp.combustion_chamber):
                 cp.initialise_fluids(self)
                 for c in self.comps.loc[cp].o:
-                    self.init_target(c, c.t)
+                    self.init_target(c)
 
         # fluid propagation from set values
         for c in self.conns.index:
             if any(c.fluid.val_set.values()):
-                self.init_target(c, c.t)
-                self.init_source(c, c.s)
+                self.init_target(c)
+                self.init_source(c)
 
         # fluid propagation starting from all connections
         for c in self.conns.index:
@@ -876,123 +1037,69 @@ class network:
         msg = 'Fluid initialisation done.'
         logging.debug(msg)
 
-    def init_target(self, c, start):
+    def init_target(self, c):
         r"""
-        Propagates the fluids towards connection's target with recursive function calls.
-        If the target is a sink, a merge or a combustion chamber, the propagation stops.
+        Propagates the fluids towards connection's target.
 
         Parameters
         ----------
         c : tespy.connections.connection
-            Connection to initialise.
-
-        start : tespy.connections.connection
             This connection is the fluid propagation starting point.
-            The starting connection is saved to prevent infinite looping.
         """
-        if (len(c.t.inlets()) == 1 and len(c.t.outlets()) == 1 or
-                isinstance(c.t, cmp.heat_exchanger) or
-                isinstance(c.t, cmp.subsys_interface)):
-
-            outc = pd.DataFrame()
-            outc['s'] = self.conns.s == c.t
-            outc['s_id'] = self.conns.s_id == c.t_id.replace('in', 'out')
-            conn, cid = outc['s'] == True, outc['s_id'] == True
-            outc = outc.index[conn & cid][0]
-
-            for fluid, x in c.fluid.val.items():
-                if not outc.fluid.val_set[fluid]:
-                    outc.fluid.val[fluid] = x
-
-            self.init_target(outc, start)
-
-        if isinstance(c.t, cmp.splitter):
-            for outconn in self.comps.loc[c.t].o:
-                for fluid, x in c.fluid.val.items():
-                    if not outconn.fluid.val_set[fluid]:
-                        outconn.fluid.val[fluid] = x
+        self.init_propagation(c, 'target')
 
-                self.init_target(outconn, start)
-
-        if isinstance(c.t, cmp.cogeneration_unit):
-            for outconn in self.comps.loc[c.t].o[:2]:
-                for fluid, x in c.fluid.val.items():
-                    if not outconn.fluid.val_set[fluid]:
-                        outconn.fluid.val[fluid] = x
-
-                self.init_target(outconn, start)
-
-        if isinstance(c.t, cmp.drum) and c.t != start:
-            start = c.t
-            for outconn in self.comps.loc[c.t].o:
-                for fluid, x in c.fluid.val.items():
-                    if not outconn.fluid.val_set[fluid]:
-                        outconn.fluid.val[fluid] = x
-
-                self.init_target(outconn, start)
-
-    def init_source(self, c, start):
+    def init_source(self, c):
         r"""
-        Propagates the fluids towards connection's source with recursive function calls.
-        If the source is a source or a combustion chamber, the propagation stops.
+        Propagates the fluids towards connection's source.
 
         Parameters
         ----------
         c : tespy.connections.connection
-            Connection to initialise.
-
-        start : tespy.connections.connection
             This connection is the fluid propagation starting point.
-            The starting connection is saved to prevent infinite looping.
         """
-        if (len(c.s.inlets()) == 1 and len(c.s.outlets()) == 1 or
-                isinstance(c.s, cmp.heat_exchanger) or
-                isinstance(c.s, cmp.subsys_interface)):
-
-            inc = pd.DataFrame()
-            inc['t'] = self.conns.t == c.s
-            inc['t_id'] = self.conns.t_id == c.s_id.replace('out', 'in')
-            conn, cid = inc['t'] == True, inc['t_id'] == True
-            inc = inc.index[conn & cid][0]
-
-            for fluid, x in c.fluid.val.items():
-                if not inc.fluid.val_set[fluid]:
-                    inc.fluid.val[fluid] = x
+        self.init_propagation(c, 'source')
 
-            self.init_source(inc, start)
-
-        if isinstance(c.s, cmp.splitter):
-            for inconn in self.comps.loc[c.s].i:
-                for fluid, x in c.fluid.val.items():
-                    if not inconn.fluid.val_set[fluid]:
-                        inconn.fluid.val[fluid] = x
-
-                self.init_source(inconn, start)
+    def init_propagation(self, start, direction):
+        r"""
+        Propagates the fluid vector of a connection through the network.
 
-        if isinstance(c.s, cmp.merge):
-            for inconn in self.comps.loc[c.s].i:
-                for fluid, x in c.fluid.val.items():
-                    if not inconn.fluid.val_set[fluid]:
-                        inconn.fluid.val[fluid] = x
+        Parameters
+        ----------
+        start : tespy.connections.connection
+            This connection is the fluid propagation starting point.
 
-                self.init_source(inconn, start)
+        direction : str
+            Direction of the propagation, 'target' or 'source'.
 
-        if isinstance(c.s, cmp.cogeneration_unit):
-            for inconn in self.comps.loc[c.s].i[:2]:
-                for fluid, x in c.fluid.val.items():
-                    if not inconn.fluid.val_set[fluid]:
-                        inconn.fluid.val[fluid] = x
+        Note
+        ----
+        The connections are visited in a breadth first search, every connection
+        is visited once per starting point. The ports the fluid vector is
+        passed on to are given by the fluid passthrough map of the components,
+        see :func:`tespy.components.components.component.fluid_passthrough`.
+        The propagation stops at components without passthrough for the port,
+        e.g. sinks, merges (in direction of target) or combustion chambers.
+        """
+        visited = {start}
+        queue = collections.deque([start])
+        while queue:
+            c = queue.popleft()
+            if direction == 'target':
+                cp, port, index = c.t, c.t_id, self.conn_source
+            else:
+                cp, port, index = c.s, c.s_id, self.conn_target
 
-                self.init_source(inconn, start)
+            for p in self.passthrough[cp][direction].get(port, []):
+                conn = index[(cp, p)]
+                if conn in visited:
+                    continue
 
-        if isinstance(c.s, cmp.drum) and c.s != start:
-            start = c.s
-            for inconn in self.comps.loc[c.s].i:
                 for fluid, x in c.fluid.val.items():
-                    if not inconn.fluid.val_set[fluid]:
-                        inconn.fluid.val[fluid] = x
+                    if not conn.fluid.val_set[fluid]:
+                        conn.fluid.val[fluid] = x
 
-                self.init_source(inconn, start)
+                visited.add(conn)
+                queue.append(conn)
 
     def init_properties(self):
         r"""
@@ -1008,17 +1115,13 @@ class network:
             for key in ['m', 'p', 'h', 'T', 'x', 'v']:
                 if not c.get_attr(key).unit_set and key != 'x':
                     c.get_attr(key).unit = self.get_attr(key + '_unit')
-                if key not in ['T', 'x', 'v'] and not c.get_attr(key).val_set:
+            # specified values
+            self.init_spec(c)
+            # starting values
+            for key in ['m', 'p', 'h']:
+                if not c.get_attr(key).val_set:
                     self.init_val0(c, key)
                     c.get_attr(key).val_SI = c.get_attr(key).val0 * self.get_attr(key)[c.get_attr(key).unit]
-                elif key not in ['T', 'x', 'v'] and c.get_attr(key).val_set:
-                    c.get_attr(key).val_SI = c.get_attr(key).val * self.get_attr(key)[c.get_attr(key).unit]
-                elif key == 'T' and c.T.val_set:
-                    c.T.val_SI = (c.T.val + self.T[c.T.unit][0]) * self.T[c.T.unit][1]
-                elif key == 'x' and c.x.val_set:
-                    c.x.val_SI = c.x.val
-                elif key == 'v' and c.v.val_set:
-                    c.v.val_SI = c.v.val * self.v[c.v.unit]
 
         msg = 'Retrieved generic starting values and specified SI-values of connection parameters.'
         logging.debug(msg)
@@ -1050,6 +1153,25 @@ class network:
         msg = 'Generic fluid property specification successful.'
         logging.debug(msg)
 
+    def init_spec(self, c):
+        r"""
+        Converts the specified fluid properties of a connection to SI units.
+
+        Parameters
+        ----------
+        c : tespy.connections.connection
+            Connection to initialise.
+        """
+        for key in ['m', 'p', 'h']:
+            if c.get_attr(key).val_set:
+                c.get_attr(key).val_SI = c.get_attr(key).val * self.get_attr(key)[c.get_attr(key).unit]
+        if c.T.val_set:
+            c.T.val_SI = (c.T.val + self.T[c.T.unit][0]) * self.T[c.T.unit][1]
+        if c.x.val_set:
+            c.x.val_SI = c.x.val
+        if c.v.val_set:
+            c.v.val_SI = c.v.val * self.v[c.v.unit]
+
     def init_val0(self, c, key):
         r"""
         Set starting values for fluid properties. The components classes provide generic starting
@@ -1092,30 +1214,38 @@ class network:
 
         Note
         ----
-        This method loads fluid property and fluid components starting values using the :code:`init_file` as input file.
+        This method loads fluid property and fluid components starting values using the :code:`init_file` as input file
+        or the snapshot :code:`init`.
         """
         # match connection (source, source_id, target, target_id) on
         # connection objects of design file
-        if self.path_abs:
-            path = self.init_path + '/conn.csv'
+        if self.init is not None:
+            data = self.init.conn_data(self.fluids)
         else:
-            path = './' + self.init_path + '/conn.csv'
-        df = pd.read_csv(path, index_col=0, delimiter=';', decimal='.')
+            if self.path_abs:
+                path = self.init_path
+            else:
+                path = './' + self.init_path
+
+            if os.path.isfile(path + '/network.npz'):
+                tables = hlp.load_npz(path + '/network.npz')
+                data = self.read_conn_data(tables['conn'], tables.get('conn_fluid', None))
+            else:
+                data = self.read_conn_csv(path + '/conn.csv')
         for c in self.conns.index:
-            conn = (df.loc[df['s'].isin([c.s.label]) & df['t'].isin([c.t.label]) &
-                           df['s_id'].isin([c.s_id]) & df['t_id'].isin([c.t_id])])
-            if len(conn.index) > 0:
-                conn_id = conn.index[0]
+            key = (c.s.label, c.s_id, c.t.label, c.t_id)
+            if key in data:
+                m, p, h, fluid = data[key]
                 # overwrite SI-values with values from init_file, except user specified values
                 if not c.m.val_set:
-                    c.m.val_SI = df.loc[conn_id].m * self.m[df.loc[conn_id].m_unit]
+                    c.m.val_SI = m
                 if not c.p.val_set:
-                    c.p.val_SI = df.loc[conn_id].p * self.p[df.loc[conn_id].p_unit]
+                    c.p.val_SI = p
                 if not c.h.val_set:
-                    c.h.val_SI = df.loc[conn_id].h * self.h[df.loc[conn_id].h_unit]
-                for fluid in self.fluids:
-                    if not c.fluid.val_set[fluid]:
-                        c.fluid.val[fluid] = df.loc[conn_id][fluid]
+                    c.h.val_SI = h
+                for fl, x in zip(self.fluids, fluid):
+                    if not c.fluid.val_set[fl]:
+                        c.fluid.val[fl] = x
 
                 # overwrite starting values
                 c.m.val0 = c.m.val_SI / self.m[c.m.unit]
@@ -1126,10 +1256,81 @@ class network:
                 msg = 'Could not find connection ' + c.s.label + ' (' + c.s_id + ') -> ' + c.t.label + ' (' + c.t_id + ') in .csv-file.'
                 logging.debug(msg)
 
-        msg = 'Specified starting values from init_path.'
+        msg = 'Specified starting values from init_path or snapshot.'
         logging.debug(msg)
 
-    def solve(self, mode, init_path=None, design_path=None, max_iter=50, init_only=False, **kwargs):
+    def read_conn_csv(self, path):
+        r"""
+        Reads the connection data from a results file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the connection results file (conn.csv).
+
+        Returns
+        -------
+        data : dict
+            Mass flow, pressure and enthalpy in SI units and fluid vector of
+            the connections, the keys are the labels of source and target
+            and the ids of outlet and inlet: :code:`(s, s_id, t, t_id)`.
+
+        Note
+        ----
+        The values are converted to SI units for all connections at once. If
+        the file contains more than one connection with the same key, the
+        first one is used. The fluid compositions are read from the
+        composition table next to the file (conn_fluid.csv), if it exists.
+        """
+        df = pd.read_csv(path, index_col=0, delimiter=';', decimal='.')
+        fn = os.path.splitext(path)[0] + '_fluid.csv'
+        if os.path.isfile(fn):
+            compositions = pd.read_csv(fn, delimiter=';', decimal='.')
+        else:
+            compositions = None
+        return self.read_conn_data(df, compositions)
+
+    def read_conn_data(self, df, compositions=None):
+        r"""
+        Reads the connection data from a results table.
+
+        Parameters
+        ----------
+        df : pandas.core.frame.DataFrame
+            Connection results, e. g. read from conn.csv or network.npz.
+
+        compositions : pandas.core.frame.DataFrame
+            Fluid composition table of the connections, see
+            :func:`tespy.networks.network.connection_data`. If not specified,
+            the fluid mass fractions are read from one column per fluid.
+
+        Returns
+        -------
+        data : dict
+            Mass flow, pressure and enthalpy in SI units and fluid vector of
+            the connections, see
+            :func:`tespy.networks.network.read_conn_csv`.
+        """
+        df = df.copy()
+        for key in ['m', 'p', 'h']:
+            df[key] = df[key] * df[key + '_unit'].map(self.get_attr(key))
+
+        if compositions is None:
+            fluids = df[self.fluids].values.tolist()
+        else:
+            vectors = {}
+            for i, x in network.read_compositions(compositions).items():
+                vectors[i] = [x.get(fl, 0) for fl in self.fluids]
+            zero = [0] * len(self.fluids)
+            fluids = [vectors.get(i, zero) for i in df['fluid']]
+
+        data = {}
+        keys = zip(df['s'], df['s_id'], df['t'], df['t_id'])
+        for key, m, p, h, fluid in zip(keys, df['m'], df['p'], df['h'], fluids):
+            data.setdefault(key, (m, p, h, fluid))
+        return data
+
+    def solve(self, mode, init_path=None, design_path=None, max_iter=50, init_only=False, design=None, init=None, **kwargs):
         r"""
         Solves the network. Tasks:
 
@@ -1155,6 +1356,12 @@ class network:
         init_only : boolean
             Perform initialisation only? default: :code:`False`.
 
+        design : tespy.networks.snapshot
+            Snapshot of the network's design case, can be used instead of :code:`design_path`, see :func:`tespy.networks.network.snapshot`.
+
+        init : tespy.networks.snapshot
+            Snapshot for starting values, can be used instead of :code:`init_path`.
+
         path_abs : boolean
             Absolute path specified?
 
@@ -1165,6 +1372,8 @@ class network:
         """
         self.init_path = init_path
         self.design_path = design_path
+        self.init = init
+        self.design = design
         self.max_iter = max_iter
         self.path_abs = kwargs.get('path_abs', False)
 
@@ -1188,6 +1397,8 @@ class network:
                'mode=' + self.mode +
                ', init_path=' + str(self.init_path) +
                ', design_path=' + str(self.design_path) +
+               ', design snapshot=' + str(self.design is not None) +
+               ', init snapshot=' + str(self.init is not None) +
                ', max_iter=' + str(max_iter) +
                ', init_only=' + str(init_only))
         logging.debug(msg)
@@ -1206,17 +1417,126 @@ class network:
         if init_only:
             return
 
+        # number of variables per connection
+        self.num_conn_vars = len(self.fluids) + 3
+
+        # check for network determination
+        self.solve_determination()
+        self.check_determination()
+
+        self.solve_main()
+
+    def resolve(self, max_iter=None):
+        r"""
+        Solves the network again, starting from the previous solution.
+
+        Network check, initialisation and design data of the previous
+        calculation are reused. Only the components and connections with
+        changed specifications are reinitialised.
+
+        Parameters
+        ----------
+        max_iter : int
+            Maximum number of iterations before calculation stops, default:
+            value of the previous calculation.
+
+        Note
+        ----
+        The specifications of components, connections and busses are compared
+        to the specifications of the previous calculation:
+
+        - Changed connection values are converted to SI units.
+        - Components with changed parameters are initialised again.
+        - If parameters have been set or unset, the network determination is
+          checked again.
+        - The fluid initialisation is performed, if fluid specifications changed.
+        - In offdesign mode, the offdesign parameters of the components are
+          set to their design values as in the offdesign preprocessing.
+
+        A full calculation (:func:`tespy.networks.network.solve`) is performed,
+        if the network's topology has been changed or the previous calculation
+        did not converge.
+
+        Example
+        -------
+        >>> from tespy import nwk, cmp, con
+        >>> nw = nwk.network(fluids=['water'], p_unit='bar', T_unit='C')
+        >>> nw.set_printoptions(print_level='none')
+        >>> so = cmp.source('source')
+        >>> si = cmp.sink('sink')
+        >>> pu = cmp.pump('pump')
+        >>> inc = con.connection(so, 'out1', pu, 'in1')
+        >>> outg = con.connection(pu, 'out1', si, 'in1')
+        >>> nw.add_conns(inc, outg)
+        >>> pu.set_attr(eta_s=0.8)
+        >>> inc.set_attr(fluid={'water': 1}, m=10, p=1, T=20)
+        >>> outg.set_attr(p=5)
+        >>> nw.solve('design')
+        >>> round(pu.P.val, 0)
+        5009.0
+        >>> outg.set_attr(p=10)
+        >>> nw.resolve()
+        >>> round(pu.P.val, 0)
+        11268.0
+        >>> outg.set_attr(p=np.nan)
+        >>> pu.set_attr(P=2e4)
+        >>> nw.resolve()
+        >>> round(outg.p.val, 1)
+        17.0
+        """
+        if not hasattr(self, 'spec'):
+            msg = 'Network has not been solved yet, please use the solve method.'
+            logging.error(msg)
+            raise hlp.TESPyNetworkError(msg)
+
+        if max_iter is not None:
+            self.max_iter = max_iter
+
+        if not self.checked or self.lin_dep or not self.progress:
+            self.solve(self.mode, init_path=self.init_path, design_path=self.design_path,
+                       max_iter=self.max_iter, design=self.design, init=self.init, path_abs=self.path_abs)
+            return
+
+        spec = self.get_spec()
+        changed = [obj for obj, val in spec.items() if val != self.spec.get(obj)]
+
+        msg = 'Resolving network, number of objects with changed specification: ' + str(len(changed)) + '.'
+        logging.debug(msg)
+
+        if self.mode == 'offdesign':
+            # the postprocessing of the previous calculation overwrote the
+            # offdesign parameters, set them to their design values again
+            self.comps.apply(network.process_components, axis=1, args=('pre',))
+
+        if any(spec[c][:2] != self.spec[c][:2] for c in changed if isinstance(c, con.connection)):
+            self.init_fluids()
+
+        for obj in changed:
+            if isinstance(obj, con.connection):
+                self.init_spec(obj)
+            elif isinstance(obj, cmp.component):
+                obj.comp_init(self)
+
+        # number of equations changed
+        if (spec.keys() != self.spec.keys() or
+                any(spec[obj][0] != self.spec[obj][0] for obj in changed if obj in self.spec)):
+            self.solve_determination()
+            self.check_determination()
+
+        self.solve_main()
+
+    def solve_main(self):
+        r"""
+        Performs the calculation and the postprocessing of an initialised network.
+        """
         self.res = np.array([])
 
         msg = 'Starting solver.'
         logging.info(msg)
 
         self.iter = 0
-        # number of variables per connection
-        self.num_conn_vars = len(self.fluids) + 3
-
-        # check for network determination
-        self.solve_determination()
+        # constant partial derivatives of connection equations
+        self.init_jacobian()
 
         self.solve_loop()
 
@@ -1243,6 +1563,7 @@ class network:
 
         self.post_processing()
         hlp.memorise.del_memory(self.fluids)
+        self.spec = self.get_spec()
 
         if self.lin_dep or not self.progress:
             return
@@ -1250,6 +1571,62 @@ class network:
         msg = 'Calculation complete.'
         logging.info(msg)
 
+    def get_spec(self):
+        r"""
+        Returns the specifications of the network's components, connections and busses.
+
+        Returns
+        -------
+        spec : dict
+            Dictionary with the network's objects as keys. The values are
+            tuples of the parameters determining the number of equations and
+            of the specified values.
+
+        Note
+        ----
+        In offdesign mode, the design values are used for the parameters
+        specified as offdesign parameters of the components, as these
+        parameters are set to their design values in preprocessing.
+        """
+        spec = {}
+        for c in self.conns.index:
+            flags = []
+            vals = []
+            for key in ['m', 'p', 'h', 'T', 'x', 'v']:
+                dc = c.get_attr(key)
+                flags += [dc.val_set, dc.ref_set]
+                if dc.val_set:
+                    vals += [dc.val, dc.unit]
+                if dc.ref_set:
+                    vals += [dc.ref.obj, dc.ref.f, dc.ref.d]
+            flags += list(c.fluid.val_set.items()) + [c.fluid.balance]
+            fluid = [(f, x) for f, x in c.fluid.val.items() if c.fluid.val_set.get(f, False)]
+            spec[c] = (flags, fluid, vals)
+
+        for cp in self.comps.index:
+            flags = []
+            vals = []
+            for key, val in cp.attr().items():
+                dc = cp.get_attr(key)
+                if isinstance(val, hlp.dc_cp):
+                    flags += [np.asarray(dc.is_set).tolist(), np.asarray(dc.is_var).tolist()]
+                    if np.any(dc.is_set):
+                        if self.mode == 'offdesign' and key in cp.offdesign:
+                            vals += [np.asarray(dc.design).tolist()]
+                        else:
+                            vals += [np.asarray(dc.val).tolist()]
+                elif isinstance(val, hlp.dc_gcp):
+                    flags += [dc.is_set, dc.method]
+                else:
+                    flags += [dc.is_set]
+                    vals += [dc.method, dc.param, np.asarray(dc.x).tolist(), np.asarray(dc.y).tolist()]
+            spec[cp] = (flags, None, vals)
+
+        for b in self.busses.values():
+            spec[b] = ([b.P.val_set], None, None)
+
+        return spec
+
     def solve_loop(self):
         r"""
         Loop of the newton algorithm
@@ -1372,7 +1749,7 @@ class network:
         - Check component parameters for consistency
         """
         self.vec_res = np.zeros([self.num_vars])
-        self.mat_deriv = np.zeros((self.num_vars, self.num_vars))
+        self.mat_deriv = self.mat_deriv_const.copy()
 
         self.solve_connections()
         self.solve_components()
@@ -1383,7 +1760,16 @@ class network:
         if self.lin_dep:
             return
 
-        # add the increment
+        self.solve_increment()
+
+    def solve_increment(self):
+        r"""
+        Adds the increment vec_z to the variables of the network.
+
+        - Restrict fluid properties to value ranges
+        - Check component parameters for consistency
+        - Update internal variables of the components
+        """
         i = 0
         for c in self.conns.index:
             # mass flow, pressure and enthalpy
@@ -1437,13 +1823,17 @@ class network:
                 c_vars += cp.num_vars
 
         # second property check for first three iterations without an init_file
-        if self.iter < 3 and self.init_path is None:
+        if self.iter < 3 and self.init_path is None and self.init is None:
             for cp in self.comps.index:
                 cp.convergence_check(self)
 
             for c in self.conns.index:
                 self.solve_check_props(c)
 
+        # update internal variables of the components
+        for cp in self.comps.index:
+            cp.apply_increment()
+
     def property_range_message(self, c, prop):
         r"""
         Returns debugging message for fluid property range adjustments.
@@ -1479,6 +1869,12 @@ class network:
         ----------
         c : tespy.connections.connection
             Connection to check fluid properties.
+
+        Note
+        ----
+        The enthalpy limits of pure fluids are interpolated in the table of
+        :func:`tespy.tools.helpers.memorise.h_range` instead of calculating
+        them from pressure and temperature limits in every iteration.
         """
         fl = hlp.single_fluid(c.fluid.val)
 
@@ -1486,46 +1882,39 @@ class network:
             # pressure
             if c.p.val_SI < hlp.memorise.vrange[fl][0] and not c.p.val_set:
                 c.p.val_SI = hlp.memorise.vrange[fl][0] * 1.01
-                logging.debug(self.property_range_message(c, 'p'))
+                logger.debug(self.property_range_message, c, 'p')
             if c.p.val_SI > hlp.memorise.vrange[fl][1] and not c.p.val_set:
                 c.p.val_SI = hlp.memorise.vrange[fl][1] * 0.99
-                logging.debug(self.property_range_message(c, 'p'))
+                logger.debug(self.property_range_message, c, 'p')
 
             # enthalpy
-            f = 1.01
-            try:
-                hmin = hlp.h_pT(c.p.val_SI, hlp.memorise.vrange[fl][2] * f, fl)
-            except ValueError:
-                f = 1.1
-                hmin = hlp.h_pT(c.p.val_SI, hlp.memorise.vrange[fl][2] * f, fl)
-
-            hmax = hlp.h_pT(c.p.val_SI, hlp.memorise.vrange[fl][3] * 0.99, fl)
+            hmin, hmax = hlp.memorise.h_range(c.p.val_SI, fl)
             if c.h.val_SI < hmin and not c.h.val_set:
                 if c.h.val_SI < 0:
                     c.h.val_SI = hmin / 1.1
                 else:
                     c.h.val_SI = hmin * 1.1
-                logging.debug(self.property_range_message(c, 'h'))
+                logger.debug(self.property_range_message, c, 'h')
             if c.h.val_SI > hmax and not c.h.val_set:
                 c.h.val_SI = hmax * 0.9
-                logging.debug(self.property_range_message(c, 'h'))
+                logger.debug(self.property_range_message, c, 'h')
 
-        elif self.iter < 4 and self.init_path is None:
+        elif self.iter < 4 and self.init_path is None and self.init is None:
             # pressure
             if c.p.val_SI <= self.p_range_SI[0] and not c.p.val_set:
                 c.p.val_SI = self.p_range_SI[0]
-                logging.debug(self.property_range_message(c, 'p'))
+                logger.debug(self.property_range_message, c, 'p')
             if c.p.val_SI >= self.p_range_SI[1] and not c.p.val_set:
                 c.p.val_SI = self.p_range_SI[1]
-                logging.debug(self.property_range_message(c, 'p'))
+                logger.debug(self.property_range_message, c, 'p')
 
             # enthalpy
             if c.h.val_SI < self.h_range_SI[0] and not c.h.val_set:
                 c.h.val_SI = self.h_range_SI[0]
-                logging.debug(self.property_range_message(c, 'h'))
+                logger.debug(self.property_range_message, c, 'h')
             if c.h.val_SI > self.h_range_SI[1] and not c.h.val_set:
                 c.h.val_SI = self.h_range_SI[1]
-                logging.debug(self.property_range_message(c, 'h'))
+                logger.debug(self.property_range_message, c, 'h')
 
             # temperature
             if c.T.val_set and not c.h.val_set:
@@ -1550,11 +1939,11 @@ class network:
                 c.h.val_SI = hmin * 0.9
             else:
                 c.h.val_SI = hmin * 1.1
-            logging.debug(self.property_range_message(c, 'h'))
+            logger.debug(self.property_range_message, c, 'h')
 
         if c.h.val_SI > hmax:
             c.h.val_SI = hmax * 0.95
-            logging.debug(self.property_range_message(c, 'h'))
+            logger.debug(self.property_range_message, c, 'h')
 
     def solve_components(self):
         r"""
@@ -1568,38 +1957,46 @@ class network:
         # fetch component equation residuals and component partial derivatives
         data = network.solve_comp(args=([self.comps], ))
 
-        sum_eq = 0
-        vec_res = []
-
         # append residual values to residual value vector
-        vec_res += [it for ls in data[0].tolist() for it in ls]
-        k = 0
-        c_var = 0
-        for cp in self.comps.index:
+        self.vec_res[0:self.num_comp_eq] = [it for ls in data[0].tolist() for it in ls]
+
+        # place derivatives of the nonlinear equations in jacobian matrix, the
+        # constant partial derivatives are part of the matrix template
+        for cp, deriv in zip(self.comps.index, data[1].tolist()):
+            if cp in self.comp_eq:
+                self.place_comp_deriv(self.mat_deriv, cp, deriv[0], self.comp_eq[cp][1])
+
+    def place_comp_deriv(self, mat_deriv, cp, deriv, rows):
+        r"""
+        Places partial derivatives of a component's equations in a jacobian matrix.
 
-            if (not isinstance(cp, cmp.source) and
-                    not isinstance(cp, cmp.sink)):
+        Parameters
+        ----------
+        mat_deriv : ndarray
+            Jacobian matrix.
 
-                i = 0
-                num_eq = len(data[1].iloc[k][0])
-                inlets = self.comps.loc[cp].i.tolist()
-                outlets = self.comps.loc[cp].o.tolist()
+        cp : tespy.components.components.component
+            Component to place the partial derivatives of.
 
-                # place derivatives in jacobian matrix
-                for c in inlets + outlets:
-                    loc = self.conns.index.get_loc(c)
-                    self.mat_deriv[sum_eq:sum_eq + num_eq, loc * self.num_conn_vars:(loc + 1) * self.num_conn_vars] = data[1].iloc[k][0][:, i]
-                    i += 1
+        deriv : ndarray
+            Matrix of partial derivatives of the component.
 
-                # derivatives for custom variables
-                for j in range(cp.num_vars):
-                    self.mat_deriv[sum_eq:sum_eq + num_eq, self.num_vars - self.num_comp_vars + c_var] = (data[1].iloc[k][0][:, i + j, :1].transpose()[0])
-                    c_var += 1
+        rows : list/slice
+            Rows of the component's equations to place in the jacobian matrix.
+        """
+        row, _, cols, var_col = self.comp_eq[cp]
+        if isinstance(rows, slice):
+            mat_rows = slice(row + rows.start, row + rows.stop)
+        else:
+            mat_rows = row + np.asarray(rows, dtype=int)
 
-                sum_eq += num_eq
-            k += 1
+        # connection variables
+        for i, col in enumerate(cols):
+            mat_deriv[mat_rows, col:col + self.num_conn_vars] = deriv[rows, i]
 
-        self.vec_res[0:self.num_comp_eq] = vec_res
+        # custom variables
+        for j in range(cp.num_vars):
+            mat_deriv[mat_rows, var_col + j] = deriv[rows, len(cols) + j, 0]
 
 # deprecated
 #    def solve_single_component(self, cp):
@@ -1656,119 +2053,54 @@ class network:
         Calculates the residual values and the partial derivatives for the network's
         connections equations.
 
-        - Iterate through connections in network to get residuals and derivatives.
-        - Place residual values in residual value vector of the network.
-        - Place partial derivatives in jacobian matrix of the network.
-        """
+        - Calculate residual values of referenced mass flow, pressure and enthalpy.
+        - Calculate residual values and partial derivatives of nonlinear equations.
+        - Calculate residual values of the fluid balance equations.
 
-        # fetch component equation residuals and component partial derivatives
-        data = network.solve_conn(args=(self, [self.conns], ))
+        Note
+        ----
+        The partial derivatives of all linear connection equations are constant and
+        have been placed in the jacobian matrix template on solver initialisation,
+        see :func:`tespy.networks.network.init_jacobian`.
+        """
+        # referenced mass flow, pressure and enthalpy
+        for row, c, var in self.conn_eq_linear:
+            self.vec_res[row] = self.solve_prop_ref_eq(c, var)
+
+        # temperature, volumetric flow, vapour mass fraction, referenced temperature
+        for row, c, var, col, col_ref in self.conn_eq_nonlinear:
+            if col_ref is None:
+                self.vec_res[row] = self.solve_prop_eq(c, var)
+                deriv = self.solve_prop_deriv(c, var)
+            else:
+                self.vec_res[row] = self.solve_prop_ref_eq(c, var)
+                deriv = self.solve_prop_ref_deriv(c, var)
+                self.mat_deriv[row, col_ref:col_ref + self.num_conn_vars] = deriv[0, 1]
 
-        row = self.num_comp_eq
-        var = {0: 'm', 1: 'p', 2: 'h', 3: 'T', 4: 'x', 5: 'v',
-               6: 'm', 7: 'p', 8: 'h', 9: 'T'}
-        vec_res = []
-
-        # write data in residual vector and jacobian matrix
-        vec_res += [it for ls in data[0].tolist()
-                    for it in ls if it is not None]
-        k = 0
-        for c in self.conns.index:
+            self.mat_deriv[row, col:col + self.num_conn_vars] = deriv[0, 0]
 
-            # variable counter
-            i = 0
-            loc = self.conns.index.get_loc(c)
-            for it in data[1].iloc[k]:
+        # fluid balance
+        for row, c in self.conn_eq_balance:
+            self.vec_res[row] = 1 - sum(c.fluid.val.values())
 
-                if it is not None:
+    def solve_busses(self):
+        r"""
+        Calculates the equations and the partial derivatives for the network's
+        busses.
 
-                    # fluid properties
-                    self.mat_deriv[row:row + 1, loc * self.num_conn_vars:(loc + 1) * self.num_conn_vars] = it[0, 0]
+        - Iterate through busses in network to get residuals and derivatives.
+        - Place residual values in residual value vector of the network.
+        - Place partial derivatives in jacobian matrix of the network.
+        """
+        row = self.num_comp_eq + self.num_conn_eq
+        for b in self.busses.values():
+            if b.P.val_set:
+                P_res = 0
+                for cp in b.comps.index:
+                    i = self.comps.loc[cp].i.tolist()
+                    o = self.comps.loc[cp].o.tolist()
 
-                    # referenced fluid properties
-                    if it[0].shape[0] == 2:
-                        c_ref = c.get_attr(var[i]).get_attr('ref')
-                        loc_ref = self.conns.index.get_loc(c_ref.obj)
-                        self.mat_deriv[row:row + 1, loc_ref * self.num_conn_vars:(loc_ref + 1) * self.num_conn_vars] = it[0, 1]
-
-                    row += 1
-                i += 1
-            k += 1
-
-        self.vec_res[self.num_comp_eq:row] = vec_res
-
-        # fluid vector
-        for c in self.conns.index:
-
-            col = self.conns.index.get_loc(c) * (self.num_conn_vars)
-            j = 0
-            # specified fluid mass fraction
-            for f in self.fluids:
-                if c.fluid.val_set[f]:
-                    self.mat_deriv[row, col + 3 + j] = 1
-                    row += 1
-                j += 1
-
-            # specified fluid mass balance
-            if c.fluid.balance:
-                j = 0
-                res = 1
-                for f in self.fluids:
-                    res -= c.fluid.val[f]
-                    self.mat_deriv[row, col + 3 + j] = -1
-                    j += 1
-
-                self.vec_res[row] = res
-                row += 1
-
-    def solve_conn(args):
-        nw, data = args
-
-        return [data[0].apply(network.solve_conn_eq, axis=1, args=(nw,)),
-                data[0].apply(network.solve_conn_deriv, axis=1, args=(nw,))]
-
-    def solve_conn_eq(c, nw):
-        return [nw.solve_prop_eq(c.name, 'm'),
-                nw.solve_prop_eq(c.name, 'p'),
-                nw.solve_prop_eq(c.name, 'h'),
-                nw.solve_prop_eq(c.name, 'T'),
-                nw.solve_prop_eq(c.name, 'x'),
-                nw.solve_prop_eq(c.name, 'v'),
-                nw.solve_prop_ref_eq(c.name, 'm'),
-                nw.solve_prop_ref_eq(c.name, 'p'),
-                nw.solve_prop_ref_eq(c.name, 'h'),
-                nw.solve_prop_ref_eq(c.name, 'T')]
-
-    def solve_conn_deriv(c, nw):
-        return [nw.solve_prop_deriv(c.name, 'm'),
-                nw.solve_prop_deriv(c.name, 'p'),
-                nw.solve_prop_deriv(c.name, 'h'),
-                nw.solve_prop_deriv(c.name, 'T'),
-                nw.solve_prop_deriv(c.name, 'x'),
-                nw.solve_prop_deriv(c.name, 'v'),
-                nw.solve_prop_ref_deriv(c.name, 'm'),
-                nw.solve_prop_ref_deriv(c.name, 'p'),
-                nw.solve_prop_ref_deriv(c.name, 'h'),
-                nw.solve_prop_ref_deriv(c.name, 'T')]
-
-    def solve_busses(self):
-        r"""
-        Calculates the equations and the partial derivatives for the network's
-        busses.
-
-        - Iterate through busses in network to get residuals and derivatives.
-        - Place residual values in residual value vector of the network.
-        - Place partial derivatives in jacobian matrix of the network.
-        """
-        row = self.num_comp_eq + self.num_conn_eq
-        for b in self.busses.values():
-            if b.P.val_set:
-                P_res = 0
-                for cp in b.comps.index:
-                    i = self.comps.loc[cp].i.tolist()
-                    o = self.comps.loc[cp].o.tolist()
-
-                    bus = b.comps.loc[cp]
+                    bus = b.comps.loc[cp]
 
                     P_res += cp.bus_func(bus)
                     deriv = -cp.bus_deriv(bus)
@@ -2097,13 +2429,13 @@ class network:
 
     def solve_determination(self):
         r"""
-        Checks, if the number of supplied parameters is sufficient for network determination.
+        Counts the number of equations and variables of the network.
         """
         self.num_comp_vars = 0
         n = 0
         for cp in self.comps.index:
             self.num_comp_vars += cp.num_vars
-            n += len(cp.equations())
+            n += cp.num_eq()
 
         msg = 'Number of component equations: ' + str(n)
         logging.debug(msg)
@@ -2147,6 +2479,10 @@ class network:
         msg = 'Number of connection variables: ' + str(self.num_conn_vars * len(self.conns.index))
         logging.debug(msg)
 
+    def check_determination(self):
+        r"""
+        Checks, if the number of supplied parameters is sufficient for network determination.
+        """
         n = self.num_comp_eq + self.num_conn_eq + self.num_bus_eq
         if n > self.num_vars:
             msg = ('You have provided too many parameters: ' + str(self.num_vars) + ' required, ' + str(n) + ' supplied. Aborting calculation!')
@@ -2157,6 +2493,99 @@ class network:
             logging.error(msg)
             raise hlp.TESPyNetworkError(msg)
 
+    def init_jacobian(self):
+        r"""
+        Sets up the jacobian matrix template holding the constant partial derivatives
+        of the network's component and connection equations.
+
+        - Specified mass flow, pressure, enthalpy and fluid mass fractions as well as
+          referenced mass flow, pressure and enthalpy are linear equations.
+        - The partial derivatives of the fluid balance equations are constant, too.
+        - The components provide the rows of their equations with constant partial
+          derivatives, e. g. fluid and mass flow balance or specified pressure ratios
+          (:code:`component.constant_rows()`).
+        - These partial derivatives are placed in the template only once. In every
+          iteration the template is copied and the rows of the nonlinear equations
+          are refreshed.
+        """
+        num_eq = self.num_comp_eq + self.num_conn_eq + self.num_bus_eq
+        self.mat_deriv_const = np.zeros((num_eq, self.num_vars))
+        self.conn_eq_linear = []
+        self.conn_eq_nonlinear = []
+        self.conn_eq_balance = []
+
+        # components: first row, nonlinear rows, columns of the connections
+        # and first column of the custom variables
+        self.comp_eq = collections.OrderedDict()
+        row = 0
+        var_col = self.num_vars - self.num_comp_vars
+        for cp in self.comps.index:
+            if isinstance(cp, cmp.source) or isinstance(cp, cmp.sink):
+                continue
+
+            num_eq = cp.num_eq()
+            conns = self.comps.loc[cp].i.tolist() + self.comps.loc[cp].o.tolist()
+            cols = [self.conns.index.get_loc(c) * self.num_conn_vars for c in conns]
+            const = cp.constant_rows()
+            if len(const) == 0:
+                rows = slice(0, num_eq)
+            else:
+                rows = np.setdiff1d(np.arange(num_eq), const)
+
+            self.comp_eq[cp] = [row, rows, cols, var_col]
+            if len(const) > 0:
+                # some components (e. g. nodes) set up their derivatives in the
+                # equations method
+                cp.equations()
+                self.place_comp_deriv(self.mat_deriv_const, cp, cp.derivatives(), const)
+
+            row += num_eq
+            var_col += cp.num_vars
+
+        row = self.num_comp_eq
+        for c in self.conns.index:
+            col = self.conns.index.get_loc(c) * self.num_conn_vars
+
+            # specified fluid properties
+            for var in ['m', 'p', 'h', 'T', 'x', 'v']:
+                if c.get_attr(var).val_set:
+                    if var in ['m', 'p', 'h']:
+                        self.mat_deriv_const[row, col:col + self.num_conn_vars] = self.solve_prop_deriv(c, var)[0, 0]
+                    else:
+                        self.conn_eq_nonlinear += [[row, c, var, col, None]]
+                    row += 1
+
+            # referenced fluid properties
+            for var in ['m', 'p', 'h', 'T']:
+                if c.get_attr(var).ref_set:
+                    col_ref = self.conns.index.get_loc(c.get_attr(var).ref.obj) * self.num_conn_vars
+                    if var == 'T':
+                        self.conn_eq_nonlinear += [[row, c, var, col, col_ref]]
+                    else:
+                        deriv = self.solve_prop_ref_deriv(c, var)
+                        self.mat_deriv_const[row, col:col + self.num_conn_vars] = deriv[0, 0]
+                        self.mat_deriv_const[row, col_ref:col_ref + self.num_conn_vars] = deriv[0, 1]
+                        self.conn_eq_linear += [[row, c, var]]
+                    row += 1
+
+        # fluid vector
+        for c in self.conns.index:
+
+            col = self.conns.index.get_loc(c) * self.num_conn_vars
+            j = 0
+            # specified fluid mass fraction
+            for f in self.fluids:
+                if c.fluid.val_set[f]:
+                    self.mat_deriv_const[row, col + 3 + j] = 1
+                    row += 1
+                j += 1
+
+            # specified fluid mass balance
+            if c.fluid.balance:
+                self.mat_deriv_const[row, col + 3:col + self.num_conn_vars] = -1
+                self.conn_eq_balance += [[row, c]]
+                row += 1
+
     def post_processing(self):
         r"""
         Calculate bus, component parameters and connection parameters.
@@ -2190,6 +2619,10 @@ class network:
             c.h.val0 = c.h.val
             c.fluid.val0 = c.fluid.val.copy()
 
+        # result sinks
+        for sink in self.result_sinks:
+            sink.push(self)
+
         msg = 'Postprocessing complete.'
         logging.info(msg)
 
@@ -2253,6 +2686,51 @@ class network:
 
 # %% saving
 
+    def snapshot(self):
+        r"""
+        Returns a snapshot of the network's results.
+
+        Returns
+        -------
+        snap : tespy.networks.snapshot
+            Snapshot holding the connection values, the component parameters
+            and the reference values of the busses.
+
+        Note
+        ----
+        The snapshot can be used as design case and for starting values of a
+        calculation instead of saving the network to a results folder:
+        :code:`nw.solve('offdesign', design=snap, init=snap)`.
+
+        Example
+        -------
+        >>> from tespy import nwk, cmp, con
+        >>> import pickle
+        >>> nw = nwk.network(fluids=['water'], p_unit='bar', T_unit='C')
+        >>> nw.set_printoptions(print_level='none')
+        >>> so = cmp.source('source')
+        >>> si = cmp.sink('sink')
+        >>> pu = cmp.pump('pump')
+        >>> inc = con.connection(so, 'out1', pu, 'in1')
+        >>> outg = con.connection(pu, 'out1', si, 'in1')
+        >>> nw.add_conns(inc, outg)
+        >>> pu.set_attr(eta_s=0.8, design=['eta_s'], offdesign=['eta_s_char'])
+        >>> inc.set_attr(fluid={'water': 1}, m=10, p=1, T=20)
+        >>> outg.set_attr(p=5)
+        >>> nw.solve('design')
+        >>> snap = nw.snapshot()
+        >>> inc.set_attr(m=9)
+        >>> nw.solve('offdesign', design=snap)
+        >>> round(pu.eta_s.val, 3)
+        0.793
+        >>> snap = pickle.loads(pickle.dumps(snap))
+        >>> inc.set_attr(m=11)
+        >>> nw.solve('offdesign', design=snap, init=snap)
+        >>> round(pu.eta_s.val, 3)
+        0.794
+        """
+        return snapshot(self)
+
     def save(self, path, **kwargs):
         r"""
         Saves the results to results file. If structure is True, the network structure is exported.
@@ -2265,40 +2743,350 @@ class network:
         path_abs : boolean
             Absolute path specified?
 
+        fmt : str
+            File format, choose from 'csv' (default) and 'npz'.
+
+        structure_path : str
+            Path to a folder for the network structure shared by many saves
+            (:code:`fmt='npz'` only), default: None.
+
         Note
         ----
         File results will be saved to ./filename/results.csv. If you provide :code:`save(structure=True)`,
         all network information will be saved to path ./filename/.
+
+        With :code:`fmt='npz'` all network information is saved to the
+        binary file ./filename/network.npz instead, see
+        :func:`tespy.networks.network.save_npz`. If a structure_path is
+        specified, network.npz only holds the numeric state of the network and
+        references the network structure in the structure_path.
+        """
+        path, fmt, structure_path = self.save_options(path, **kwargs)
+        network.write_tables(path, self.network_tables(), fmt, structure_path)
+
+    def save_async(self, path, **kwargs):
+        r"""
+        Saves the network in the background.
+
+        Parameters
+        ----------
+        path : str
+            Path for the network information.
+
+        kwargs
+            Keyword arguments of :func:`tespy.networks.network.save`.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Future of the save, :code:`future.result()` waits for the files
+            to be written and raises the errors of the save, if any.
+
+        Note
+        ----
+        The network information is copied to tables (see
+        :func:`tespy.networks.network.network_tables`) on calling this
+        method, the tables are written to the files on a background thread.
+        Thus, the network can be changed and solved again while the files
+        are written. The saves are written one after another in the order of
+        the calls, pending saves are completed before the interpreter exits.
+
+        Example
+        -------
+        >>> from tespy import nwk, nwkr, cmp, con
+        >>> import shutil
+        >>> nw = nwk.network(fluids=['water'], p_unit='bar', T_unit='C')
+        >>> nw.set_printoptions(print_level='none')
+        >>> so = cmp.source('source')
+        >>> si = cmp.sink('sink')
+        >>> pu = cmp.pump('pump')
+        >>> inc = con.connection(so, 'out1', pu, 'in1')
+        >>> outg = con.connection(pu, 'out1', si, 'in1')
+        >>> nw.add_conns(inc, outg)
+        >>> pu.set_attr(eta_s=0.8)
+        >>> inc.set_attr(fluid={'water': 1}, p=1, T=20)
+        >>> outg.set_attr(p=5)
+        >>> futures = []
+        >>> for m in [8, 9, 10]:
+        ...     inc.set_attr(m=m)
+        ...     nw.solve('design')
+        ...     futures += [nw.save_async('tmp/m_' + str(m))]
+        >>> [f.result() for f in futures]
+        [None, None, None]
+        >>> nw2 = nwkr.load_nwk('tmp/m_9')
+        >>> nw2.imp_conns['pump:in1'].m.val
+        9.0
+        >>> shutil.rmtree('./tmp', ignore_errors=True)
+        """
+        path, fmt, structure_path = self.save_options(path, **kwargs)
+        tables = self.network_tables()
+        future = get_save_executor().submit(network.write_tables, path, tables, fmt, structure_path)
+        future.add_done_callback(network.save_done)
+        return future
+
+    def save_options(self, path, **kwargs):
+        r"""
+        Checks the options for saving the network.
+
+        Parameters
+        ----------
+        path : str
+            Path for the network information.
+
+        kwargs
+            Keyword arguments of :func:`tespy.networks.network.save`.
+
+        Returns
+        -------
+        path : str
+            Path for the network information including trailing slash.
+
+        fmt : str
+            File format.
+
+        structure_path : str
+            Path to a folder for the shared network structure.
         """
         if kwargs.get('path_abs', False):
             path = path + '/'
         else:
             path = './' + path + '/'
 
+        fmt = kwargs.get('fmt', 'csv')
+        if fmt not in ['csv', 'npz']:
+            msg = 'File format must be \'csv\' or \'npz\'.'
+            logging.error(msg)
+            raise ValueError(msg)
+
+        structure_path = kwargs.get('structure_path', None)
+        if structure_path is not None and fmt != 'npz':
+            msg = 'A shared structure_path is only available for the file format \'npz\'.'
+            logging.error(msg)
+            raise ValueError(msg)
+
+        return path, fmt, structure_path
+
+    def network_tables(self):
+        r"""
+        Returns all network information as tables.
+
+        Returns
+        -------
+        tables : collections.OrderedDict
+            Dataframes of the network data, the keys are the file names
+            relative to the network's path without extension, e. g. 'conn' or
+            'comps/pump'.
+        """
+        tables = collections.OrderedDict()
+        tables['netw'] = self.network_data()
+        tables['conn'], tables['conn_fluid'] = self.connection_data(structure=True)
+        for cp, df in self.component_data().items():
+            tables['comps/' + cp] = df.reset_index()
+        tables['comps/bus'] = self.bus_data().reset_index()
+        tables['comps/char'], tables['comps/char_map'] = self.characteristic_data()
+
+        return tables
+
+    def write_tables(path, tables, fmt='csv', structure_path=None):
+        r"""
+        Writes the network tables to the network's path.
+
+        Parameters
+        ----------
+        path : str
+            Path for the network information including trailing slash.
+
+        tables : collections.OrderedDict
+            Dataframes of the network data, see
+            :func:`tespy.networks.network.network_tables`.
+
+        fmt : str
+            File format, choose from 'csv' (default) and 'npz'.
+
+        structure_path : str
+            Path to a folder for the shared network structure
+            (:code:`fmt='npz'` only), default: None.
+        """
         logging.debug('Saving network to path ' + path + '.')
         # creat path, if non existent
         if not os.path.exists(path):
             os.makedirs(path)
 
+        if fmt == 'npz':
+            network.write_npz(path + 'network.npz', tables, structure_path)
+            return
+
         # create path for component folder if non existent
         if not os.path.exists(path + 'comps/'):
             os.makedirs(path + 'comps/')
 
         # save all network information
-        self.save_network(path + 'netw.csv')
-        self.save_connections(path + 'conn.csv', structure=True)
-        self.save_components(path + 'comps/')
-        self.save_busses(path + 'comps/bus.csv')
-        self.save_characteristics(path + 'comps/')
+        for name, df in tables.items():
+            fn = path + name + '.csv'
+            df.to_csv(fn, sep=';', decimal='.', index=False, na_rep='nan')
+            logging.debug('Network information (' + name + ') saved to ' + fn + '.')
+
+    def save_done(future):
+        r"""
+        Logs the errors of a save in the background.
+
+        Parameters
+        ----------
+        future : concurrent.futures.Future
+            Future of the save.
+        """
+        if not future.cancelled() and future.exception() is not None:
+            msg = 'Saving the network in the background failed: ' + str(future.exception())
+            logging.error(msg)
 
-    def save_network(self, fn):
+    def save_npz(self, fn, structure_path=None):
         r"""
-        Saves basic network configuration.
+        Saves all network information to a single binary file.
 
         Parameters
         ----------
         fn : str
-            Path/filename for the network configuration file.
+            Path/filename for the file.
+
+        structure_path : str
+            Path to a folder for the shared network structure, default: None.
+
+        Note
+        ----
+        The file holds the same tables as the .csv-files of the network, the
+        tables are saved with :func:`tespy.tools.helpers.save_npz`. The
+        values of the characteristic lines and maps are saved as float arrays.
+
+        If a structure_path is specified, the columns returned by
+        :func:`tespy.networks.network.structure_columns` are saved to a file
+        in the structure_path named after the hash of their content. This
+        file is only written, if no identical structure has been saved
+        before. The file fn holds the values and units of the connections,
+        the component property values and the bus values only.
+
+        Example
+        -------
+        >>> from tespy import nwk, nwkr, cmp, con
+        >>> import os
+        >>> import shutil
+        >>> nw = nwk.network(fluids=['water'], p_unit='bar', T_unit='C')
+        >>> nw.set_printoptions(print_level='none')
+        >>> so = cmp.source('source')
+        >>> si = cmp.sink('sink')
+        >>> pu = cmp.pump('pump')
+        >>> inc = con.connection(so, 'out1', pu, 'in1')
+        >>> outg = con.connection(pu, 'out1', si, 'in1')
+        >>> nw.add_conns(inc, outg)
+        >>> pu.set_attr(eta_s=0.8, design=['eta_s'], offdesign=['eta_s_char'])
+        >>> inc.set_attr(fluid={'water': 1}, m=10, p=1, T=20)
+        >>> outg.set_attr(p=5)
+        >>> nw.solve('design')
+        >>> nw.save('tmp', fmt='npz')
+        >>> nw2 = nwkr.load_nwk('tmp')
+        >>> nw2.set_printoptions(print_level='none')
+        >>> nw2.imp_conns['pump:in1'].set_attr(m=9)
+        >>> nw2.solve('offdesign', design_path='tmp')
+        >>> round(nw2.imp_comps['pump'].eta_s.val, 3)
+        0.793
+        >>> for m in [8, 9, 10]:
+        ...     inc.set_attr(m=m)
+        ...     nw.solve('design')
+        ...     nw.save('tmp/m_' + str(m), fmt='npz', structure_path='tmp/structure')
+        >>> len(os.listdir('tmp/structure'))
+        1
+        >>> nw3 = nwkr.load_nwk('tmp/m_9')
+        >>> nw3.set_printoptions(print_level='none')
+        >>> nw3.solve('design')
+        >>> round(nw3.imp_comps['pump'].P.val)
+        4508
+        >>> shutil.rmtree('./tmp', ignore_errors=True)
+        """
+        network.write_npz(fn, self.network_tables(), structure_path)
+
+    def write_npz(fn, tables, structure_path=None):
+        r"""
+        Writes the network tables to a single binary file.
+
+        Parameters
+        ----------
+        fn : str
+            Path/filename for the file.
+
+        tables : collections.OrderedDict
+            Dataframes of the network data, see
+            :func:`tespy.networks.network.network_tables`.
+
+        structure_path : str
+            Path to a folder for the shared network structure, default: None.
+        """
+        tables = tables.copy()
+        chars = tables['comps/char'].copy()
+        char_maps = tables['comps/char_map'].copy()
+        for col in ['x', 'y']:
+            chars[col] = [np.asarray(val, dtype=float) for val in chars[col]]
+        for col in ['x', 'y', 'z1', 'z2']:
+            char_maps[col] = [np.asarray(val, dtype=float) for val in char_maps[col]]
+        tables['comps/char'] = chars
+        tables['comps/char_map'] = char_maps
+
+        if structure_path is None:
+            hlp.save_npz(fn, tables)
+        else:
+            hlp.save_npz(fn, tables, shared=network.structure_columns(tables),
+                         shared_path=structure_path)
+        logging.debug('Network information saved to ' + fn + '.')
+
+    def structure_columns(tables):
+        r"""
+        Returns the columns of the network tables describing the network
+        structure.
+
+        Parameters
+        ----------
+        tables : dict
+            Dictionary with the table names as keys and pandas dataframes as
+            values, see :func:`tespy.networks.network.network_tables`.
+
+        Returns
+        -------
+        cols : dict
+            Dictionary with the table names as keys and the names of the
+            structure columns as values.
+
+        Note
+        ----
+        All columns except the values and units of the connections (including
+        starting values and fluid compositions), the property values of the
+        components and the values of the busses describe the network
+        structure. The property values of the components are identified by
+        the corresponding column of the variable specification (suffix _var).
+        """
+        state = {}
+        state['conn'] = []
+        for key in ['m', 'p', 'h', 'T', 'x', 'v']:
+            state['conn'] += [key, key + '_unit', key + '0']
+        state['conn'] += ['fluid', 'fluid0']
+        state['conn_fluid'] = ['composition', 'fluid', 'val']
+
+        state['comps/bus'] = ['P']
+        for name, df in tables.items():
+            if name.startswith('comps/') and name not in state:
+                state[name] = [col for col in df.columns if col + '_var' in df.columns]
+
+        cols = {}
+        for name, df in tables.items():
+            cols[name] = [col for col in df.columns if col not in state.get(name, [])]
+
+        return cols
+
+    def network_data(self):
+        r"""
+        Returns the basic network configuration.
+
+        Returns
+        -------
+        df : pandas.core.frame.DataFrame
+            Units, value ranges and fluids of the network.
         """
         data = {}
         data['m_unit'] = self.m_unit
@@ -2313,152 +3101,196 @@ class network:
         data['T_max'] = self.T_range[1]
         data['fluids'] = [self.fluids]
 
-        df = pd.DataFrame(data=data)
+        return pd.DataFrame(data=data)
 
-        df.to_csv(fn, sep=';', decimal='.', index=False, na_rep='nan')
-        logging.debug('Network information saved to ' + fn + '.')
-
-    def save_connections(self, fn, structure=False):
+    def connection_data(self, structure=False):
         r"""
-        Saves connections to fn, saves network structure data if structure is True.
-
-        - Uses connections object id as row identifier and saves
-            * connections source and target as well as
-            * properties with references and
-            * fluid vector (including user specification if structure is True).
-        - Connections source and target are identified by its labels.
+        Returns the connection data, including network structure data if
+        structure is True.
 
         Parameters
         ----------
-        fn : str
-            Path/filename for the file.
-        """
-        df = pd.DataFrame()
-        # connection id
-        df['id'] = self.conns.apply(network.get_id, axis=1)
-        # source
-        df['s'] = self.conns.apply(network.get_props, axis=1, args=('s', 'label'))
-        df['s_id'] = self.conns.apply(network.get_props, axis=1, args=('s_id',))
-        # target
-        df['t'] = self.conns.apply(network.get_props, axis=1, args=('t', 'label'))
-        df['t_id'] = self.conns.apply(network.get_props, axis=1, args=('t_id',))
+        structure : boolean
+            Include parametrisation and references of the connections?
+
+        Returns
+        -------
+        df : pandas.core.frame.DataFrame
+            Connection data, one row per connection.
+
+        compositions : pandas.core.frame.DataFrame
+            Fluid composition table with the columns composition, fluid and
+            val.
+
+        Note
+        ----
+        The rows are created in a single pass over the network's connections.
+
+        The fluid compositions (fluid vector and starting values) are saved
+        once in the composition table, the connection data hold the index of
+        the composition in the columns fluid and fluid0. The composition table
+        holds the nonzero mass fractions of every composition only, one row
+        per fluid. The user specified fluids are saved as list in the column
+        fluid_set.
 
+        Example
+        -------
+        >>> from tespy import nwk, cmp, con
+        >>> nw = nwk.network(fluids=['water', 'air', 'CO2'], p_unit='bar',
+        ...                  T_unit='C')
+        >>> nw.set_printoptions(print_level='none')
+        >>> so = cmp.source('source')
+        >>> sp = cmp.splitter('splitter')
+        >>> si1 = cmp.sink('sink 1')
+        >>> si2 = cmp.sink('sink 2')
+        >>> inc = con.connection(so, 'out1', sp, 'in1')
+        >>> out1 = con.connection(sp, 'out1', si1, 'in1')
+        >>> out2 = con.connection(sp, 'out2', si2, 'in1')
+        >>> nw.add_conns(inc, out1, out2)
+        >>> inc.set_attr(fluid={'water': 0, 'air': 0.9, 'CO2': 0.1}, m=1, p=1,
+        ...              T=20)
+        >>> out1.set_attr(m=0.5)
+        >>> nw.solve('design')
+        >>> df, compositions = nw.connection_data(structure=True)
+        >>> df.fluid.tolist()
+        [0, 0, 0]
+        >>> df.fluid_set.tolist()
+        [['CO2', 'air', 'water'], [], []]
+        >>> compositions[compositions.composition == 0].values.tolist()
+        [[0, 'CO2', 0.1], [0, 'air', 0.9]]
+        """
+        cols = ['id', 's', 's_id', 't', 't_id']
         if structure:
-            # design and offdesign parameters
-            df['design'] = self.conns.apply(network.get_props, axis=1, args=('design',))
-            df['offdesign'] = self.conns.apply(network.get_props, axis=1, args=('offdesign',))
+            cols += ['design', 'offdesign']
 
-        cols = ['m', 'p', 'h', 'T', 'x', 'v']
-        for key in cols:
-            # values and units
-            df[key] = self.conns.apply(network.get_props, axis=1, args=(key, 'val'))
-            df[key + '_unit'] = self.conns.apply(network.get_props, axis=1, args=(key, 'unit'))
+        props = ['m', 'p', 'h', 'T', 'x', 'v']
+        for key in props:
+            cols += [key, key + '_unit']
+            if structure:
+                cols += [key + '_unit_set', key + '0', key + '_set',
+                         key + '_ref', key + '_ref_f', key + '_ref_d', key + '_ref_set']
+
+        cols += ['fluid']
+        if structure:
+            cols += ['fluid0', 'fluid_set', 'balance']
 
+        compositions = collections.OrderedDict()
+        rows = []
+        for c in self.conns.index:
+            # connection id, source and target
+            row = [network.get_conn_id(c), c.s.label, c.s_id, c.t.label, c.t_id]
             if structure:
-                # connection parametrisation
-                df[key + '_unit_set'] = self.conns.apply(network.get_props, axis=1, args=(key, 'unit_set'))
-                df[key + '0'] = self.conns.apply(network.get_props, axis=1, args=(key, 'val0'))
-                df[key + '_set'] = self.conns.apply(network.get_props, axis=1, args=(key, 'val_set'))
-                df[key + '_ref'] = self.conns.apply(network.get_props, axis=1, args=(key, 'ref', 'obj',)).astype(str)
-                df[key + '_ref'] = df[key + '_ref'].str.extract(r' at (.*?)>', expand=False)
-                df[key + '_ref_f'] = self.conns.apply(network.get_props, axis=1, args=(key, 'ref', 'f',))
-                df[key + '_ref_d'] = self.conns.apply(network.get_props, axis=1, args=(key, 'ref', 'd',))
-                df[key + '_ref_set'] = self.conns.apply(network.get_props, axis=1, args=(key, 'ref_set',))
-
-        for val in self.fluids:
-            # fluid mass fraction
-            df[val] = self.conns.apply(network.get_props, axis=1, args=('fluid', 'val', val))
+                # design and offdesign parameters
+                row += [c.design, c.offdesign]
+
+            for key in props:
+                # values and units
+                dc = c.get_attr(key)
+                row += [dc.val, dc.unit]
+                if structure:
+                    # connection parametrisation
+                    ref = dc.ref
+                    if ref is not None:
+                        row += [dc.unit_set, dc.val0, dc.val_set,
+                                network.get_conn_id(ref.obj), ref.f, ref.d, dc.ref_set]
+                    else:
+                        row += [dc.unit_set, dc.val0, dc.val_set,
+                                np.nan, np.nan, np.nan, dc.ref_set]
 
+            # fluid composition
+            row += [network.get_composition_id(c.fluid.val, self.fluids, compositions)]
             if structure:
-                # fluid mass fraction parametrisation
-                df[val + '0'] = self.conns.apply(network.get_props, axis=1, args=('fluid', 'val0', val))
-                df[val + '_set'] = self.conns.apply(network.get_props, axis=1, args=('fluid', 'val_set', val))
+                # fluid composition parametrisation and fluid balance
+                row += [network.get_composition_id(c.fluid.val0, self.fluids, compositions),
+                        [fluid for fluid in self.fluids if c.fluid.val_set[fluid]],
+                        c.fluid.balance]
 
-        if structure:
-            # fluid balance parametrisation
-            df['balance'] = self.conns.apply(network.get_props, axis=1, args=('fluid', 'balance'))
+            rows += [row]
 
-        df.to_csv(fn, sep=';', decimal='.', index=False, na_rep='nan')
-        logging.debug('Connection information saved to ' + fn + '.')
+        comp_rows = []
+        for composition, i in compositions.items():
+            comp_rows += [[i, fluid, x] for fluid, x in composition]
 
-    def save_components(self, path):
-        r"""
-        Saves the components to filename/comps/name_of_component_type.csv
+        return (pd.DataFrame(rows, columns=cols),
+                pd.DataFrame(comp_rows, columns=['composition', 'fluid', 'val']))
 
-        - Uses components labels as row identifier.
-        - Writes:
+    def component_data(self):
+        r"""
+        Returns the component data grouped by component type.
 
-            - component's incomming and outgoing connections (object id) and
-            - component's parametrisation.
+        Returns
+        -------
+        data : collections.OrderedDict
+            Dataframes of the component data with the component labels as
+            index, the keys are the names of the component classes.
 
-        Parameters
-        ----------
-        path : str
-            Path/filename for the file.
+        Note
+        ----
+        The rows are created in a single pass over the network's components.
         """
-        # create / overwrite csv file
-        cp_sort = self.comps.copy()
-        # component type
-        cp_sort['cp'] = cp_sort.apply(network.get_class_base, axis=1)
+        rows = collections.OrderedDict()
+        cols = collections.OrderedDict()
+        for cp in self.comps.index:
+            c = cp.__class__.__name__
+            if c not in rows:
+                # basic information and busses
+                cols[c] = ['label', 'cp', 'busses', 'bus_param', 'bus_P_ref', 'bus_char',
+                           'mode', 'design', 'offdesign', 'interface']
+                for col, dc in cp.attr().items():
+                    if isinstance(dc, hlp.dc_cc) or isinstance(dc, hlp.dc_cm):
+                        cols[c] += [col, col + '_set', col + '_method', col + '_param']
+                    elif isinstance(dc, hlp.dc_cp):
+                        cols[c] += [col, col + '_set', col + '_var']
+                    elif isinstance(dc, hlp.dc_gcp):
+                        cols[c] += [col]
+                rows[c] = []
 
-        # busses
-        cp_sort['busses'] = cp_sort.apply(network.get_busses, axis=1, args=(self.busses.values(),))
-        cp_sort['bus_param'] = cp_sort.apply(network.get_bus_data, axis=1, args=(self.busses.values(), 'param'))
-        cp_sort['bus_P_ref'] = cp_sort.apply(network.get_bus_data, axis=1, args=(self.busses.values(), 'P_ref'))
-        cp_sort['bus_char'] = cp_sort.apply(network.get_bus_data, axis=1, args=(self.busses.values(), 'char'))
+            # basic information
+            row = [cp.label, c]
 
-        pd.options.mode.chained_assignment = None
-        for c in cp_sort.cp.unique():
-            df = cp_sort[cp_sort['cp'] == c]
+            # busses
+            busses = [bus for bus in self.busses.values() if cp in bus.comps.index]
+            row += [[bus.label for bus in busses],
+                    [bus.comps.loc[cp]['param'] for bus in busses],
+                    [bus.comps.loc[cp]['P_ref'] for bus in busses],
+                    [network.get_char_id(bus.comps.loc[cp]['char']) for bus in busses]]
 
-            # basic information
-            cols = ['label', 'mode', 'design', 'offdesign', 'interface']
-            for col in cols:
-                df[col] = df.apply(network.get_props, axis=1, args=(col,))
+            row += [cp.mode, cp.design, cp.offdesign, cp.interface]
 
             # attributes
-            for col, dc in df.index[0].attr().items():
+            for col in cp.attr().keys():
+                dc = cp.get_attr(col)
                 # component characteristics container
-                if isinstance(dc, hlp.dc_cc):
-                    df[col] = df.apply(network.get_props, axis=1, args=(col, 'func')).astype(str)
-                    df[col] = df[col].str.extract(r' at (.*?)>', expand=False)
-                    df[col + '_set'] = df.apply(network.get_props, axis=1, args=(col, 'is_set'))
-                    df[col + '_method'] = df.apply(network.get_props, axis=1, args=(col, 'method'))
-                    df[col + '_param'] = df.apply(network.get_props, axis=1, args=(col, 'param'))
-
-                # component characteristic map container
-                elif isinstance(dc, hlp.dc_cm):
-                    df[col] = df.apply(network.get_props, axis=1, args=(col, 'func')).astype(str)
-                    df[col] = df[col].str.extract(r' at (.*?)>', expand=False)
-                    df[col + '_set'] = df.apply(network.get_props, axis=1, args=(col, 'is_set'))
-                    df[col + '_method'] = df.apply(network.get_props, axis=1, args=(col, 'method'))
-                    df[col + '_param'] = df.apply(network.get_props, axis=1, args=(col, 'param'))
+                if isinstance(dc, hlp.dc_cc) or isinstance(dc, hlp.dc_cm):
+                    row += [network.get_char_id(dc), dc.is_set, dc.method, dc.param]
 
                 # component property container
                 elif isinstance(dc, hlp.dc_cp):
-                    df[col] = df.apply(network.get_props, axis=1, args=(col, 'val'))
-                    df[col + '_set'] = df.apply(network.get_props, axis=1, args=(col, 'is_set'))
-                    df[col + '_var'] = df.apply(network.get_props, axis=1, args=(col, 'is_var'))
+                    val = dc.val
+                    if isinstance(val, np.ndarray):
+                        val = val.tolist()
+                    row += [val, dc.is_set, dc.is_var]
 
-                # component property container
+                # component group property container
                 elif isinstance(dc, hlp.dc_gcp):
-                    df[col] = df.apply(network.get_props, axis=1, args=(col, 'method'))
+                    row += [dc.method]
+
+            rows[c] += [row]
+
+        data = collections.OrderedDict()
+        for c in rows.keys():
+            data[c] = pd.DataFrame(rows[c], columns=cols[c]).set_index('label')
 
-            df.set_index('label', inplace=True)
-            df.drop('i', axis=1, inplace=True)
-            df.drop('o', axis=1, inplace=True)
-            fn = path + c + '.csv'
-            df.to_csv(fn, sep=';', decimal='.', index=True, na_rep='nan')
-            logging.debug('Component information (' + c + ') saved to ' + fn + '.')
+        return data
 
-    def save_busses(self, fn):
+    def bus_data(self):
         r"""
-        Saves the busses parametrisation to filename/comps/bus.csv
+        Returns the busses parametrisation.
 
-        Parameters
-        ----------
-        fn : str
-            Path/filename for the file.
+        Returns
+        -------
+        df : pandas.core.frame.DataFrame
+            Bus data with the bus labels as index.
         """
         if len(self.busses) > 0:
             df = pd.DataFrame({'id': self.busses.values()}, index=self.busses.values())
@@ -2470,84 +3302,173 @@ class network:
         else:
             df = pd.DataFrame({'label': [], 'P': [], 'P_set': []})
         df.set_index('label', inplace=True)
-        df.to_csv(fn, sep=';', decimal='.', index=True, na_rep='nan')
-        logging.debug('Bus information saved to ' + fn + '.')
+        return df
 
-    def save_characteristics(self, path):
+    def characteristic_data(self):
         r"""
-        Saves the busses parametrisation to filename/comps/char.csv
+        Returns the data of the characteristic lines and maps of the
+        components and busses.
 
-        Parameters
-        ----------
-        fn : str
-            Path/filename for the file.
+        Returns
+        -------
+        chars : pandas.core.frame.DataFrame
+            Id, x and y values of the characteristic lines.
+
+        char_maps : pandas.core.frame.DataFrame
+            Id, x, y, z1 and z2 values of the characteristic maps.
         """
         # components
         cp_sort = self.comps
         cp_sort['cp'] = cp_sort.apply(network.get_class_base, axis=1)
 
-        # characteristic lines in components
-        chars = []
+        # characteristic lines and maps in components by identifier
+        lines = collections.OrderedDict()
+        maps = collections.OrderedDict()
         for c in cp_sort.cp.unique():
             df = cp_sort[cp_sort['cp'] == c]
 
             for col, dc in df.index[0].attr().items():
                 if isinstance(dc, hlp.dc_cc):
-                    chars += df.apply(network.get_props, axis=1, args=(col, 'func')).tolist()
+                    chars = lines
+                elif isinstance(dc, hlp.dc_cm):
+                    chars = maps
+                else:
+                    continue
+
+                for cp in df.index:
+                    char = cp.get_attr(col)
+                    if char.x is not None:
+                        chars.setdefault(network.get_char_id(char), char)
 
         # characteristic lines in busses
         for bus in self.busses.values():
-            for c in bus.comps.index:
-                ch = bus.comps.loc[c].char
-                if ch not in chars:
-                    chars += [ch]
+            for char in bus.comps.char:
+                lines.setdefault(network.get_char_id(char), char)
 
-        if len(chars) > 0:
-            # get id and data
-            df = pd.DataFrame({'id': chars}, index=chars)
-            df['id'] = df.apply(network.get_id, axis=1)
+        char_lines = network.char_table(lines, ['x', 'y'])
+        char_maps = network.char_table(maps, ['x', 'y', 'z1', 'z2'])
+        return char_lines, char_maps
 
-            cols = ['x', 'y']
-            for val in cols:
-                df[val] = df.apply(network.get_props, axis=1, args=(val,))
+    def char_table(chars, cols):
+        r"""
+        Returns the values of characteristic lines or maps as table.
 
-        else:
-            df = pd.DataFrame({'id': [], 'x': [], 'y': [], 'z1': [], 'z2': []})
-            df.set_index('id', inplace=True)
+        Parameters
+        ----------
+        chars : dict
+            Characteristics with their identifiers as keys.
 
-        # write to char.csv
-        fn = path + 'char.csv'
-        df.to_csv(fn, sep=';', decimal='.', index=False, na_rep='nan')
-        logging.debug('Characteristic line information saved to ' + fn + '.')
+        cols : list
+            Names of the characteristic's values.
 
-        # characteristic maps in components
-        chars = []
-        for c in cp_sort.cp.unique():
-            df = cp_sort[cp_sort['cp'] == c]
+        Returns
+        -------
+        df : pandas.core.frame.DataFrame
+            Identifier and values of the characteristics, one row per
+            identifier.
+        """
+        data = collections.OrderedDict([('id', list(chars.keys()))])
+        for col in cols:
+            data[col] = [np.asarray(char.get_attr(col)).tolist() for char in chars.values()]
+        return pd.DataFrame(data, columns=['id'] + cols)
 
-            for col, dc in df.index[0].attr().items():
-                if isinstance(dc, hlp.dc_cm):
-                    chars += df.apply(network.get_props, axis=1, args=(col, 'func')).tolist()
+    def get_conn_id(c):
+        r"""
+        Returns the identifier of a connection.
+
+        Parameters
+        ----------
+        c : tespy.connections.connection
+            Connection to identify.
 
-        if len(chars) > 0:
-            # get id and data
-            df = pd.DataFrame({'id': chars}, index=chars)
-            df['id'] = df.apply(network.get_id, axis=1)
+        Returns
+        -------
+        id : str
+            Identifier of the connection built from its source and target,
+            e. g. :code:`'source:out1->pump:in1'`.
 
-            cols = ['x', 'y', 'z1', 'z2']
-            for val in cols:
-                df[val] = df.apply(network.get_props, axis=1, args=(val,))
+        Note
+        ----
+        The identifier does not depend on the connection object, thus the
+        network structure of a reloaded network is identical to the original
+        network structure.
+        """
+        return c.s.label + ':' + c.s_id + '->' + c.t.label + ':' + c.t_id
 
-        else:
-            df = pd.DataFrame({'id': [], 'x': [], 'y': [], 'z1': [], 'z2': []})
-            df.set_index('id', inplace=True)
-        # write to char_map.csv
-        fn = path + 'char_map.csv'
-        df.to_csv(fn, sep=';', decimal='.', index=False, na_rep='nan')
-        logging.debug('Characteristic map information saved to ' + fn + '.')
+    def get_composition_id(val, fluids, compositions):
+        r"""
+        Returns the index of a fluid composition in the composition table.
+
+        Parameters
+        ----------
+        val : dict
+            Fluid mass fractions.
+
+        fluids : list
+            Fluids of the network.
 
-    def get_id(c):
-        return str(c.name)[str(c.name).find(' at ') + 4:-1]
+        compositions : collections.OrderedDict
+            Nonzero mass fractions of the compositions as keys and their
+            indices as values, new compositions are added.
+
+        Returns
+        -------
+        i : int
+            Index of the composition.
+        """
+        composition = tuple((fluid, val[fluid]) for fluid in fluids if val[fluid] != 0)
+        return compositions.setdefault(composition, len(compositions))
+
+    def read_compositions(df):
+        r"""
+        Reads the fluid compositions from a composition table.
+
+        Parameters
+        ----------
+        df : pandas.core.frame.DataFrame
+            Composition table, see
+            :func:`tespy.networks.network.connection_data`.
+
+        Returns
+        -------
+        compositions : dict
+            Nonzero mass fractions of the compositions, the keys are the
+            indices of the compositions.
+        """
+        compositions = {}
+        for i, fluid, x in zip(df['composition'], df['fluid'], df['val']):
+            compositions.setdefault(i, {})[fluid] = x
+        return compositions
+
+    def get_char_id(char):
+        r"""
+        Returns the identifier of a characteristic line or map.
+
+        Parameters
+        ----------
+        char : tespy.components.characteristics.characteristics/tespy.tools.helpers.dc_cc
+            Characteristic line or map or its data container.
+
+        Returns
+        -------
+        id : str
+            Type and hash of the characteristic's values, equal
+            characteristics have the same identifier.
+        """
+        if char is None or char.x is None:
+            return np.nan
+
+        h = hashlib.sha1()
+        for key in ['x', 'y', 'z1', 'z2']:
+            if hasattr(char, key):
+                val = np.asarray(char.get_attr(key), dtype=float)
+                h.update(str(val.shape).encode())
+                h.update(val.tobytes())
+
+        if hasattr(char, 'z1'):
+            return 'char_map_' + h.hexdigest()[:16]
+        else:
+            return 'characteristics_' + h.hexdigest()[:16]
 
     def get_class_base(c):
         return c.name.__class__.__name__
@@ -2571,7 +3492,10 @@ class network:
                     else:
                         return np.nan
                 else:
-                    return c.name.get_attr(args[0]).get_attr(args[1])
+                    val = c.name.get_attr(args[0]).get_attr(args[1])
+                    if isinstance(val, np.ndarray):
+                        return val.tolist()
+                    return val
             elif isinstance(c.name.get_attr(args[0]), np.ndarray):
                 if len(c.name.get_attr(args[0]).shape) > 1:
                     return tuple(c.name.get_attr(args[0]).tolist())
@@ -2582,24 +3506,349 @@ class network:
         else:
             return ''
 
-    def get_busses(c, *args):
-        busses = []
-        for bus in args[0]:
-            if c.name in bus.comps.index:
-                busses += [bus.label]
-        return busses
-
-    def get_bus_data(c, *args):
-        items = []
-        if args[1] == 'char':
-            for bus in args[0]:
-                if c.name in bus.comps.index:
-                    val = bus.comps.loc[c.name][args[1]]
-                    items += [str(val)[str(val).find(' at ') + 4:-1]]
 
-        else:
-            for bus in args[0]:
-                if c.name in bus.comps.index:
-                    items += [bus.comps.loc[c.name][args[1]]]
+class snapshot:
+    r"""
+    Snapshot of a network's results held in memory.
+
+    Parameters
+    ----------
+    nw : tespy.networks.network
+        Network to take the snapshot from.
+
+    Note
+    ----
+    The snapshot holds mass flow, pressure and enthalpy in SI units and the
+    fluid vector of every connection, the parameters of the components and
+    the reference values of the busses. Connections are identified by the
+    labels of their source and target and the ids of outlet and inlet,
+    components and busses by their labels. The snapshot does not reference
+    the network's objects and can be pickled.
+    """
+
+    def __init__(self, nw):
+        self.fluids = list(nw.fluids)
+
+        # connection values
+        self.conns = {}
+        for c in nw.conns.index:
+            key = (c.s.label, c.s_id, c.t.label, c.t_id)
+            fluid = [c.fluid.val[fl] for fl in self.fluids]
+            self.conns.setdefault(key, (c.m.val_SI, c.p.val_SI, c.h.val_SI, fluid))
+
+        # component parameters
+        self.comps = {}
+        for cp in nw.comps.index:
+            data = {}
+            for key, dc in cp.attr().items():
+                if isinstance(dc, hlp.dc_cp):
+                    val = cp.get_attr(key).val
+                    if isinstance(val, np.ndarray):
+                        val = val.copy()
+                    data[key] = val
+            self.comps[cp.label] = data
+
+        # bus reference values
+        self.busses = {}
+        for label, b in nw.busses.items():
+            self.busses[label] = {cp.label: b.comps.loc[cp, 'P_ref'] for cp in b.comps.index}
+
+    def conn_data(self, fluids):
+        r"""
+        Returns the connection values for a list of fluids.
+
+        Parameters
+        ----------
+        fluids : list
+            Fluids of the network the values are applied to.
+
+        Returns
+        -------
+        data : dict
+            Mass flow, pressure and enthalpy in SI units and fluid vector of
+            the connections, see :func:`tespy.networks.network.read_conn_csv`.
+        """
+        if fluids == self.fluids:
+            return self.conns
+
+        data = {}
+        for key, (m, p, h, fluid) in self.conns.items():
+            fluid = dict(zip(self.fluids, fluid))
+            data[key] = (m, p, h, [fluid.get(fl, 0) for fl in fluids])
+        return data
+
+
+class result_sink:
+    r"""
+    Append-only file for the results of a series of calculations.
+
+    Parameters
+    ----------
+    fn : str
+        Path/filename of the results file (.npy).
+
+    chunk : int
+        Number of results per block of the file, default: 100.
+
+    interval : int
+        Number of results held in memory before writing them to the file,
+        default: number of results per block (chunk).
+
+    Note
+    ----
+    Add the result sink to a network with
+    :func:`tespy.networks.network.add_result_sinks`, the results of every
+    calculation of the network are appended as one row to the file. The
+    columns are
+
+    - :code:`'conns/target:target_id/key'` for mass flow, pressure,
+      enthalpy, temperature and volumetric flow as well as the fluid mass
+      fractions of the connections, e. g. :code:`'conns/condenser:in1/T'`,
+    - :code:`'comps/label/key'` for the component parameters, e. g.
+      :code:`'comps/pump/P'` and
+    - :code:`'busses/label/P'` for the values of the busses.
+
+    The values are in the units of the network. The file is a numpy .npy
+    file of column-major blocks: Every record holds the number of rows of the
+    block (field :code:`'rows'`) and the values of :code:`chunk` rows for
+    every column, the values of a column are stored contiguously within the
+    block. Reading a single column touches the column's values only. Open
+    the file with :func:`tespy.network_reader.load_results`. The blocks are
+    written on every flush, call :code:`close()` after the last calculation.
+    A closed result sink does not accept any more results, remove it from the
+    network with :func:`tespy.networks.network.del_result_sinks`.
+
+    Example
+    -------
+    >>> from tespy import nwk, nwkr, cmp, con
+    >>> import os
+    >>> nw = nwk.network(fluids=['water'], p_unit='bar', T_unit='C')
+    >>> nw.set_printoptions(print_level='none')
+    >>> so = cmp.source('source')
+    >>> si = cmp.sink('sink')
+    >>> pu = cmp.pump('pump')
+    >>> inc = con.connection(so, 'out1', pu, 'in1')
+    >>> outg = con.connection(pu, 'out1', si, 'in1')
+    >>> nw.add_conns(inc, outg)
+    >>> pu.set_attr(eta_s=0.8)
+    >>> inc.set_attr(fluid={'water': 1}, p=1, T=20)
+    >>> outg.set_attr(p=5)
+    >>> results = nwk.result_sink('results.npy', chunk=2)
+    >>> nw.add_result_sinks(results)
+    >>> for m in [8, 9, 10]:
+    ...     inc.set_attr(m=m)
+    ...     nw.solve('design')
+    >>> results.close()
+    >>> res = nwkr.load_results('results.npy')
+    >>> res.imp_conns['pump:in1']['m'].tolist()
+    [8.0, 9.0, 10.0]
+    >>> [round(P) for P in res.imp_comps['pump']['P']]
+    [4007, 4508, 5009]
+    >>> del res
+    >>> os.remove('results.npy')
+    """
+
+    def __init__(self, fn, chunk=100, interval=None):
+        self.fn = fn
+        self.chunk = chunk
+        self.interval = chunk if interval is None else min(interval, chunk)
+        self.closed = False
+        self.fh = None
+        self.num_rows = 0
+        self.num_blocks = 0
+        self.pos = 0
+        self.written = 0
+
+    def setup(self, nw):
+        r"""
+        Creates the columns from the network and the results file.
+
+        Parameters
+        ----------
+        nw : tespy.networks.network
+            Network to store the results of.
+        """
+        cols = []
+        # objects, parameters and fluids of the columns, the values are read
+        # on every push as the network replaces the data containers and
+        # fluid vectors of its objects
+        self.values = []
+
+        # connections
+        for c in nw.conns.index:
+            label = 'conns/' + c.t.label + ':' + c.t_id + '/'
+            for key in ['m', 'p', 'h', 'T', 'v']:
+                cols += [label + key]
+                self.values += [(c, key, None)]
+            for fluid in nw.fluids:
+                cols += [label + fluid]
+                self.values += [(c, 'fluid', fluid)]
+
+        # components
+        for cp in nw.comps.index:
+            for key, dc in cp.attr().items():
+                if isinstance(dc, hlp.dc_cp) and np.ndim(cp.get_attr(key).val) == 0:
+                    cols += ['comps/' + cp.label + '/' + key]
+                    self.values += [(cp, key, None)]
+
+        # busses
+        for label, b in nw.busses.items():
+            cols += ['busses/' + label + '/P']
+            self.values += [(b, 'P', None)]
+
+        self.num_conns = len(nw.conns.index)
+        self.num_comps = len(nw.comps.index)
+        self.dtype = np.dtype([('rows', '<i8')] + [(col, '<f8', (self.chunk, )) for col in cols])
+
+        # block in memory and view of its values (one row per column)
+        self.buffer = np.zeros(1, dtype=self.dtype)
+        self.block = np.ndarray((len(cols), self.chunk), dtype='<f8', buffer=self.buffer, offset=8)
+
+        # labels with non latin-1 characters require .npy format 3.0
+        try:
+            self.header(0).encode('latin1')
+            self.version = (2, 0)
+            self.encoding = 'latin1'
+        except UnicodeEncodeError:
+            self.version = (3, 0)
+            self.encoding = 'utf8'
+
+        # header length for the maximum number of rows
+        header = self.header(np.iinfo(np.int64).max).encode(self.encoding)
+        self.header_len = len(header) + 1
+        self.header_len += -(12 + self.header_len) % 64
+
+        self.fh = open(self.fn, 'wb+')
+        self.write_header()
+        self.fh.flush()
+
+    def header(self, num_blocks):
+        r"""
+        Returns the header of the .npy file.
+
+        Parameters
+        ----------
+        num_blocks : int
+            Number of blocks in the file.
+
+        Returns
+        -------
+        header : str
+            Description of the data type and the shape of the file.
+        """
+        return repr({'descr': np.lib.format.dtype_to_descr(self.dtype),
+                     'fortran_order': False, 'shape': (num_blocks, )})
+
+    def write_header(self):
+        r"""
+        Writes the header with the current number of blocks to the file.
+        """
+        header = self.header(self.num_blocks + (self.pos > 0)).encode(self.encoding)
+        header += b' ' * (self.header_len - len(header) - 1) + b'\n'
+
+        self.fh.seek(0)
+        self.fh.write(np.lib.format.magic(*self.version))
+        self.fh.write(struct.pack('<I', len(header)))
+        self.fh.write(header)
+
+    def push(self, nw):
+        r"""
+        Appends the results of the network's calculation.
+
+        Parameters
+        ----------
+        nw : tespy.networks.network
+            Network to store the results of.
+        """
+        if self.closed:
+            msg = ('The result sink ' + self.fn + ' is closed, remove it from '
+                   'the network with network.del_result_sinks.')
+            logging.error(msg)
+            raise hlp.TESPyNetworkError(msg)
+
+        if self.fh is None:
+            self.setup(nw)
+
+        elif (self.num_conns != len(nw.conns.index) or
+                self.num_comps != len(nw.comps.index)):
+            msg = ('The network\'s structure has changed, the results can '
+                   'not be added to the results file ' + self.fn + '.')
+            logging.error(msg)
+            raise hlp.TESPyNetworkError(msg)
+
+        self.block[:, self.pos] = [
+            obj.get_attr(key).val if fluid is None else obj.get_attr(key).val[fluid]
+            for obj, key, fluid in self.values]
+        self.pos += 1
+
+        if self.pos == self.chunk or self.pos - self.written >= self.interval:
+            self.flush()
+
+    def flush(self):
+        r"""
+        Writes the results held in memory to the file.
+
+        Note
+        ----
+        An incomplete block is written with its current number of rows and
+        rewritten on the next flush.
+        """
+        if self.fh is None or self.pos == self.written:
+            return
+
+        self.buffer['rows'] = self.pos
+        self.fh.seek(self.header_len + 12 + self.num_blocks * self.dtype.itemsize)
+        self.fh.write(self.buffer.tobytes())
+        self.num_rows = self.num_blocks * self.chunk + self.pos
+
+        if self.pos == self.chunk:
+            self.num_blocks += 1
+            self.block[:] = 0
+            self.pos = 0
+        self.written = self.pos
+
+        self.write_header()
+        self.fh.flush()
+
+        msg = str(self.num_rows) + ' results written to ' + self.fn + '.'
+        logging.debug(msg)
+
+    def close(self):
+        r"""
+        Writes the remaining results and closes the file.
+        """
+        self.flush()
+        if self.fh is not None:
+            self.fh.close()
+        self.closed = True
+
+# %%
+
+
+save_executor = None
+save_lock = threading.Lock()
+
+
+def get_save_executor():
+    r"""
+    Returns the executor for saving networks in the background.
+
+    Returns
+    -------
+    executor : concurrent.futures.ThreadPoolExecutor
+        Executor with a single worker thread.
+
+    Note
+    ----
+    The executor is created on first use. Its single worker thread writes the
+    saves of :func:`tespy.networks.network.save_async` one after another in
+    the order of the calls. On interpreter exit, the executor is shut down
+    after all pending saves are written.
+    """
+    global save_executor
+    with save_lock:
+        if save_executor is None:
+            save_executor = ThreadPoolExecutor(max_workers=1)
+            atexit.register(save_executor.shutdown, wait=True)
 
-        return items
+    return save_executor
@@ -17,11 +17,16 @@ import math
 import numpy as np
 import sys
 from scipy import interpolate
+from scipy.special import wrightomega
 import pandas as pd
 import os
 import collections
+import functools
+import hashlib
+import json
 
 import logging
+from tespy.tools import logger
 
 import warnings
 warnings.simplefilter("ignore", RuntimeWarning)
@@ -37,6 +42,40 @@ gas_constants['uni'] = 8.3144598
 # %%
 
 
+def schema(attr):
+    r"""
+    Caches the attribute schema returned by the attr method of a class.
+
+    Parameters
+    ----------
+    attr : function
+        Method returning the available attributes with their default values.
+
+    Returns
+    -------
+    wrapper : function
+        Method returning the schema of the instance's class. The schema is
+        created on first call only, the returned dictionary and its values
+        must not be modified.
+
+    Note
+    ----
+    Data containers in the schema are templates, instances of components and
+    connections hold copies of these templates, see
+    :func:`tespy.tools.helpers.data_container.copy`.
+    """
+    cache = {}
+
+    @functools.wraps(attr)
+    def wrapper(self):
+        cls = self.__class__
+        if cls not in cache:
+            cache[cls] = attr(self)
+        return cache[cls]
+
+    return wrapper
+
+
 class data_container:
     r"""
     Class data_container is the base class for dc_cc, dc_cp, dc_flu, dc_prop.
@@ -84,13 +123,15 @@ class data_container:
     <class 'tespy.tools.helpers.dc_prop'>
     """
 
-    def __init__(self, **kwargs):
+    __slots__ = ()
 
-        var = self.attr()
+    def __init__(self, **kwargs):
 
         # default values
-        for key in var.keys():
-            self.__dict__.update({key: var[key]})
+        for key, val in self.attr().items():
+            if isinstance(val, (dict, list)):
+                val = val.copy()
+            setattr(self, key, val)
 
         self.set_attr(**kwargs)
 
@@ -106,8 +147,8 @@ class data_container:
         var = self.attr()
         # specify values
         for key in kwargs:
-            if key in var.keys():
-                self.__dict__.update({key: kwargs[key]})
+            if key in var:
+                setattr(self, key, kwargs[key])
 
     def get_attr(self, key):
         r"""
@@ -123,8 +164,8 @@ class data_container:
         out :
             Specified attribute.
         """
-        if key in self.__dict__:
-            return self.__dict__[key]
+        if key in self.__slots__ and hasattr(self, key):
+            return getattr(self, key)
         else:
             msg = 'Datacontainer of type ' + self.__class__.__name__ + ' has no attribute \"' + str(key) + '\".'
             logging.error(msg)
@@ -141,6 +182,25 @@ class data_container:
         """
         return {}
 
+    def copy(self):
+        r"""
+        Returns a copy of the data_container.
+
+        Returns
+        -------
+        dc : tespy.tools.helpers.data_container
+            Copy of the data_container, mutable attribute values (dictionaries,
+            lists and arrays) are copied, too.
+        """
+        dc = self.__class__.__new__(self.__class__)
+        for key in self.__slots__:
+            if hasattr(self, key):
+                val = getattr(self, key)
+                if isinstance(val, (dict, list, np.ndarray)):
+                    val = val.copy()
+                setattr(dc, key, val)
+        return dc
+
 
 class dc_prop(data_container):
     r"""
@@ -172,6 +232,9 @@ class dc_prop(data_container):
     unit : boolean
         Has the unit for this property been specified manually by the user?, default: unit_set=False.
     """
+    __slots__ = ('val', 'val0', 'val_SI', 'val_set', 'ref', 'ref_set', 'unit', 'unit_set', 'design')
+
+    @schema
     def attr(self):
         return {'val': np.nan, 'val0': np.nan, 'val_SI': 0, 'val_set': False,
                 'ref': None, 'ref_set': False,
@@ -198,6 +261,9 @@ class dc_flu(data_container):
     balance : boolean
         Should the fluid balance equation be applied for this mixture? default: False.
     """
+    __slots__ = ('val', 'val0', 'val_set', 'design', 'balance')
+
+    @schema
     def attr(self):
         r"""
         Return the available attributes for a data_container type object.
@@ -243,6 +309,12 @@ class dc_cp(data_container):
     printout : boolean
         Should the value of this attribute be printed in the results overview?
     """
+    # var_pos: position in the component's custom variables,
+    # val_set: specification of a busses total power
+    __slots__ = ('val', 'val_SI', 'is_set', 'printout', 'd', 'min_val', 'max_val', 'is_var',
+                 'val_ref', 'design', 'var_pos', 'val_set')
+
+    @schema
     def attr(self):
         r"""
         Return the available attributes for a data_container type object.
@@ -286,6 +358,9 @@ class dc_cc(data_container):
     specified method will be used. If you specify a method as well as x-values and/or
     y-values, these will override the defaults values of the chosen method.
     """
+    __slots__ = ('func', 'is_set', 'method', 'param', 'x', 'y')
+
+    @schema
     def attr(self):
         r"""
         Return the available attributes for a data_container type object.
@@ -335,6 +410,9 @@ class dc_cm(data_container):
     specified method will be used. If you specify a method as well as interpolation points,
     these will override the defaults values of the chosen method.
     """
+    __slots__ = ('func', 'is_set', 'method', 'param', 'x', 'y', 'z1', 'z2')
+
+    @schema
     def attr(self):
         r"""
         Return the available attributes for a data_container type object.
@@ -362,6 +440,9 @@ class dc_gcp(data_container):
     elements : list
         Which component properties are part of this component group? default elements=[].
     """
+    __slots__ = ('is_set', 'method', 'elements')
+
+    @schema
     def attr(self):
         r"""
         Return the available attributes for a data_container type object.
@@ -675,6 +756,80 @@ class tespy_fluid:
 tespy_fluid.fluids = {}
 
 
+def fluid_registry(fluids):
+    r"""
+    Returns the custom fluids of a list of fluids.
+
+    Parameters
+    ----------
+    fluids : list
+        List of fluid names.
+
+    Returns
+    -------
+    custom : dict
+        Custom fluids (:py:class:`tespy.tools.helpers.tespy_fluid`) with
+        their aliases as keys.
+
+    Note
+    ----
+    The custom fluids are required to register the fluids in another
+    process, e. g. on unpickling a network, see
+    :func:`tespy.tools.helpers.register_fluids`.
+    """
+    return {f: tespy_fluid.fluids[f] for f in fluids
+            if isinstance(tespy_fluid.fluids.get(f), tespy_fluid)}
+
+
+def register_fluids(fluids, custom=None):
+    r"""
+    Registers fluids missing in the global fluid property data.
+
+    Parameters
+    ----------
+    fluids : list
+        List of fluid names.
+
+    custom : dict
+        Custom fluids (:py:class:`tespy.tools.helpers.tespy_fluid`) with
+        their aliases as keys, default: None.
+
+    Note
+    ----
+    The global fluid property data are the molar masses, the gas constants,
+    the custom fluids and the fluid property memorisation (including the
+    CoolProp.AbstractState objects of the fluids). These data are not
+    pickled with networks, connections and components but registered on
+    unpickling. Registered fluids are not changed.
+    """
+    if custom is None:
+        custom = {}
+
+    for alias, fluid in custom.items():
+        if not isinstance(tespy_fluid.fluids.get(alias), tespy_fluid):
+            register_fluids(list(fluid.fluid.keys()))
+            tespy_fluid.fluids[alias] = fluid
+            molar_masses[alias] = 1 / molar_mass_flow(fluid.fluid)
+            gas_constants[alias] = gas_constants['uni'] / molar_masses[alias]
+            msg = 'Registered custom fluid ' + alias + '.'
+            logging.debug(msg)
+
+    for f in fluids:
+        if f in molar_masses:
+            continue
+        elif 'INCOMP::' in f:
+            # molar mass and gas constant not available for incompressibles
+            molar_masses[f] = 1
+            gas_constants[f] = 1
+        elif 'TESPy::' not in f:
+            molar_masses[f] = CPPSI('M', f)
+            gas_constants[f] = CPPSI('GAS_CONSTANT', f)
+
+    fluids = list(fluids)
+    if len(fluids) > 0 and tuple(fluids) not in memorise.T_ph:
+        memorise.add_fluids(fluids)
+
+
 def reverse_2d(params, y):
     r"""
     Reverse function for lookup table.
@@ -718,6 +873,259 @@ def reverse_2d_deriv(params, y):
 # %%
 
 
+def save_npz(fn, tables, shared=None, shared_path=None):
+    r"""
+    Saves tables to a single binary file in numpy's npz format.
+
+    Parameters
+    ----------
+    fn : str
+        Path/filename for the file.
+
+    tables : dict
+        Dictionary with the table names as keys and pandas dataframes as
+        values.
+
+    shared : dict
+        Dictionary with the table names as keys and the names of the columns
+        to save to a shared file as values, default: None.
+
+    shared_path : str
+        Path to the folder for the shared files, default: None.
+
+    Note
+    ----
+    Every column of a table is saved as a typed array. Numeric and boolean
+    columns are saved as they are. Columns holding numpy arrays in every row
+    are saved as one float array per row, all other object columns (e. g.
+    strings, lists or mixed types) as JSON strings. No python objects are
+    pickled.
+
+    If shared columns are specified, these columns are saved to the file
+    :code:`shared_path/<hash>.npz`, where the hash is calculated from the
+    content of the shared columns. The file is only written, if it does not
+    exist yet. The file fn holds the remaining columns and a reference to the
+    shared file. Thus, many files with the same shared columns only store
+    these columns once.
+
+    Example
+    -------
+    >>> from tespy import hlp
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> import os
+    >>> import shutil
+    >>> df = pd.DataFrame({'label': ['a', 'b'], 'val': [1.0, np.nan],
+    ...                    'design': [['eta_s'], []],
+    ...                    'x': [np.array([0, 1.0]), np.array([1, 2, 3.0])]})
+    >>> hlp.save_npz('tables.npz', {'comps': df})
+    >>> df = hlp.load_npz('tables.npz')['comps']
+    >>> df.design.tolist()
+    [['eta_s'], []]
+    >>> df.x[1]
+    array([1., 2., 3.])
+    >>> hlp.save_npz('tables.npz', {'comps': df},
+    ...              shared={'comps': ['label', 'design', 'x']},
+    ...              shared_path='shared')
+    >>> df.loc[0, 'val'] = 2.0
+    >>> hlp.save_npz('tables_2.npz', {'comps': df},
+    ...              shared={'comps': ['label', 'design', 'x']},
+    ...              shared_path='shared')
+    >>> len(os.listdir('shared'))
+    1
+    >>> df = hlp.load_npz('tables_2.npz')['comps']
+    >>> df.columns.tolist()
+    ['label', 'val', 'design', 'x']
+    >>> df.val.tolist()
+    [2.0, nan]
+    >>> os.remove('tables.npz')
+    >>> os.remove('tables_2.npz')
+    >>> shutil.rmtree('./shared', ignore_errors=True)
+    """
+    data = {}
+    if shared is not None:
+        shared_tables = collections.OrderedDict()
+        own_tables = collections.OrderedDict()
+        for name, df in tables.items():
+            cols = [col for col in df.columns if col in shared.get(name, [])]
+            shared_tables[name] = df[cols]
+            own_tables[name] = df[[col for col in df.columns if col not in cols]]
+            data[name + '/__order__'] = np.array(df.columns, dtype=str)
+
+        shared_data = npz_data(shared_tables)
+        shared_fn = os.path.join(shared_path, npz_hash(shared_data) + '.npz')
+        if not os.path.isfile(shared_fn):
+            if not os.path.exists(shared_path):
+                os.makedirs(shared_path)
+            np.savez(shared_fn, **shared_data)
+
+        path = os.path.dirname(os.path.abspath(fn))
+        data['__shared__'] = np.array(os.path.relpath(os.path.abspath(shared_fn), path))
+        tables = own_tables
+
+    data.update(npz_data(tables))
+    np.savez(fn, **data)
+
+
+def npz_data(tables):
+    r"""
+    Converts tables to typed arrays for :func:`tespy.tools.helpers.save_npz`.
+
+    Parameters
+    ----------
+    tables : dict
+        Dictionary with the table names as keys and pandas dataframes as
+        values.
+
+    Returns
+    -------
+    data : dict
+        Dictionary with the array names as keys and the arrays as values.
+    """
+    data = {'__tables__': np.array(list(tables.keys()), dtype=str)}
+    for name, df in tables.items():
+        kinds = []
+        for col in df.columns:
+            key = name + '/' + col
+            val = df[col].values
+            if val.dtype != object:
+                kinds += ['raw']
+                data[key] = val
+            elif len(val) > 0 and all(isinstance(v, np.ndarray) for v in val):
+                kinds += ['array']
+                for i, v in enumerate(val):
+                    data[key + '/' + str(i)] = np.asarray(v, dtype=float)
+            else:
+                kinds += ['json']
+                data[key] = np.array([json.dumps(v, default=json_default) for v in val], dtype=str)
+
+        data[name + '/__columns__'] = np.array(df.columns, dtype=str)
+        data[name + '/__kinds__'] = np.array(kinds, dtype=str)
+        data[name + '/__rows__'] = np.array(len(df.index))
+
+    return data
+
+
+def npz_hash(data):
+    r"""
+    Calculates a hash from the content of arrays.
+
+    Parameters
+    ----------
+    data : dict
+        Dictionary with the array names as keys and the arrays as values.
+
+    Returns
+    -------
+    hash : str
+        Hexadecimal hash of the arrays.
+    """
+    h = hashlib.sha1()
+    for key in sorted(data.keys()):
+        val = np.ascontiguousarray(data[key])
+        h.update(key.encode('utf-8'))
+        h.update((str(val.dtype) + str(val.shape)).encode('utf-8'))
+        h.update(val.tobytes())
+
+    return h.hexdigest()[:16]
+
+
+def json_default(val):
+    r"""
+    Converts numpy types for JSON serialisation.
+
+    Parameters
+    ----------
+    val : object
+        Value to convert.
+
+    Returns
+    -------
+    val : object
+        Value as python type.
+    """
+    if isinstance(val, np.generic):
+        return val.item()
+    elif isinstance(val, np.ndarray):
+        return val.tolist()
+    else:
+        msg = 'Object of type ' + type(val).__name__ + ' cannot be saved to npz-file.'
+        logging.error(msg)
+        raise TypeError(msg)
+
+
+def load_npz(fn):
+    r"""
+    Loads tables from a binary file saved with
+    :func:`tespy.tools.helpers.save_npz`.
+
+    Parameters
+    ----------
+    fn : str
+        Path/filename of the file.
+
+    Returns
+    -------
+    tables : collections.OrderedDict
+        Dictionary with the table names as keys and pandas dataframes as
+        values.
+
+    Note
+    ----
+    If the file references a shared file, the shared columns are loaded from
+    the shared file and merged with the columns of the file.
+    """
+    with np.load(fn, allow_pickle=False) as data:
+        tables = npz_tables(data)
+        if '__shared__' in data.files:
+            path = os.path.dirname(os.path.abspath(fn))
+            shared_fn = os.path.join(path, str(data['__shared__']))
+            with np.load(shared_fn, allow_pickle=False) as shared_data:
+                shared = npz_tables(shared_data)
+
+            for name, df in tables.items():
+                order = list(data[name + '/__order__'])
+                df = pd.concat([shared[name], df], axis=1)
+                tables[name] = df[order]
+
+    return tables
+
+
+def npz_tables(data):
+    r"""
+    Converts typed arrays from :func:`tespy.tools.helpers.npz_data` to tables.
+
+    Parameters
+    ----------
+    data : numpy.lib.npyio.NpzFile
+        Loaded npz-file.
+
+    Returns
+    -------
+    tables : collections.OrderedDict
+        Dictionary with the table names as keys and pandas dataframes as
+        values.
+    """
+    tables = collections.OrderedDict()
+    for name in data['__tables__']:
+        rows = int(data[name + '/__rows__'])
+        cols = collections.OrderedDict()
+        for col, kind in zip(data[name + '/__columns__'], data[name + '/__kinds__']):
+            key = name + '/' + col
+            if kind == 'raw':
+                cols[col] = data[key]
+            elif kind == 'array':
+                cols[col] = [data[key + '/' + str(i)] for i in range(rows)]
+            else:
+                cols[col] = [json.loads(v) for v in data[key]]
+
+        tables[name] = pd.DataFrame(cols, columns=list(cols.keys()), index=range(rows))
+
+    return tables
+
+# %%
+
+
 class memorise:
     r"""
     Memorization of fluid properties.
@@ -818,6 +1226,83 @@ class memorise:
                     logging.debug(msg)
 
 
+    def h_range(p, fluid):
+        r"""
+        Returns the enthalpy range of a pure fluid at a given pressure.
+
+        Parameters
+        ----------
+        p : float
+            Pressure p / Pa.
+
+        fluid : str
+            Fluid name.
+
+        Returns
+        -------
+        h_range : tuple
+            Minimum and maximum enthalpy hmin, hmax / (J/kg).
+
+        Note
+        ----
+        The range is limited by the enthalpy at 1.01 times the minimum
+        temperature (1.1 times if the fluid property call fails) and 0.99
+        times the maximum temperature of the fluid's value range. On first call
+        for a fluid, the limits are tabulated on 100 pressure values within
+        the fluid's pressure range. The limits are linearly interpolated in
+        the table.
+
+        At the saturation pressure of these temperatures the limits jump from
+        vapour to liquid enthalpy. The table holds the saturated vapour and
+        saturated liquid state directly below and above the saturation
+        pressure, thus, the interpolation does not cross the jump.
+        """
+        if fluid not in memorise.h_bounds.keys():
+            pmin, pmax, Tmin, Tmax = memorise.vrange[fluid]
+            table = []
+            for p_tab in np.geomspace(pmin, pmax, 100):
+                try:
+                    try:
+                        hmin = h_pT(p_tab, Tmin * 1.01, fluid)
+                    except ValueError:
+                        hmin = h_pT(p_tab, Tmin * 1.1, fluid)
+                    hmax = h_pT(p_tab, Tmax * 0.99, fluid)
+                except ValueError:
+                    continue
+                table += [[p_tab, hmin, hmax]]
+
+            table = np.array(table).reshape(-1, 3)
+            if 'INCOMP::' not in fluid and 'TESPy::' not in fluid and len(table) > 0:
+                for col, T in [(1, Tmin * 1.01), (2, Tmax * 0.99)]:
+                    try:
+                        memorise.heos[fluid].update(CP.QT_INPUTS, 1, T)
+                        p_sat = memorise.heos[fluid].p()
+                        h_v = memorise.heos[fluid].hmass()
+                        memorise.heos[fluid].update(CP.QT_INPUTS, 0, T)
+                        h_l = memorise.heos[fluid].hmass()
+                    except ValueError:
+                        # no saturation above the critical temperature
+                        continue
+
+                    if not table[0, 0] < p_sat < table[-1, 0]:
+                        continue
+
+                    rows = []
+                    for p_tab, h in [(p_sat * (1 - 1e-6), h_v), (p_sat * (1 + 1e-6), h_l)]:
+                        row = [p_tab, np.interp(p_tab, table[:, 0], table[:, 1]),
+                               np.interp(p_tab, table[:, 0], table[:, 2])]
+                        row[col] = h
+                        rows += [row]
+                    table = np.vstack([table, rows])
+                    table = table[np.argsort(table[:, 0])]
+
+            memorise.h_bounds[fluid] = table.transpose()
+            msg = 'Created table of enthalpy limits for fluid ' + fluid + '.'
+            logging.debug(msg)
+
+        table = memorise.h_bounds[fluid]
+        return np.interp(p, table[0], table[1]), np.interp(p, table[0], table[2])
+
     def del_memory(fluids):
         r"""
         Deletes non frequently used fluid property values from memorise class.
@@ -870,6 +1355,7 @@ memorise.visc_ph_f = {}
 memorise.s_ph = {}
 memorise.s_ph_f = {}
 memorise.vrange = {}
+memorise.h_bounds = {}
 
 # %%
 
@@ -941,9 +1427,10 @@ def newton(func, deriv, params, y, **kwargs):
         i += 1
 
         if i > max_iter:
-            msg = ('Newton algorithm was not able to find a feasible value for function ' + str(func) + '. '
-                   'Current value with x=' + str(x) + ' is ' + str(func(params, x)) + ', target value is ' + str(y) + '.')
-            logging.debug(msg)
+            if logger.debug_enabled():
+                msg = ('Newton algorithm was not able to find a feasible value for function ' + str(func) + '. '
+                       'Current value with x=' + str(x) + ' is ' + str(func(params, x)) + ', target value is ' + str(y) + '.')
+                logging.debug(msg)
 
             break
 
@@ -2199,18 +2686,18 @@ def lamb(re, ks, d):
 
     Parameters
     ----------
-    re : float
+    re : float/ndarray
         Reynolds number re / 1.
 
-    ks : float
+    ks : float/ndarray
         Pipe roughness ks / m.
 
-    d : float
+    d : float/ndarray
         Pipe diameter/characteristic lenght d / m.
 
     Returns
     -------
-    lamb : float
+    lamb : float/ndarray
         Darcy friction factor lamb / 1
 
     Note
@@ -2245,9 +2732,15 @@ def lamb(re, ks, d):
         \lambda = \frac{1}{\left( 2\cdot \log \left( \frac{3.71 \cdot d}{k_{s}}
         \right) \right)}
 
+    The implicit equations are solved explicitly with the Wright omega function,
+    see :func:`tespy.tools.helpers.lamb_smooth` and
+    :func:`tespy.tools.helpers.lamb_trans`. If any of the parameters is an
+    array, the friction factors are calculated elementwise for all pipes at once.
+
     Example
     -------
     >>> from tespy import hlp
+    >>> import numpy as np
     >>> ks = 5e-5
     >>> d = 0.05
     >>> re_laminar = 2000
@@ -2271,7 +2764,30 @@ def lamb(re, ks, d):
     0.012
     >>> round(hlp.lamb(re_very_high, ks_low, d_very_high), 3)
     0.009
+    >>> re = np.array([re_laminar, re_turb_smooth, re_turb_trans, re_turb_trans])
+    >>> ks = np.array([ks, ks, ks, ks_rough])
+    >>> np.round(hlp.lamb(re, ks, d), 3).tolist()
+    [0.032, 0.027, 0.023, 0.049]
     """
+    if np.ndim(re) > 0 or np.ndim(ks) > 0 or np.ndim(d) > 0:
+        re, ks, d = np.broadcast_arrays(np.asarray(re, dtype=float), ks, d)
+        lamb = np.zeros(re.shape)
+        for regime, mask in lamb_regimes(re, ks, d).items():
+            if mask.any():
+                if regime == 'laminar':
+                    lamb[mask] = 64 / re[mask]
+                elif regime == 'blasius':
+                    lamb[mask] = 0.3164 * re[mask] ** (-0.25)
+                elif regime == 'nikuradse':
+                    lamb[mask] = 0.0032 + 0.221 * re[mask] ** (-0.237)
+                elif regime == 'smooth':
+                    lamb[mask] = lamb_smooth(re[mask])
+                elif regime == 'rough':
+                    lamb[mask] = 1 / (2 * np.log10(3.71 * d[mask] / ks[mask])) ** 2
+                else:
+                    lamb[mask] = lamb_trans(re[mask], ks[mask], d[mask])
+        return lamb
+
     if re <= 2320:
         return 64 / re
     else:
@@ -2281,31 +2797,317 @@ def lamb(re, ks, d):
             elif re > 1e5 and re < 5e6:
                 return 0.0032 + 0.221 * re ** (-0.237)
             else:
-                l0 = 0.0001
-                return newton(lamb_smooth, dlamb_smooth_dl, [re], 0, val0=l0, valmin=0.00001, valmax=0.2)
+                return float(lamb_smooth(re))
 
         elif re * ks / d > 1300:
             return 1 / (2 * math.log(3.71 * d / ks, 10)) ** 2
 
         else:
-            l0 = 0.002
-            return newton(lamb_trans, dlamb_trans_dl, [re, ks, d], 0, val0=l0, valmin=0.0001, valmax=0.2)
+            return float(lamb_trans(re, ks, d))
+
+
+def dlamb_dre(re, ks, d):
+    r"""
+    Calculates the derivative of the darcy friction factor to the reynolds number.
+
+    Parameters
+    ----------
+    re : float/ndarray
+        Reynolds number re / 1.
+
+    ks : float/ndarray
+        Pipe roughness ks / m.
+
+    d : float/ndarray
+        Pipe diameter/characteristic lenght d / m.
+
+    Returns
+    -------
+    dlamb : float/ndarray
+        Derivative of the darcy friction factor to the reynolds number.
+
+    Note
+    ----
+    The derivatives are calculated analytically for every flow regime, see
+    :func:`tespy.tools.helpers.lamb`. In the hydraulically rough regime the friction
+    factor does not depend on the reynolds number.
+
+    Example
+    -------
+    >>> from tespy import hlp
+    >>> ks = 5e-5
+    >>> d = 0.05
+    >>> re = 70000
+    >>> dre = 1e-2
+    >>> num = (hlp.lamb(re + dre, ks, d) - hlp.lamb(re - dre, ks, d)) / (2 * dre)
+    >>> abs(hlp.dlamb_dre(re, ks, d) / num - 1) < 1e-5
+    True
+    """
+    if np.ndim(re) > 0 or np.ndim(ks) > 0 or np.ndim(d) > 0:
+        re, ks, d = np.broadcast_arrays(np.asarray(re, dtype=float), ks, d)
+        dlamb = np.zeros(re.shape)
+        for regime, mask in lamb_regimes(re, ks, d).items():
+            if mask.any():
+                if regime == 'laminar':
+                    dlamb[mask] = -64 / re[mask] ** 2
+                elif regime == 'blasius':
+                    dlamb[mask] = -0.25 * 0.3164 * re[mask] ** (-1.25)
+                elif regime == 'nikuradse':
+                    dlamb[mask] = -0.237 * 0.221 * re[mask] ** (-1.237)
+                elif regime == 'smooth':
+                    dlamb[mask] = dlamb_smooth_dre(re[mask])
+                elif regime == 'trans':
+                    dlamb[mask] = dlamb_trans_dre(re[mask], ks[mask], d[mask])
+        return dlamb
+
+    if re <= 2320:
+        return -64 / re ** 2
+    else:
+        if re * ks / d < 65:
+            if re <= 1e5:
+                return -0.25 * 0.3164 * re ** (-1.25)
+            elif re > 1e5 and re < 5e6:
+                return -0.237 * 0.221 * re ** (-1.237)
+            else:
+                return float(dlamb_smooth_dre(re))
+
+        elif re * ks / d > 1300:
+            return 0
+
+        else:
+            return float(dlamb_trans_dre(re, ks, d))
 
 
-def lamb_smooth(params, l):
-    re = params[0]
-    return 2 * math.log(re * math.sqrt(l), 10) - 0.8 - 1 / math.sqrt(l)
+def lamb_regimes(re, ks, d):
+    r"""
+    Returns boolean masks of the flow regimes for arrays of reynolds numbers.
 
+    Parameters
+    ----------
+    re : ndarray
+        Reynolds number re / 1.
 
-def dlamb_smooth_dl(params, l):
-    return 1 / (l * math.log(10)) + 1 / 2 * l ** (-1.5)
+    ks : ndarray
+        Pipe roughness ks / m.
 
+    d : ndarray
+        Pipe diameter/characteristic lenght d / m.
+
+    Returns
+    -------
+    regimes : dict
+        Masks for the regimes 'laminar', 'blasius', 'nikuradse', 'smooth', 'rough'
+        and 'trans' (transition zone).
+    """
+    laminar = re <= 2320
+    rks = re * ks / d
+    smooth = ~laminar & (rks < 65)
+    rough = ~laminar & (rks > 1300)
+    return {'laminar': laminar,
+            'blasius': smooth & (re <= 1e5),
+            'nikuradse': smooth & (re > 1e5) & (re < 5e6),
+            'smooth': smooth & (re >= 5e6),
+            'rough': rough,
+            'trans': ~laminar & ~smooth & ~rough}
+
+
+def lamb_smooth(re):
+    r"""
+    Calculates the darcy friction factor for hydraulically smooth pipes at high
+    reynolds numbers (Prandtl-Kármán equation).
+
+    .. math::
+        \frac{1}{\sqrt{\lambda}} = \frac{2}{\ln 10} \cdot \omega \left(
+        \ln re - 0.4 \cdot \ln 10 - \ln \frac{2}{\ln 10} \right)
+
+    :math:`\omega` is the Wright omega function.
+    """
+    c = 2 / math.log(10)
+    x = c * wrightomega(np.log(re) - 0.8 / c - math.log(c))
+    return 1 / x ** 2
+
+
+def dlamb_smooth_dre(re):
+    c = 2 / math.log(10)
+    x = 1 / np.sqrt(lamb_smooth(re))
+    dx = c * x / (re * (x + c))
+    return -2 * dx / x ** 3
+
+
+def lamb_trans(re, ks, d):
+    r"""
+    Calculates the darcy friction factor in the transition zone (Colebrook-White
+    equation).
+
+    .. math::
+        \frac{1}{\sqrt{\lambda}} = c \cdot \omega \left(\frac{b}{a \cdot c} -
+        \ln \left(a \cdot c\right)\right) - \frac{b}{a}\\
+        a = \frac{2.51}{re} \; b = 0.269 \cdot \frac{k_{s}}{d} \;
+        c = \frac{2}{\ln 10}
+
+    :math:`\omega` is the Wright omega function.
+    """
+    a = 2.51 / re
+    b = 0.269 * ks / d
+    c = 2 / math.log(10)
+    x = c * wrightomega(b / (a * c) - np.log(a * c)) - b / a
+    return 1 / x ** 2
 
-def lamb_trans(params, l):
-    re, ks, d = params[0], params[1], params[2]
-    return (2 * math.log(2.51 / (re * math.sqrt(l)) + ks / d * 0.269, 10) + 1 / math.sqrt(l))
 
+def dlamb_trans_dre(re, ks, d):
+    a = 2.51 / re
+    b = 0.269 * ks / d
+    c = 2 / math.log(10)
+    x = 1 / np.sqrt(lamb_trans(re, ks, d))
+    dx = c * 2.51 * x / (re ** 2 * (a * x + b) + c * 2.51 * re)
+    return -2 * dx / x ** 3
 
-def dlamb_trans_dl(params, l):
-    d = 0.001
-    return (lamb_trans(params, l + d) - lamb_trans(params, l - d)) / (2 * d)
+
+def darcy_dp(m, v, visc, D, L, ks):
+    r"""
+    Calculates the pressure drop of pipe flow from the darcy friction factor.
+
+    Parameters
+    ----------
+    m : float/ndarray
+        Mass flow m / (kg/s).
+
+    v : float/ndarray
+        Mean specific volume v / (m^3/kg).
+
+    visc : float/ndarray
+        Mean dynamic viscosity visc / (Pa s).
+
+    D : float/ndarray
+        Pipe diameter D / m.
+
+    L : float/ndarray
+        Pipe length L / m.
+
+    ks : float/ndarray
+        Pipe roughness ks / m.
+
+    Returns
+    -------
+    dp : float/ndarray
+        Pressure drop dp / Pa.
+
+        .. math::
+
+            Re = \frac{4 \cdot |\dot{m}|}{\pi \cdot D \cdot \eta}\\
+
+            \Delta p = \frac{8 \cdot |\dot{m}| \cdot \dot{m} \cdot v \cdot L
+            \cdot \lambda\left(Re, ks, D\right)}{\pi^2 \cdot D^5}
+
+    Note
+    ----
+    The pressure drop is calculated for scalar values (single pipe) or element
+    wise for arrays of values (pipe segments).
+    """
+    re = 4 * abs(m) / (math.pi * D * visc)
+    return 8 * abs(m) * m * v * L * lamb(re, ks, D) / (math.pi ** 2 * D ** 5)
+
+
+def ddarcy_dp_dm(m, v, visc, D, L, ks):
+    r"""
+    Calculates the derivative of the pressure drop from the darcy friction factor
+    to the mass flow.
+
+    Parameters
+    ----------
+    m, v, visc, D, L, ks : float/ndarray
+        See :func:`tespy.tools.helpers.darcy_dp`.
+
+    Returns
+    -------
+    deriv : float/ndarray
+        Derivative of the pressure drop to the mass flow.
+
+        .. math::
+
+            \frac{\partial \Delta p}{\partial \dot{m}} = \frac{8 \cdot
+            |\dot{m}| \cdot v \cdot L}{\pi^2 \cdot D^5} \cdot \left(2 \cdot
+            \lambda + Re \cdot \frac{\partial \lambda}{\partial Re}\right)
+    """
+    re = 4 * abs(m) / (math.pi * D * visc)
+    return (8 * abs(m) * v * L * (2 * lamb(re, ks, D) + re * dlamb_dre(re, ks, D)) /
+            (math.pi ** 2 * D ** 5))
+
+
+def hw_dp(m, v, D, L, ks):
+    r"""
+    Calculates the absolute pressure drop of pipe flow from the Hazen-Williams
+    equation.
+
+    Parameters
+    ----------
+    m : float/ndarray
+        Mass flow m / (kg/s).
+
+    v : float/ndarray
+        Mean specific volume v / (m^3/kg).
+
+    D : float/ndarray
+        Pipe diameter D / m.
+
+    L : float/ndarray
+        Pipe length L / m.
+
+    ks : float/ndarray
+        Hazen-Williams coefficient ks / 1.
+
+    Returns
+    -------
+    dp : float/ndarray
+        Absolute pressure drop dp / Pa.
+
+        .. math::
+
+            |\Delta p| = \frac{10.67 \cdot |\dot{m}| ^ {1.852} \cdot L}
+            {ks^{1.852} \cdot D^{4.871}} \cdot g \cdot v^{0.852}
+
+    Note
+    ----
+    Gravity g is set to :math:`9.81 \frac{m}{s^2}`
+    """
+    return (10.67 * abs(m) ** 1.852 * L / (ks ** 1.852 * D ** 4.871)) * (9.81 * v ** 0.852)
+
+
+def td_log(ttd_1, ttd_2):
+    r"""
+    Calculates the logarithmic temperature difference.
+
+    Parameters
+    ----------
+    ttd_1 : float/ndarray
+        Temperature difference at the first end ttd_1 / K.
+
+    ttd_2 : float/ndarray
+        Temperature difference at the second end ttd_2 / K.
+
+    Returns
+    -------
+    td_log : float/ndarray
+        Logarithmic temperature difference td_log / K, 0 for identical
+        temperature differences.
+
+        .. math::
+
+            \Delta T_{log} = \frac{ttd_1 - ttd_2}{\ln{\frac{ttd_1}{ttd_2}}}
+
+    Example
+    -------
+    >>> from tespy import hlp
+    >>> import numpy as np
+    >>> round(hlp.td_log(20, 10), 3)
+    14.427
+    >>> np.round(hlp.td_log(np.array([20, 10, 5]), np.array([10, 20, 5])), 3).tolist()
+    [14.427, 14.427, 0.0]
+    """
+    ttd_1, ttd_2 = np.broadcast_arrays(np.asarray(ttd_1, dtype=float), ttd_2)
+    td = np.zeros(ttd_1.shape)
+    diff = ttd_1 != ttd_2
+    td[diff] = (ttd_1[diff] - ttd_2[diff]) / np.log(ttd_1[diff] / ttd_2[diff])
+    if td.ndim == 0:
+        return float(td)
+    return td
@@ -13,6 +13,70 @@ from logging import handlers
 import sys
 import tespy
 
+# messages of the logging facade are discarded without any formatting in
+# quiet mode, see :func:`tespy.tools.logger.set_quiet`
+quiet = False
+
+
+def set_quiet(value=True):
+    r"""
+    Switches the quiet mode of the logging facade on or off.
+
+    Parameters
+    ----------
+    value : boolean
+        Discard all debug messages of the calculation? Default: True.
+
+    Example
+    -------
+    >>> from tespy.tools import logger
+    >>> logger.set_quiet()
+    >>> logger.debug_enabled()
+    False
+    >>> logger.set_quiet(False)
+    """
+    global quiet
+    quiet = value
+
+
+def debug_enabled():
+    r"""
+    Checks, if debug messages of the logging facade are processed.
+
+    Returns
+    -------
+    enabled : boolean
+        False in quiet mode or if the root logger's level is above DEBUG.
+    """
+    return not quiet and logging.root.isEnabledFor(logging.DEBUG)
+
+
+def debug(msg, *args):
+    r"""
+    Logs a message with level DEBUG, the message is created only if debug
+    messages are processed.
+
+    Parameters
+    ----------
+    msg : str or function
+        Message with %-style placeholders for the arguments or a function
+        returning the message.
+
+    args
+        Arguments for the placeholders of the message or for the function.
+
+    Example
+    -------
+    >>> from tespy.tools import logger
+    >>> logger.debug('Component %s has %s custom variables.', 'pipe', 1)
+    >>> logger.debug(lambda label: 'Message for ' + label + '.', 'pipe')
+    """
+    if not quiet and logging.root.isEnabledFor(logging.DEBUG):
+        if callable(msg):
+            logging.debug(msg(*args))
+        else:
+            logging.debug(msg, *args)
+
 
 def define_logging(logpath=None, logfile='tespy.log', file_format=None,
                    screen_format=None, file_datefmt=None, screen_datefmt=None,
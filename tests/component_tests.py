@@ -2,7 +2,7 @@
 
 from nose.tools import eq_
 
-from tespy import nwk, cmp, con, hlp
+from tespy import nwk, nwkr, cmp, con, hlp, subsys
 import numpy as np
 import shutil
 
@@ -34,6 +34,51 @@ class component_tests:
         self.nw.add_conns(c1, c2, c3)
         return c1, c2, c3
 
+    def test_fluid_propagation(self):
+        """
+        Test fluid propagation along a chain of components longer than the recursion limit.
+        """
+        num = 1100
+        valves = [cmp.valve('valve ' + str(i)) for i in range(num)]
+        conns = [con.connection(self.source, 'out1', valves[0], 'in1')]
+        for i in range(num - 1):
+            conns += [con.connection(valves[i], 'out1', valves[i + 1], 'in1')]
+        conns += [con.connection(valves[-1], 'out1', self.sink, 'in1')]
+        self.nw.add_conns(*conns)
+        fl = {'N2': 0.7556, 'O2': 0.2315, 'Ar': 0.0129, 'INCOMP::DowQ': 0, 'H2O': 0, 'NH3': 0, 'CO2': 0, 'CH4': 0}
+        conns[-1].set_attr(fluid=fl)
+        self.nw.solve('design', init_only=True)
+        eq_(0.7556, conns[0].fluid.val['N2'], 'Value of N2 mass fraction must be 0.7556, is ' + str(conns[0].fluid.val['N2']) + '.')
+
+    def test_num_eq(self):
+        """
+        Test structural equation count of components.
+        """
+        fl = {'N2': 0, 'O2': 0, 'Ar': 0, 'INCOMP::DowQ': 0, 'H2O': 1, 'NH3': 0, 'CO2': 0, 'CH4': 0}
+        pu = cmp.pump('pump', eta_s=0.8, pr=3)
+        sp = cmp.splitter('splitter')
+        va = cmp.valve('valve', pr=0.9)
+        pi = cmp.pipe('pipe', D=0.1, L=100, ks=1e-5, Q=0)
+        me = cmp.merge('merge')
+        he = cmp.heat_exchanger('heat exchanger', ttd_u=5, pr1=0.99, pr2=0.99)
+        tu = cmp.turbine('turbine', eta_s=0.9)
+        c1 = con.connection(self.source, 'out1', pu, 'in1', fluid=fl.copy(), m=10, p=1, T=20)
+        c2 = con.connection(pu, 'out1', sp, 'in1')
+        c3 = con.connection(sp, 'out1', va, 'in1')
+        c4 = con.connection(sp, 'out2', pi, 'in1')
+        c5 = con.connection(va, 'out1', me, 'in1')
+        c6 = con.connection(pi, 'out1', me, 'in2')
+        c7 = con.connection(me, 'out1', he, 'in2', fluid=fl.copy())
+        c8 = con.connection(he, 'out2', tu, 'in1')
+        c9 = con.connection(tu, 'out1', self.sink, 'in1')
+        c10 = con.connection(cmp.source('hot source'), 'out1', he, 'in1', fluid=fl.copy(), T=200, p=20)
+        c11 = con.connection(he, 'out1', cmp.sink('hot sink'), 'in1')
+        self.nw.add_conns(c1, c2, c3, c4, c5, c6, c7, c8, c9, c10, c11)
+        self.nw.solve('design', init_only=True)
+        for cp in self.nw.comps.index:
+            num_eq = len(cp.equations())
+            eq_(num_eq, cp.num_eq(), 'Number of equations of component ' + cp.label + ' must be ' + str(num_eq) + ', is ' + str(cp.num_eq()) + '.')
+
     def test_turbomachine(self):
         """
         Test component properties of turbomachines.
@@ -406,6 +451,111 @@ class component_tests:
         eq_(instance.hydro_group.is_set, False, 'Hydro group must no be set, if one parameter is missing!')
         eq_(instance.energy_group.is_set, False, 'Energy group must no be set, if one parameter is missing!')
 
+    def test_pipe_array(self):
+        """
+        Test component properties of pipe array.
+        """
+        instance = cmp.pipe_array('pipe array', num_seg=2)
+        sp = cmp.splitter('splitter', num_out=2)
+        me = cmp.merge('merge', num_in=2)
+        c1 = con.connection(self.source, 'out1', sp, 'in1')
+        c2 = con.connection(me, 'out1', self.sink, 'in1')
+        self.nw.add_conns(c1, c2)
+        for i in range(2):
+            self.nw.add_conns(
+                con.connection(sp, 'out' + str(i + 1), instance, 'in' + str(i + 1)),
+                con.connection(instance, 'out' + str(i + 1), me, 'in' + str(i + 1)))
+        fl = {'N2': 0, 'O2': 0, 'Ar': 0, 'INCOMP::DowQ': 0, 'H2O': 1, 'NH3': 0, 'CO2': 0, 'CH4': 0}
+        c1.set_attr(fluid=fl, m=5, p=10, T=100)
+        # trigger pipe array parameter groups (see heat exchanger simple)
+        instance.set_attr(hydro_group='HW', L=[100, 100], ks=100, Q=[-1e4, -2e4], Tamb=20)
+        instance.hydro_group.is_set = True
+        instance.kA_group.is_set = True
+        self.nw.solve('design', init_only=True)
+        eq_(instance.hydro_group.is_set, False, 'Hydro group must no be set, if one parameter is missing!')
+        eq_(instance.kA_group.is_set, False, 'kA group must no be set, if one parameter is missing!')
+        instance.set_attr(hydro_group='HW', D=[0.05, 0.1])
+        self.nw.solve('design')
+        # compare results to a single heat exchanger for the second segment
+        seg = instance.inl[1]
+        single = cmp.heat_exchanger_simple('heat exchanger')
+        c3 = con.connection(cmp.source('source 2'), 'out1', single, 'in1')
+        c4 = con.connection(single, 'out1', cmp.sink('sink 2'), 'in1')
+        self.nw.add_conns(c3, c4)
+        c3.set_attr(fluid={'N2': 0, 'O2': 0, 'Ar': 0, 'INCOMP::DowQ': 0, 'H2O': 1, 'NH3': 0, 'CO2': 0, 'CH4': 0},
+                    m=seg.m.val, p=10, T=100)
+        single.set_attr(hydro_group='HW', D=0.1, L=100, ks=100, Q=-2e4, Tamb=20)
+        self.nw.solve('design')
+        eq_(round(c4.p.val, 4), round(instance.outl[1].p.val, 4), 'Value of outlet pressure must be ' + str(c4.p.val) + ', is ' + str(instance.outl[1].p.val) + '.')
+        eq_(round(c4.T.val, 4), round(instance.outl[1].T.val, 4), 'Value of outlet temperature must be ' + str(c4.T.val) + ', is ' + str(instance.outl[1].T.val) + '.')
+        eq_(round(single.zeta.val, 0), round(instance.zeta.val[1], 0), 'Value of zeta must be ' + str(single.zeta.val) + ', is ' + str(instance.zeta.val[1]) + '.')
+        eq_(round(single.kA.val, 2), round(instance.kA.val[1], 2), 'Value of kA must be ' + str(single.kA.val) + ', is ' + str(instance.kA.val[1]) + '.')
+        eq_(round(single.Sirr.val, 4), round(instance.Sirr.val[1], 4), 'Value of entropy production must be ' + str(single.Sirr.val) + ', is ' + str(instance.Sirr.val[1]) + '.')
+
+        # darcy friction factor with laminar flow in the first and turbulent flow in the second segment
+        c1.set_attr(m=0.5)
+        instance.set_attr(hydro_group='DW', D=[0.04, 0.2], L=[1000, 1000], ks=[1e-5, 5e-4], Q=[-100, -1e3])
+        self.nw.solve('design')
+        re = [4 * c.m.val_SI / (np.pi * D * hlp.visc_mix_ph(c.to_flow())) for c, D in zip(instance.inl, instance.D.val)]
+        eq_(True, re[0] < 2320 and re[1] > 4000, 'Reynolds numbers must be in laminar and turbulent regime, are ' + str(re) + '.')
+        for i in range(2):
+            c3.set_attr(m=instance.inl[i].m.val, p=10, T=100)
+            single.set_attr(hydro_group='DW', D=instance.D.val[i], L=1000, ks=instance.ks.val[i], Q=instance.Q.val[i])
+            self.nw.solve('design')
+            eq_(round(c4.p.val_SI, 2), round(instance.outl[i].p.val_SI, 2), 'Value of outlet pressure must be ' + str(c4.p.val_SI) + ', is ' + str(instance.outl[i].p.val_SI) + '.')
+            eq_(round(c4.T.val, 4), round(instance.outl[i].T.val, 4), 'Value of outlet temperature must be ' + str(c4.T.val) + ', is ' + str(instance.outl[i].T.val) + '.')
+            eq_(round(single.zeta.val, 0), round(instance.zeta.val[i], 0), 'Value of zeta must be ' + str(single.zeta.val) + ', is ' + str(instance.zeta.val[i]) + '.')
+
+    def test_subsys_macro(self):
+        """
+        Test results of a subsystem macro against the expanded subsystem.
+        """
+        fl = {'N2': 0, 'O2': 0, 'Ar': 0, 'INCOMP::DowQ': 0, 'H2O': 1, 'NH3': 0, 'CO2': 0, 'CH4': 0}
+        results = []
+        for compiled in [False, True]:
+            nw = nwk.network(['INCOMP::DowQ', 'H2O', 'NH3', 'N2', 'O2', 'Ar', 'CO2', 'CH4'],
+                             T_unit='C', p_unit='bar', v_unit='m3 / s')
+            ph = subsys.ph_desup_cond('preheater', ttd=5, pr1_desup=0.99, pr2_desup=0.99,
+                                      pr1_cond=0.99, pr2_cond=0.99)
+            if compiled:
+                inlet = outlet = ph.compile()
+            else:
+                inlet, outlet = ph.inlet, ph.outlet
+                nw.add_subsys(ph)
+            c1 = con.connection(cmp.source('steam'), 'out1', inlet, 'in1')
+            c2 = con.connection(outlet, 'out1', cmp.sink('condensate'), 'in1')
+            c3 = con.connection(cmp.source('feed water inlet'), 'out1', inlet, 'in2')
+            c4 = con.connection(outlet, 'out2', cmp.sink('feed water outlet'), 'in1')
+            nw.add_conns(c1, c2, c3, c4)
+            c1.set_attr(fluid=fl.copy(), p=10, T=250)
+            c2.set_attr(p=1)
+            c3.set_attr(fluid=fl.copy(), m=10, p=60, T=80)
+            nw.solve('design')
+            results += [[c1.m.val_SI, c4.h.val_SI, ph.condenser.Q.val, ph.conns[1].h.val_SI]]
+
+        msg = 'Value of steam mass flow must be ' + str(results[0][0]) + ', is ' + str(results[1][0]) + '.'
+        eq_(round(results[0][0], 4), round(results[1][0], 4), msg)
+        msg = 'Value of feed water outlet enthalpy must be ' + str(results[0][1]) + ', is ' + str(results[1][1]) + '.'
+        eq_(round(results[0][1], 0), round(results[1][1], 0), msg)
+        msg = 'Value of heat transfer at condenser must be ' + str(results[0][2]) + ', is ' + str(results[1][2]) + '.'
+        eq_(round(results[0][2], 0), round(results[1][2], 0), msg)
+        msg = 'Value of enthalpy at desuperheater outlet must be ' + str(results[0][3]) + ', is ' + str(results[1][3]) + '.'
+        eq_(round(results[0][3], 0), round(results[1][3], 0), msg)
+
+        # evaluating the macro's equations must not change internal variables
+        ph.conns[1].h.val_SI *= 1.01
+        h = ph.conns[1].h.val_SI
+        res = [inlet.equations(), inlet.equations()]
+        msg = 'Value of enthalpy at desuperheater outlet must be ' + str(h) + ', is ' + str(ph.conns[1].h.val_SI) + '.'
+        eq_(h, ph.conns[1].h.val_SI, msg)
+        msg = 'Residuals of repeated calls must be ' + str(res[0]) + ', are ' + str(res[1]) + '.'
+        eq_(res[0], res[1], msg)
+
+        # the row partition is stored for the current pattern of nonzero partial derivatives
+        A = inlet.solve_subsystem()[1]
+        msg = 'The macro must store the row partition for the current pattern of nonzero partial derivatives.'
+        eq_(True, np.array_equal(inlet.partition[0], A != 0), msg)
+
     def test_heat_ex(self):
         """
         Test component properties of heat exchanger.
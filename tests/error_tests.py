@@ -159,6 +159,18 @@ def test_network_print_level():
     nwk.network(['INCOMP::DowQ']).set_printoptions(print_level='error')
 
 
+@raises(TypeError)
+def test_network_result_sink_type():
+    nwk.network(['water']).add_result_sinks('results.npy')
+
+
+@raises(hlp.TESPyNetworkError)
+def test_network_result_sink_closed():
+    sink = nwk.result_sink('results.npy')
+    sink.close()
+    sink.push(nwk.network(['water']))
+
+
 @raises(hlp.TESPyNetworkError)
 def test_network_instanciation_no_fluids():
     nwk.network([]).initialise()
@@ -198,6 +210,32 @@ def test_network_connection_error_target():
     nw.check_network()
 
 
+def test_network_connection_deleted_duplicate():
+    nw = nwk.network(['water'])
+    source = cmp.source('source')
+    sink1 = cmp.sink('sink1')
+    sink2 = cmp.sink('sink2')
+    a = con.connection(source, 'out1', sink1, 'in1')
+    b = con.connection(source, 'out1', sink2, 'in1')
+    nw.add_conns(a, b)
+    nw.del_conns(b)
+    nw.add_conns(con.connection(cmp.source('source2'), 'out1', sink2, 'in1'))
+    nw.check_network()
+    eq_(source.outl, [a], 'Outlets of the source must be [' + str(a) + '], not ' + str(source.outl) + '.')
+
+
+def test_network_connection_deleted_first_duplicate():
+    nw = nwk.network(['water'])
+    source = cmp.source('source')
+    a = con.connection(source, 'out1', cmp.sink('sink1'), 'in1')
+    b = con.connection(source, 'out1', cmp.sink('sink2'), 'in1')
+    nw.add_conns(a, b)
+    nw.del_conns(a)
+    nw.check_network()
+    eq_(list(nw.conns.index), [b], 'Connections of the network must be [' + str(b) + '], not ' + str(list(nw.conns.index)) + '.')
+    eq_(source.outl, [b], 'Outlets of the source must be [' + str(b) + '], not ' + str(source.outl) + '.')
+
+
 @raises(hlp.TESPyNetworkError)
 def test_network_network_consistency_inlets():
     nw = nwk.network(['water'])
@@ -228,6 +266,16 @@ def test_network_component_labels():
     nw.check_network()
 
 
+@raises(hlp.TESPyNetworkError)
+def test_network_resolve():
+    nw = nwk.network(['water'])
+    source = cmp.source('source')
+    sink = cmp.sink('sink')
+    a = con.connection(source, 'out1', sink, 'in1')
+    nw.add_conns(a)
+    nw.resolve()
+
+
 @raises(hlp.TESPyNetworkError)
 def test_network_offdesign_path():
     nw = nwk.network(['water'])
@@ -250,6 +298,18 @@ def test_network_design_file():
     nw.solve('offdesign', design_file='tmp')
 
 
+@raises(ValueError)
+def test_network_save_format():
+    nw = nwk.network(['water'])
+    nw.save('tmp', fmt='hdf')
+
+
+@raises(ValueError)
+def test_network_save_structure_path():
+    nw = nwk.network(['water'])
+    nw.save('tmp', structure_path='tmp_structure')
+
+
 @raises(ValueError)
 def test_network_mode():
     nw = nwk.network(['water'])
@@ -377,6 +437,23 @@ def test_tespy_fluid_alias_value():
 # components
 
 
+@raises(hlp.TESPyComponentError)
+def test_pipe_array_partial_nan():
+    cmp.pipe_array('pipe array', num_seg=2, Q=[-1e4, float('nan')])
+
+
+@raises(hlp.TESPyComponentError)
+def test_pipe_array_number_of_values():
+    cmp.pipe_array('pipe array', num_seg=2, D=[0.05, 0.1, 0.1])
+
+
+@raises(hlp.TESPyComponentError)
+def test_pipe_array_number_of_segments():
+    pa = cmp.pipe_array('pipe array', D=[0.05, 0.1, 0.1])
+    pa.set_attr(num_seg=2)
+    pa.segment_array(pa.D.val, 'D')
+
+
 class combustion_chamber_error_tests:
 
     def setup(self):
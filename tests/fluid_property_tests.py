@@ -84,3 +84,31 @@ class fluid_property_tests:
                     else:
                         eq_(d_rel < 0.025, True, self.errormsg + 'Value is ' + str(round(d_rel, 4)) +
                             ' for inputs p=' + str(round(p, 0)) + ', T=' + str(round(T, 0)) + ' for function ' + name + '.')
+
+    def test_h_range(self):
+        """
+        Test tabulated enthalpy limits of a pure fluid against fluid property calls.
+        """
+        hlp.memorise.add_fluids(['H2O'])
+        Tmin, Tmax = hlp.memorise.vrange['H2O'][2:]
+        for p in np.linspace(0.1, 150, 11) * 1e5:
+            hmin, hmax = hlp.memorise.h_range(p, 'H2O')
+            for h, h_ref in [(hmin, hlp.h_pT(p, Tmin * 1.01, 'H2O')), (hmax, hlp.h_pT(p, Tmax * 0.99, 'H2O'))]:
+                d_rel = abs((h - h_ref) / h_ref)
+                eq_(d_rel < 1e-3, True, 'Relative deviation of tabulated enthalpy limit is too high: Value is ' + str(round(d_rel, 6)) +
+                    ' for input p=' + str(round(p, 0)) + '.')
+
+    def test_h_range_saturation(self):
+        """
+        Test tabulated minimum enthalpy of pure fluids at the saturation pressure of the minimum temperature.
+        """
+        for fluid in ['H2O', 'NH3', 'CO2']:
+            hlp.memorise.add_fluids([fluid])
+            T = hlp.memorise.vrange[fluid][2] * 1.01
+            p_sat = CP('P', 'T', T, 'Q', 0, fluid)
+            for p in p_sat * np.array([0.9, 0.99, 1.01, 1.1]):
+                hmin = hlp.memorise.h_range(p, fluid)[0]
+                h_ref = hlp.h_pT(p, T, fluid)
+                d_rel = abs((hmin - h_ref) / h_ref)
+                eq_(d_rel < 1e-3, True, 'Relative deviation of tabulated minimum enthalpy of ' + fluid + ' is too high: Value is ' +
+                    str(round(d_rel, 6)) + ' for input p=' + str(round(p, 0)) + '.')
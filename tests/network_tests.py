@@ -0,0 +1,335 @@
+# -*- coding: utf-8
+
+from nose.tools import eq_
+
+import tespy
+from tespy import nwk, nwkr, cmp, con, hlp
+import numpy as np
+import pandas as pd
+import subprocess
+import shutil
+import pickle
+import sys
+import os
+
+
+class network_tests:
+
+    def setup(self):
+        """
+        Set up network with a pump between a source and a sink.
+        """
+        self.nw = nwk.network(['INCOMP::DowQ', 'H2O', 'NH3', 'N2', 'O2', 'Ar', 'CO2', 'CH4'],
+                              T_unit='C', p_unit='bar', v_unit='m3 / s')
+        self.nw.set_printoptions(print_level='none')
+        self.pump = cmp.pump('pump', eta_s=0.8)
+        self.c1 = con.connection(cmp.source('source'), 'out1', self.pump, 'in1', fluid=self.fluid(), p=1, T=20)
+        self.c2 = con.connection(self.pump, 'out1', cmp.sink('sink'), 'in1', p=5)
+        self.nw.add_conns(self.c1, self.c2)
+
+    def fluid(self, H2O=1, N2=0, O2=0):
+        """
+        Returns the fluid vector with the mass fractions of water, nitrogen and oxygen.
+        """
+        return {'N2': N2, 'O2': O2, 'Ar': 0, 'INCOMP::DowQ': 0, 'H2O': H2O, 'NH3': 0, 'CO2': 0, 'CH4': 0}
+
+    def test_snapshot(self):
+        """
+        Test offdesign calculation with design case from snapshot.
+        """
+        self.pump.set_attr(design=['eta_s'], offdesign=['eta_s_char'])
+        self.c1.set_attr(m=10)
+        self.nw.solve('design')
+        self.nw.save('tmp_snapshot')
+        snap = self.nw.snapshot()
+        self.c1.set_attr(m=8)
+        self.nw.solve('offdesign', design_path='tmp_snapshot')
+        eta_s = self.pump.eta_s.val
+        self.nw.solve('offdesign', design=snap, init=snap)
+        eq_(round(eta_s, 6), round(self.pump.eta_s.val, 6), 'Value of isentropic efficiency must be ' + str(eta_s) + ', is ' + str(self.pump.eta_s.val) + '.')
+        shutil.rmtree('./tmp_snapshot', ignore_errors=True)
+
+    def test_resolve_design(self):
+        """
+        Test repeated design calculations with resolve against full calculations.
+        """
+        self.c1.set_attr(m=10)
+        self.nw.solve('design')
+        params = [(8, 5), (9, 6), (9, 4), (10, 3)]
+        P = []
+        for m, p in params:
+            self.c1.set_attr(m=m)
+            self.c2.set_attr(p=p)
+            self.nw.resolve()
+            P += [round(self.pump.P.val, 4)]
+        for (m, p), P_resolve in zip(params, P):
+            self.c1.set_attr(m=m)
+            self.c2.set_attr(p=p)
+            self.nw.solve('design')
+            eq_(round(self.pump.P.val, 4), P_resolve, 'Value of power must be ' + str(self.pump.P.val) + ', is ' + str(P_resolve) + '.')
+
+    def test_resolve_offdesign(self):
+        """
+        Test repeated offdesign calculations with resolve against full calculations.
+        """
+        nw = nwk.network(['water'], T_unit='C', p_unit='bar')
+        nw.set_printoptions(print_level='none')
+        pi = cmp.heat_exchanger_simple('pipe', pr=0.99, Q=-1e5, Tamb=20, design=['Q'], offdesign=['kA'],
+                                       kA_char=hlp.dc_cc(method='HE_HOT', param='m'))
+        c1 = con.connection(cmp.source('source'), 'out1', pi, 'in1', fluid={'water': 1}, m=1, p=5, T=90)
+        c2 = con.connection(pi, 'out1', cmp.sink('sink'), 'in1')
+        nw.add_conns(c1, c2)
+        nw.solve('design')
+        nw.save('tmp_resolve')
+        nw.solve('offdesign', design_path='tmp_resolve')
+        params = [(0.9, 90), (0.8, 90), (0.7, 80), (0.6, 80)]
+        Q = []
+        for m, T in params:
+            c1.set_attr(m=m, T=T)
+            nw.resolve()
+            Q += [round(pi.Q.val, 4)]
+        for (m, T), Q_resolve in zip(params, Q):
+            c1.set_attr(m=m, T=T)
+            nw.solve('offdesign', design_path='tmp_resolve')
+            eq_(round(pi.Q.val, 4), Q_resolve, 'Value of heat flow must be ' + str(pi.Q.val) + ', is ' + str(Q_resolve) + '.')
+        shutil.rmtree('./tmp_resolve', ignore_errors=True)
+
+    def test_pickle(self):
+        """
+        Test calculation of a network unpickled in a new process.
+        """
+        self.c1.set_attr(m=10)
+        self.nw.solve('design')
+        P = self.pump.P.val
+        script = ('import pickle, sys\n'
+                  'nw = pickle.loads(sys.stdin.buffer.read())\n'
+                  'nw.set_printoptions(print_level=\'none\')\n'
+                  'nw.solve(\'design\')\n'
+                  'print([cp.P.val for cp in nw.comps.index if cp.label == \'pump\'][0])\n')
+        env = os.environ.copy()
+        path = os.path.dirname(os.path.dirname(os.path.abspath(tespy.__file__)))
+        env['PYTHONPATH'] = path + os.pathsep + env.get('PYTHONPATH', '')
+        res = subprocess.run([sys.executable, '-c', script], input=pickle.dumps(self.nw),
+                             stdout=subprocess.PIPE, env=env, check=True)
+        P_new = float(res.stdout.decode().split()[-1])
+        eq_(round(P, 2), round(P_new, 2), 'Value of power must be ' + str(P) + ', is ' + str(P_new) + '.')
+
+    def test_result_sink(self):
+        """
+        Test appending the results of several calculations to a result sink.
+        """
+        results = nwk.result_sink('tmp_results.npy', chunk=2)
+        self.nw.add_result_sinks(results)
+        P = []
+        water = [1, 0.995, 0.99]
+        for m, x in zip([8, 9, 10], water):
+            self.c1.set_attr(m=m, fluid=self.fluid(H2O=x, N2=1 - x))
+            self.nw.solve('design')
+            P += [self.pump.P.val]
+        res = nwkr.load_results('tmp_results.npy')
+        eq_(2, len(res), 'Number of results in file must be 2 before closing the result sink, is ' + str(len(res)) + '.')
+        del res
+        results.close()
+        res = nwkr.load_results('tmp_results.npy')
+        eq_(P, res.imp_comps['pump']['P'].tolist(), 'Values of power must be ' + str(P) + ', are ' + str(res.imp_comps['pump']['P'].tolist()) + '.')
+        for c in ['pump:in1', 'sink:in1']:
+            val = [round(x, 6) for x in res.imp_conns[c]['H2O']]
+            eq_(water, val, 'Mass fractions of water at ' + c + ' must be ' + str(water) + ', are ' + str(val) + '.')
+        del res
+        # the values of a column are stored contiguously within the blocks
+        data = np.load('tmp_results.npy', mmap_mode='r')
+        eq_(2, len(data), 'Number of blocks must be 2, is ' + str(len(data)) + '.')
+        eq_([2, 1], data['rows'].tolist(), 'Number of rows per block must be [2, 1], is ' + str(data['rows'].tolist()) + '.')
+        eq_((2, ), data.dtype['comps/pump/P'].shape, 'Each block must hold 2 values per column.')
+        del data
+        os.remove('tmp_results.npy')
+
+    def test_result_sink_interval(self):
+        """
+        Test flushing and removing a result sink.
+        """
+        results = nwk.result_sink('tmp_interval.npy', chunk=5, interval=2)
+        self.nw.add_result_sinks(results)
+        num = []
+        for m in [8, 9, 10]:
+            self.c1.set_attr(m=m)
+            self.nw.solve('design')
+            res = nwkr.load_results('tmp_interval.npy')
+            num += [len(res)]
+            del res
+        eq_([0, 2, 2], num, 'Number of results in file must be [0, 2, 2], is ' + str(num) + '.')
+        results.close()
+        self.nw.del_result_sinks(results)
+        self.nw.solve('design')
+        res = nwkr.load_results('tmp_interval.npy')
+        eq_(3, len(res), 'Number of results must be 3 after removing the result sink, is ' + str(len(res)) + '.')
+        del res
+        os.remove('tmp_interval.npy')
+
+    def test_jacobian_template(self):
+        """
+        Test jacobian matrix with constant component derivatives against full calculation.
+        """
+        v = cmp.valve('valve', pr=0.8)
+        pipe = cmp.pipe('pipe', pr=0.95, Q=-1e4)
+        self.nw.del_conns(self.c2)
+        self.pump.set_attr(pr=5)
+        self.c2 = con.connection(self.pump, 'out1', v, 'in1')
+        c3 = con.connection(v, 'out1', pipe, 'in1')
+        c4 = con.connection(pipe, 'out1', cmp.sink('sink'), 'in1')
+        self.nw.add_conns(self.c2, c3, c4)
+        self.c1.set_attr(m=10)
+        self.nw.solve('design')
+        self.nw.mat_deriv = self.nw.mat_deriv_const.copy()
+        self.nw.solve_components()
+        mat_deriv = self.nw.mat_deriv_const.copy()
+        for cp in self.nw.comp_eq.keys():
+            cp.equations()
+            self.nw.place_comp_deriv(mat_deriv, cp, cp.derivatives(), slice(0, cp.num_eq()))
+        num_eq = self.nw.num_comp_eq
+        eq_(True, np.allclose(mat_deriv[:num_eq], self.nw.mat_deriv[:num_eq]), 'Component rows of the jacobian matrix must match the full calculation.')
+
+    def test_load_results(self):
+        """
+        Test read-only access to the results of a result sink.
+        """
+        power = con.bus('power')
+        power.add_comps({'c': self.pump})
+        self.nw.add_busses(power)
+        results = nwk.result_sink('tmp_load_results.npy')
+        self.nw.add_result_sinks(results)
+        for m in [8, 9, 10]:
+            self.c1.set_attr(m=m)
+            self.nw.solve('design')
+        results.close()
+        res = nwkr.load_results('tmp_load_results.npy')
+        eq_(3, len(res), 'Number of results must be 3, is ' + str(len(res)) + '.')
+        eq_([8.0, 9.0, 10.0], res.imp_conns['pump:in1']['m'].tolist(), 'Values of mass flow must be [8, 9, 10].')
+        eq_(res.imp_comps['pump']['P'].tolist(), res.imp_busses['power']['P'].tolist(), 'Values of bus power must equal the power of the pump.')
+        del res
+        os.remove('tmp_load_results.npy')
+
+    def test_fluid_compositions(self):
+        """
+        Test saving and loading of the fluid compositions of connections.
+        """
+        c3 = con.connection(cmp.source('source 2'), 'out1', cmp.sink('sink 2'), 'in1',
+                            fluid=self.fluid(H2O=0, N2=0.77, O2=0.23), m=1, p=1, T=20)
+        self.nw.add_conns(c3)
+        self.c1.set_attr(m=10)
+        self.nw.solve('design')
+        self.nw.save('tmp_fluid')
+        df = pd.read_csv('tmp_fluid/conn.csv', sep=';', decimal='.')
+        eq_(False, 'N2' in df.columns, 'The connection data must not hold one column per fluid.')
+        compositions = pd.read_csv('tmp_fluid/conn_fluid.csv', sep=';', decimal='.')
+        num = len(compositions['composition'].unique())
+        eq_(2, num, 'The composition table must hold two compositions, holds ' + str(num) + '.')
+        eq_(3, len(compositions), 'The composition table must hold the nonzero mass fractions only, holds ' + str(compositions.values.tolist()) + '.')
+        nw = nwkr.load_nwk('tmp_fluid')
+        nw.set_printoptions(print_level='none')
+        c = nw.imp_conns['pump:in1']
+        eq_(self.fluid(), c.fluid.val, 'Fluid vector of the imported connection must be ' + str(self.fluid()) + ', is ' + str(c.fluid.val) + '.')
+        eq_(True, all(c.fluid.val_set.values()), 'All mass fractions of the inlet must be specified.')
+        eq_(False, nw.imp_conns['sink:in1'].fluid.val_set['H2O'], 'The mass fraction of water of the outlet must not be specified.')
+        air = self.fluid(H2O=0, N2=0.77, O2=0.23)
+        c = nw.imp_conns['sink 2:in1']
+        eq_(air, c.fluid.val, 'Fluid vector of the imported connection must be ' + str(air) + ', is ' + str(c.fluid.val) + '.')
+        c3.set_attr(fluid=self.fluid(H2O=0, N2=0.8, O2=0.2))
+        self.nw.solve('design', init_path='tmp_fluid')
+        eq_(0.8, c3.fluid.val['N2'], 'Specified mass fraction of nitrogen must not be overwritten by the init_path, is ' + str(c3.fluid.val['N2']) + '.')
+        shutil.rmtree('./tmp_fluid', ignore_errors=True)
+
+    def test_save_async(self):
+        """
+        Test saving networks in the background.
+        """
+        futures = []
+        for m in [8, 9, 10]:
+            self.c1.set_attr(m=m)
+            self.nw.solve('design')
+            futures += [self.nw.save_async('tmp_async')]
+            futures += [self.nw.save_async('tmp_async_' + str(m), fmt='npz')]
+        self.c1.set_attr(m=11)
+        self.nw.solve('design')
+        futures[-1].result()
+        eq_(True, all(f.done() for f in futures), 'All saves must be done after the last save is done.')
+        for m in [8, 9, 10]:
+            nw = nwkr.load_nwk('tmp_async_' + str(m))
+            val = nw.imp_conns['pump:in1'].m.val
+            eq_(m, val, 'Mass flow of the saved network must be ' + str(m) + ', is ' + str(val) + '.')
+            shutil.rmtree('./tmp_async_' + str(m), ignore_errors=True)
+        val = nwkr.load_nwk('tmp_async').imp_conns['pump:in1'].m.val
+        eq_(10, val, 'Mass flow of the last save must be 10, is ' + str(val) + '.')
+        shutil.rmtree('./tmp_async', ignore_errors=True)
+
+    def test_shared_structure(self):
+        """
+        Test saving many states of a network with a shared structure.
+        """
+        self.pump.set_attr(design=['eta_s'], offdesign=['eta_s_char'])
+        for m in [8, 9, 10]:
+            self.c1.set_attr(m=m)
+            self.nw.solve('design')
+            self.nw.save('tmp_shared/m_' + str(m), fmt='npz', structure_path='tmp_shared/structure')
+        num = len(os.listdir('tmp_shared/structure'))
+        eq_(1, num, 'Number of structure files must be 1, is ' + str(num) + '.')
+        self.nw.save('tmp_shared/full', fmt='npz')
+        size_full = os.path.getsize('tmp_shared/full/network.npz')
+        size = os.path.getsize('tmp_shared/m_9/network.npz')
+        eq_(True, size < size_full, 'A state file (' + str(size) + ' bytes) must be smaller than the full file (' + str(size_full) + ' bytes).')
+        full = hlp.load_npz('tmp_shared/full/network.npz')
+        state = hlp.load_npz('tmp_shared/m_10/network.npz')
+        for name, df in full.items():
+            eq_(df.columns.tolist(), state[name].columns.tolist(), 'Columns of table ' + name + ' must be identical.')
+        nw = nwkr.load_nwk('tmp_shared/m_9')
+        nw.set_printoptions(print_level='none')
+        nw.imp_conns['pump:in1'].set_attr(m=10)
+        nw.solve('offdesign', design_path='tmp_shared/m_9')
+        eta_s = round(nw.imp_comps['pump'].eta_s.val, 3)
+        eq_(True, eta_s < 0.8, 'Isentropic efficiency must be lower than the design value (0.8), is ' + str(eta_s) + '.')
+        shutil.rmtree('./tmp_shared', ignore_errors=True)
+
+    def test_shared_structure_reload(self):
+        """
+        Test sharing the structure of a network with the reloaded network.
+        """
+        self.c1.set_attr(m=10)
+        self.c2.set_attr(p=np.nan)
+        self.c2.set_attr(p=con.ref(self.c1, 5, 0))
+        self.nw.solve('design')
+        self.nw.save('tmp_reload/original', fmt='npz', structure_path='tmp_reload/structure')
+        nw = nwkr.load_nwk('tmp_reload/original')
+        nw.set_printoptions(print_level='none')
+        nw.solve('design')
+        nw.save('tmp_reload/reloaded', fmt='npz', structure_path='tmp_reload/structure')
+        num = len(os.listdir('tmp_reload/structure'))
+        eq_(1, num, 'Number of structure files must be 1, is ' + str(num) + '.')
+        p = round(nw.imp_conns['sink:in1'].p.val, 4)
+        eq_(5.0, p, 'Value of referenced pressure must be 5.0, is ' + str(p) + '.')
+        shutil.rmtree('./tmp_reload', ignore_errors=True)
+
+    def test_characteristic_ids(self):
+        """
+        Test saving and loading of equal characteristic lines.
+        """
+        nw = nwk.network(['water'], T_unit='C', p_unit='bar')
+        nw.set_printoptions(print_level='none')
+        pi1 = cmp.pipe('pipe 1', pr=1, Q=-1e4)
+        pi2 = cmp.pipe('pipe 2', pr=1, Q=-1e4)
+        c1 = con.connection(cmp.source('source'), 'out1', pi1, 'in1', fluid={'water': 1}, m=1, p=5, T=80)
+        c2 = con.connection(pi1, 'out1', pi2, 'in1')
+        c3 = con.connection(pi2, 'out1', cmp.sink('sink'), 'in1')
+        nw.add_conns(c1, c2, c3)
+        nw.solve('design')
+        nw.save('tmp_char')
+        chars = pd.read_csv('./tmp_char/comps/char.csv', sep=';')
+        eq_(len(chars), len(chars['id'].unique()), 'Characteristic lines must be saved once per identifier.')
+        pipes = pd.read_csv('./tmp_char/comps/pipe.csv', sep=';', index_col=0)
+        eq_(pipes.loc['pipe 1', 'kA_char'], pipes.loc['pipe 2', 'kA_char'], 'Equal characteristic lines must have the same identifier.')
+        nw = nwkr.load_nwk('tmp_char')
+        eq_(True, nw.imp_comps['pipe 1'].kA_char.x is nw.imp_comps['pipe 2'].kA_char.x, 'Imported components must share the values of equal characteristic lines.')
+        nw.check_network()
+        nw.save('tmp_char')
+        pipes = pd.read_csv('./tmp_char/comps/pipe.csv', sep=';', index_col=0)
+        eq_(chars['id'][0], pipes.loc['pipe 1', 'kA_char'], 'Characteristic lines of imported components must be saved before initialisation.')
+        shutil.rmtree('./tmp_char', ignore_errors=True)